@@ -0,0 +1,75 @@
+"""access pattern indexes
+
+Revision ID: 3c7a9e1f4b62
+Revises: 8f1d2c6b7a90
+Create Date: 2026-10-17 16:40:51.772013
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c7a9e1f4b62"
+down_revision = "8f1d2c6b7a90"
+branch_labels = None
+depends_on = None
+
+# (created_at, id) atende o ORDER BY created_at DESC, id DESC das listagens
+# e o "latest" do currículo com uma varredura reversa do índice.
+CREATED_AT_TABLES = ("blog_posts", "art", "story_script", "curriculum_files")
+ACTIVE_ADMINS_PREDICATE = "is_admin IS true AND is_active IS true"
+
+
+def _has_index(inspector: sa.Inspector, table: str, index: str) -> bool:
+    return index in {item["name"] for item in inspector.get_indexes(table)}
+
+
+def _missing(inspector: sa.Inspector, table: str, index: str) -> bool:
+    # Sem a tabela, metadata.create_all já a cria com o índice.
+    return inspector.has_table(table) and not _has_index(inspector, table, index)
+
+
+def _present(inspector: sa.Inspector, table: str, index: str) -> bool:
+    return inspector.has_table(table) and _has_index(inspector, table, index)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # CONCURRENTLY não bloqueia escritas, mas não roda dentro de transação.
+    with op.get_context().autocommit_block():
+        for table in CREATED_AT_TABLES:
+            if _missing(inspector, table, f"{table}_created_at_idx"):
+                op.create_index(
+                    op.f(f"{table}_created_at_idx"),
+                    table,
+                    ["created_at", "id"],
+                    postgresql_concurrently=True,
+                )
+
+        if _missing(inspector, "users", "users_active_admins_idx"):
+            op.create_index(
+                op.f("users_active_admins_idx"),
+                "users",
+                ["id"],
+                postgresql_where=sa.text(ACTIVE_ADMINS_PREDICATE),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    with op.get_context().autocommit_block():
+        if _present(inspector, "users", "users_active_admins_idx"):
+            op.drop_index(
+                op.f("users_active_admins_idx"),
+                table_name="users",
+                postgresql_concurrently=True,
+            )
+        for table in CREATED_AT_TABLES:
+            if _present(inspector, table, f"{table}_created_at_idx"):
+                op.drop_index(
+                    op.f(f"{table}_created_at_idx"),
+                    table_name=table,
+                    postgresql_concurrently=True,
+                )
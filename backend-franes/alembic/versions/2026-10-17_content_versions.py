@@ -0,0 +1,70 @@
+"""content versions and updated_at
+
+Revision ID: 7e4b1a9c3d25
+Revises: d5e8b2a4c190
+Create Date: 2026-10-17 19:12:48.301772
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7e4b1a9c3d25"
+down_revision = "d5e8b2a4c190"
+branch_labels = None
+depends_on = None
+
+TABLES_WITHOUT_UPDATED_AT = ("blog_posts", "art", "story_script")
+
+
+def _has_column(inspector: sa.Inspector, table: str, column: str) -> bool:
+    return any(item["name"] == column for item in inspector.get_columns(table))
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in TABLES_WITHOUT_UPDATED_AT:
+        if not inspector.has_table(table) or _has_column(
+            inspector, table, "updated_at"
+        ):
+            continue
+        op.add_column(
+            table,
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+        )
+        # Linhas antigas nunca editadas: a melhor estimativa é a criação
+        op.execute(f"UPDATE {table} SET updated_at = created_at")
+
+    if not inspector.has_table("content_versions"):
+        op.create_table(
+            "content_versions",
+            sa.Column("table_name", sa.String(length=63), nullable=False),
+            sa.Column("version", sa.BigInteger(), nullable=False),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+            sa.PrimaryKeyConstraint(
+                "table_name", name=op.f("content_versions_pkey")
+            ),
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("content_versions"):
+        op.drop_table("content_versions")
+
+    for table in TABLES_WITHOUT_UPDATED_AT:
+        if inspector.has_table(table) and _has_column(
+            inspector, table, "updated_at"
+        ):
+            op.drop_column(table, "updated_at")
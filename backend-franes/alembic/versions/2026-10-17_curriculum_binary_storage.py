@@ -0,0 +1,169 @@
+"""curriculum binary storage
+
+Revision ID: c62d918695db
+Revises: e82aaa7ce510
+Create Date: 2026-10-17 09:12:41.218734
+
+"""
+
+import base64
+import hashlib
+import uuid
+
+import sqlalchemy as sa
+
+from alembic import op
+from src.config import settings
+from src.curriculum.storage import CHUNK_SIZE, LocalFileStorage
+
+# revision identifiers, used by Alembic.
+revision = "c62d918695db"
+down_revision = "e82aaa7ce510"
+branch_labels = None
+depends_on = None
+
+curriculum_files = sa.table(
+    "curriculum_files",
+    sa.column("id", sa.Integer),
+    sa.column("file_name", sa.String),
+    sa.column("csv_content", sa.Text),
+    sa.column("content_type", sa.String),
+    sa.column("size_bytes", sa.BigInteger),
+    sa.column("content_sha256", sa.String),
+    sa.column("storage_backend", sa.String),
+    sa.column("storage_key", sa.String),
+)
+curriculum_file_chunks = sa.table(
+    "curriculum_file_chunks",
+    sa.column("file_key", sa.String),
+    sa.column("seq", sa.Integer),
+    sa.column("data", sa.LargeBinary),
+)
+
+STORAGE_COLUMNS = (
+    "content_type",
+    "size_bytes",
+    "content_sha256",
+    "storage_backend",
+    "storage_key",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "curriculum_file_chunks",
+        sa.Column("file_key", sa.String(length=64), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "file_key", "seq", name=op.f("curriculum_file_chunks_pkey")
+        ),
+    )
+
+    connection = op.get_bind()
+    if not sa.inspect(connection).has_table("curriculum_files"):
+        # Bancos criados só por migrações não têm a tabela; metadata.create_all
+        # já a cria no formato novo.
+        return
+
+    op.add_column(
+        "curriculum_files", sa.Column("content_type", sa.String(100), nullable=True)
+    )
+    op.add_column(
+        "curriculum_files", sa.Column("size_bytes", sa.BigInteger(), nullable=True)
+    )
+    op.add_column(
+        "curriculum_files", sa.Column("content_sha256", sa.String(64), nullable=True)
+    )
+    op.add_column(
+        "curriculum_files", sa.Column("storage_backend", sa.String(20), nullable=True)
+    )
+    op.add_column(
+        "curriculum_files", sa.Column("storage_key", sa.String(64), nullable=True)
+    )
+
+    rows = connection.execute(
+        sa.select(
+            curriculum_files.c.id,
+            curriculum_files.c.file_name,
+            curriculum_files.c.csv_content,
+        )
+    ).all()
+    for row_id, file_name, stored_content in rows:
+        if file_name.lower().endswith(".pdf"):
+            data = base64.b64decode(stored_content or "")
+            content_type = "application/pdf"
+        else:
+            data = (stored_content or "").encode("utf-8")
+            content_type = "text/csv; charset=utf-8"
+
+        key = uuid.uuid4().hex
+        for seq, offset in enumerate(range(0, len(data), CHUNK_SIZE)):
+            connection.execute(
+                curriculum_file_chunks.insert().values(
+                    file_key=key, seq=seq, data=data[offset : offset + CHUNK_SIZE]
+                )
+            )
+
+        connection.execute(
+            curriculum_files.update()
+            .where(curriculum_files.c.id == row_id)
+            .values(
+                content_type=content_type,
+                size_bytes=len(data),
+                content_sha256=hashlib.sha256(data).hexdigest(),
+                storage_backend="database",
+                storage_key=key,
+            )
+        )
+
+    for column in STORAGE_COLUMNS:
+        op.alter_column("curriculum_files", column, nullable=False)
+    op.drop_column("curriculum_files", "csv_content")
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if sa.inspect(connection).has_table("curriculum_files"):
+        op.add_column(
+            "curriculum_files", sa.Column("csv_content", sa.Text(), nullable=True)
+        )
+
+        rows = connection.execute(
+            sa.select(
+                curriculum_files.c.id,
+                curriculum_files.c.file_name,
+                curriculum_files.c.storage_backend,
+                curriculum_files.c.storage_key,
+            )
+        ).all()
+        for row_id, file_name, backend, key in rows:
+            data = _read_stored_file(connection, backend, key)
+            if file_name.lower().endswith(".pdf"):
+                stored_content = base64.b64encode(data).decode("ascii")
+            else:
+                stored_content = data.decode("utf-8")
+            connection.execute(
+                curriculum_files.update()
+                .where(curriculum_files.c.id == row_id)
+                .values(csv_content=stored_content)
+            )
+
+        op.alter_column("curriculum_files", "csv_content", nullable=False)
+        for column in reversed(STORAGE_COLUMNS):
+            op.drop_column("curriculum_files", column)
+
+    op.drop_table("curriculum_file_chunks")
+
+
+def _read_stored_file(connection: sa.Connection, backend: str, key: str) -> bytes:
+    if backend == LocalFileStorage.name:
+        storage = LocalFileStorage(settings.CURRICULUM_STORAGE_PATH)
+        return storage.path_for(key).read_bytes()
+
+    chunks = connection.execute(
+        sa.select(curriculum_file_chunks.c.data)
+        .where(curriculum_file_chunks.c.file_key == key)
+        .order_by(curriculum_file_chunks.c.seq)
+    ).scalars()
+    return b"".join(chunks)
@@ -0,0 +1,54 @@
+"""curriculum latest pointer
+
+Revision ID: d5e8b2a4c190
+Revises: 3c7a9e1f4b62
+Create Date: 2026-10-17 18:05:33.120845
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d5e8b2a4c190"
+down_revision = "3c7a9e1f4b62"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("curriculum_files") or inspector.has_table(
+        "curriculum_latest"
+    ):
+        # Sem curriculum_files, metadata.create_all cria as duas tabelas.
+        return
+
+    op.create_table(
+        "curriculum_latest",
+        sa.Column("id", sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column("curriculum_id", sa.Integer(), nullable=True),
+        sa.CheckConstraint("id = 1", name=op.f("curriculum_latest_singleton_check")),
+        sa.ForeignKeyConstraint(
+            ["curriculum_id"],
+            ["curriculum_files.id"],
+            name=op.f("curriculum_latest_curriculum_id_fkey"),
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("curriculum_latest_pkey")),
+    )
+    op.execute(
+        """
+        INSERT INTO curriculum_latest (id, curriculum_id)
+        SELECT 1, (
+            SELECT id FROM curriculum_files
+            ORDER BY created_at DESC, id DESC
+            LIMIT 1
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("curriculum_latest"):
+        op.drop_table("curriculum_latest")
@@ -0,0 +1,66 @@
+"""search vectors
+
+Revision ID: 8f1d2c6b7a90
+Revises: 5b0e7f3c2a41
+Create Date: 2026-10-17 14:22:08.301127
+
+"""
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f1d2c6b7a90"
+down_revision = "5b0e7f3c2a41"
+branch_labels = None
+depends_on = None
+
+# Cópia congelada de src.search.columns.search_vector_expression; a migração
+# não deve mudar se o modelo mudar depois.
+SEARCH_VECTORS = {
+    "blog_posts": (
+        "setweight(to_tsvector('portuguese', coalesce(title, '')), 'A')"
+        " || setweight(to_tsvector('portuguese', coalesce(content, '')), 'B')"
+    ),
+    "story_script": (
+        "setweight(to_tsvector('portuguese', coalesce(title, '')), 'A')"
+        " || setweight(to_tsvector('portuguese', coalesce(sub_title, '')), 'B')"
+        " || setweight(to_tsvector('portuguese', coalesce(content, '')), 'C')"
+    ),
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, expression in SEARCH_VECTORS.items():
+        if not inspector.has_table(table):
+            # Sem a tabela, metadata.create_all já a cria com a coluna.
+            continue
+
+        # Coluna STORED: o ADD COLUMN reescreve a tabela e preenche o vetor
+        # das linhas existentes.
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+            ),
+        )
+        op.create_index(
+            op.f(f"{table}_search_vector_idx"),
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in SEARCH_VECTORS:
+        if not inspector.has_table(table):
+            continue
+
+        op.drop_index(op.f(f"{table}_search_vector_idx"), table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,70 @@
+"""row versions and content deletions for sync
+
+Revision ID: a2f6c8d1e3b7
+Revises: 7e4b1a9c3d25
+Create Date: 2026-10-17 20:41:09.554213
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a2f6c8d1e3b7"
+down_revision = "7e4b1a9c3d25"
+branch_labels = None
+depends_on = None
+
+SYNCED_TABLES = ("blog_posts", "art", "story_script", "curriculum_files")
+
+
+def _has_column(inspector: sa.Inspector, table: str, column: str) -> bool:
+    return any(item["name"] == column for item in inspector.get_columns(table))
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in SYNCED_TABLES:
+        if not inspector.has_table(table) or _has_column(inspector, table, "version"):
+            continue
+        # Linhas existentes ficam na versão 0 e saem na primeira sincronização
+        op.add_column(
+            table,
+            sa.Column(
+                "version", sa.BigInteger(), server_default="0", nullable=False
+            ),
+        )
+        op.create_index(op.f(f"{table}_version_idx"), table, ["version", "id"])
+
+    if not inspector.has_table("content_deletions"):
+        op.create_table(
+            "content_deletions",
+            sa.Column("table_name", sa.String(length=63), nullable=False),
+            sa.Column("row_id", sa.Integer(), nullable=False),
+            sa.Column("version", sa.BigInteger(), nullable=False),
+            sa.Column(
+                "deleted_at",
+                sa.DateTime(),
+                server_default=sa.text("now()"),
+                nullable=False,
+            ),
+            sa.PrimaryKeyConstraint(
+                "table_name", "row_id", name=op.f("content_deletions_pkey")
+            ),
+        )
+        op.create_index(
+            op.f("content_deletions_table_name_version_idx"),
+            "content_deletions",
+            ["table_name", "version"],
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table("content_deletions"):
+        op.drop_table("content_deletions")
+
+    for table in SYNCED_TABLES:
+        if inspector.has_table(table) and _has_column(inspector, table, "version"):
+            op.drop_index(op.f(f"{table}_version_idx"), table_name=table)
+            op.drop_column(table, "version")
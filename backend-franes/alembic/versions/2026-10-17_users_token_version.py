@@ -0,0 +1,36 @@
+"""users token version
+
+Revision ID: 5b0e7f3c2a41
+Revises: c62d918695db
+Create Date: 2026-10-17 11:03:27.514902
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b0e7f3c2a41"
+down_revision = "c62d918695db"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("users"):
+        # Sem a tabela, metadata.create_all já a cria com a coluna.
+        return
+
+    op.add_column(
+        "users",
+        sa.Column(
+            "token_version", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table("users"):
+        return
+
+    op.drop_column("users", "token_version")
@@ -0,0 +1,423 @@
+"""Cenários de carga HTTP contra uma instância rodando de ``src.main:app``.
+
+Uso::
+
+    just up && just migrate && just run
+    python -m benchmarks.load --username admin --password ... --json carga.json
+
+Os cenários são ``public_reads`` (listas e detalhes de todos os routers),
+``admin_writes`` (criar, atualizar e apagar um post autenticado) e
+``downloads`` (currículo inteiro, com Range e revalidação 304). Antes de
+rodar, o script cria os próprios dados pela API e os apaga no fim. A
+sequência de requisições sai de ``--seed``, então duas execuções com os
+mesmos argumentos fazem exatamente as mesmas chamadas. O relatório traz
+latência (p50/p90/p99), vazão e a média das fases do ``Server-Timing`` por
+rota; compare dois com ``python -m benchmarks.report``.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator
+
+import httpx
+
+from benchmarks import report
+
+SCENARIOS = ("public_reads", "admin_writes", "downloads")
+PDF_SIZE = 256 * 1024
+# Termos presentes nos dados criados por seed()
+SEARCH_TERMS = ("lorem ipsum", "roteiro", "era uma vez", "carga -arte")
+
+
+@dataclass
+class Fixtures:
+    token: str
+    blog_ids: list[int] = field(default_factory=list)
+    art_ids: list[int] = field(default_factory=list)
+    story_ids: list[int] = field(default_factory=list)
+    curriculum_ids: list[int] = field(default_factory=list)
+
+    @property
+    def auth(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class Sample:
+    label: str
+    status: int
+    latency: float
+    timings: dict[str, float]
+    ok: bool
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.samples: list[Sample] = []
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        label: str,
+        method: str,
+        url: str,
+        expected: int = 200,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        await response.aread()
+        latency = time.perf_counter() - started
+        self.samples.append(
+            Sample(
+                label=label,
+                status=response.status_code,
+                latency=latency,
+                timings=parse_server_timing(response.headers.get("server-timing")),
+                ok=response.status_code == expected,
+            )
+        )
+        return response
+
+
+Unit = Callable[[httpx.AsyncClient, Recorder], Awaitable[None]]
+
+
+def parse_server_timing(header: str | None) -> dict[str, float]:
+    timings = {}
+    for entry in (header or "").split(","):
+        name, _, duration = entry.strip().partition(";dur=")
+        if name and duration:
+            timings[name] = float(duration)
+    return timings
+
+
+def _get(label: str, url: str, expected: int = 200, **kwargs: Any) -> Unit:
+    async def unit(client: httpx.AsyncClient, recorder: Recorder) -> None:
+        await recorder.request(client, label, "GET", url, expected, **kwargs)
+
+    return unit
+
+
+def public_reads(fixtures: Fixtures, rng: random.Random) -> Iterator[Unit]:
+    choices: list[tuple[int, Callable[[], Unit]]] = [
+        (4, lambda: _get("GET /blog/", "/blog/")),
+        (2, lambda: _get("GET /blog/?fields=summary", "/blog/?fields=summary")),
+        (4, lambda: _get("GET /blog/{id}", f"/blog/{rng.choice(fixtures.blog_ids)}")),
+        (2, lambda: _get("GET /art/", "/art/")),
+        (2, lambda: _get("GET /art/{id}", f"/art/{rng.choice(fixtures.art_ids)}")),
+        (2, lambda: _get("GET /story-script/", "/story-script/")),
+        (
+            2,
+            lambda: _get(
+                "GET /story-script/{id}",
+                f"/story-script/{rng.choice(fixtures.story_ids)}",
+            ),
+        ),
+        (1, lambda: _get("GET /curriculum/", "/curriculum/")),
+        (1, lambda: _get("GET /curriculum/latest", "/curriculum/latest")),
+        (
+            2,
+            lambda: _get(
+                "GET /search/", "/search/", params={"q": rng.choice(SEARCH_TERMS)}
+            ),
+        ),
+    ]
+    weights = [weight for weight, _ in choices]
+    while True:
+        yield rng.choices(choices, weights)[0][1]()
+
+
+def admin_writes(fixtures: Fixtures, rng: random.Random) -> Iterator[Unit]:
+    while True:
+        reading_time = rng.randint(1, 20)
+        content = "Texto de carga. " * rng.randint(50, 500)
+
+        async def unit(
+            client: httpx.AsyncClient,
+            recorder: Recorder,
+            reading_time: int = reading_time,
+            content: str = content,
+        ) -> None:
+            payload = {
+                "title": "Carga",
+                "reading_time": reading_time,
+                "content": content,
+            }
+            created = await recorder.request(
+                client,
+                "POST /blog/",
+                "POST",
+                "/blog/",
+                201,
+                json=payload,
+                headers=fixtures.auth,
+            )
+            if created.status_code != 201:
+                return
+            url = f"/blog/{created.json()['id']}"
+            await recorder.request(
+                client,
+                "PUT /blog/{id}",
+                "PUT",
+                url,
+                json={**payload, "title": "Carga editada"},
+                headers=fixtures.auth,
+            )
+            await recorder.request(
+                client, "DELETE /blog/{id}", "DELETE", url, 204, headers=fixtures.auth
+            )
+
+        yield unit
+
+
+def downloads(fixtures: Fixtures, rng: random.Random) -> Iterator[Unit]:
+    etags: dict[int, str] = {}
+
+    async def revalidate(
+        client: httpx.AsyncClient, recorder: Recorder, curriculum_id: int
+    ) -> None:
+        url = f"/curriculum/{curriculum_id}/download"
+        if curriculum_id not in etags:
+            response = await client.get(url)
+            etags[curriculum_id] = response.headers.get("etag", '""')
+        await recorder.request(
+            client,
+            "GET /curriculum/{id}/download (304)",
+            "GET",
+            url,
+            304,
+            headers={"If-None-Match": etags[curriculum_id]},
+        )
+
+    while True:
+        curriculum_id = rng.choice(fixtures.curriculum_ids)
+        url = f"/curriculum/{curriculum_id}/download"
+        start = rng.randrange(0, PDF_SIZE - 65536)
+        kind = rng.choices(("full", "range", "revalidate", "latest"), (3, 3, 3, 1))[0]
+        if kind == "full":
+            yield _get("GET /curriculum/{id}/download", url)
+        elif kind == "range":
+            yield _get(
+                "GET /curriculum/{id}/download (206)",
+                url,
+                206,
+                headers={"Range": f"bytes={start}-{start + 65535}"},
+            )
+        elif kind == "revalidate":
+
+            async def unit(
+                client: httpx.AsyncClient,
+                recorder: Recorder,
+                curriculum_id: int = curriculum_id,
+            ) -> None:
+                await revalidate(client, recorder, curriculum_id)
+
+            yield unit
+        else:
+            yield _get("GET /curriculum/latest/download", "/curriculum/latest/download")
+
+
+GENERATORS: dict[str, Callable[[Fixtures, random.Random], Iterator[Unit]]] = {
+    "public_reads": public_reads,
+    "admin_writes": admin_writes,
+    "downloads": downloads,
+}
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> str:
+    response = await client.post(
+        "/admin/auth/token", data={"username": username, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def seed(client: httpx.AsyncClient, token: str, seed: int) -> Fixtures:
+    """Cria os dados usados pelos cenários, sempre os mesmos para um ``seed``."""
+    rng = random.Random(seed)
+    fixtures = Fixtures(token=token)
+
+    async def create(path: str, payload: dict[str, Any]) -> int:
+        response = await client.post(path, json=payload, headers=fixtures.auth)
+        response.raise_for_status()
+        return response.json()["id"]
+
+    for index in range(20):
+        fixtures.blog_ids.append(
+            await create(
+                "/blog/",
+                {
+                    "title": f"Post de carga {index}",
+                    "reading_time": rng.randint(1, 20),
+                    "content": "Lorem ipsum dolor sit amet. " * rng.randint(50, 400),
+                },
+            )
+        )
+    for index in range(10):
+        fixtures.art_ids.append(
+            await create(
+                "/art/",
+                {"title": f"Arte de carga {index}", "description": "Descrição " * 20},
+            )
+        )
+        fixtures.story_ids.append(
+            await create(
+                "/story-script/",
+                {
+                    "title": f"Roteiro de carga {index}",
+                    "sub_title": "Subtítulo",
+                    "author_note": "Nota do autor " * 5,
+                    "content": "Era uma vez. " * rng.randint(100, 800),
+                    "author_final_comment": "Fim.",
+                },
+            )
+        )
+
+    response = await client.post(
+        "/curriculum/upload",
+        data={"title": "Currículo de carga"},
+        files={"file": ("carga.pdf", rng.randbytes(PDF_SIZE), "application/pdf")},
+        headers=fixtures.auth,
+    )
+    response.raise_for_status()
+    fixtures.curriculum_ids.append(response.json()["id"])
+    return fixtures
+
+
+async def cleanup(client: httpx.AsyncClient, fixtures: Fixtures) -> None:
+    resources = (
+        ("/blog", fixtures.blog_ids),
+        ("/art", fixtures.art_ids),
+        ("/story-script", fixtures.story_ids),
+        ("/curriculum", fixtures.curriculum_ids),
+    )
+    for prefix, ids in resources:
+        for resource_id in ids:
+            await client.delete(f"{prefix}/{resource_id}", headers=fixtures.auth)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    units: Iterator[Unit],
+    total: int,
+    concurrency: int,
+) -> tuple[Recorder, float]:
+    """Executa ``total`` unidades com ``concurrency`` clientes simultâneos."""
+    recorder = Recorder()
+    pending = iter([next(units) for _ in range(total)])
+
+    async def worker() -> None:
+        for unit in pending:
+            await unit(client, recorder)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return recorder, time.perf_counter() - started
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict[str, Any]:
+    by_label: dict[str, list[Sample]] = defaultdict(list)
+    for sample in recorder.samples:
+        by_label[sample.label].append(sample)
+
+    routes = {}
+    for label, samples in sorted(by_label.items()):
+        phases: dict[str, list[float]] = defaultdict(list)
+        for sample in samples:
+            for name, duration in sample.timings.items():
+                phases[name].append(duration)
+        routes[label] = {
+            **report.latency_summary((s.latency for s in samples), elapsed),
+            "errors": sum(not s.ok for s in samples),
+            "server_timing_ms": {
+                name: round(sum(values) / len(values), 3)
+                for name, values in sorted(phases.items())
+            },
+        }
+
+    return {
+        "all": {
+            **report.latency_summary((s.latency for s in recorder.samples), elapsed),
+            "errors": sum(not s.ok for s in recorder.samples),
+        },
+        "routes": routes,
+    }
+
+
+async def run(
+    client: httpx.AsyncClient,
+    fixtures: Fixtures,
+    scenarios: list[str],
+    total: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+) -> dict[str, Any]:
+    results = {}
+    for name in scenarios:
+        units = GENERATORS[name](fixtures, random.Random(f"{seed}:{name}"))
+        await run_scenario(client, units, warmup, concurrency)
+        recorder, elapsed = await run_scenario(client, units, total, concurrency)
+        results[name] = summarize(recorder, elapsed)
+        print(
+            f"{name:14} {results[name]['all']['rps']:9.1f} req/s"
+            f"  p50 {results[name]['all']['p50_ms']:8.2f} ms"
+            f"  p99 {results[name]['all']['p99_ms']:8.2f} ms"
+            f"  errors {results[name]['all']['errors']}"
+        )
+    return results
+
+
+async def main_async(args: argparse.Namespace) -> dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=30
+    ) as client:
+        token = await login(client, args.username, args.password)
+        fixtures = await seed(client, token, args.seed)
+        try:
+            return await run(
+                client,
+                fixtures,
+                args.scenario or list(SCENARIOS),
+                args.requests,
+                args.concurrency,
+                args.warmup,
+                args.seed,
+            )
+        finally:
+            await cleanup(client, fixtures)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username", default=os.environ.get("BENCH_ADMIN_USERNAME"))
+    parser.add_argument("--password", default=os.environ.get("BENCH_ADMIN_PASSWORD"))
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="output", help="grava o relatório JSON")
+    args = parser.parse_args()
+    if not args.username or not args.password:
+        parser.error("informe --username/--password ou BENCH_ADMIN_USERNAME/PASSWORD")
+
+    results = asyncio.run(main_async(args))
+    if args.output:
+        settings = {
+            key: getattr(args, key)
+            for key in ("base_url", "requests", "concurrency", "warmup", "seed")
+        }
+        report.write({"meta": report.meta(**settings), "load": results}, args.output)
+
+
+if __name__ == "__main__":
+    main()
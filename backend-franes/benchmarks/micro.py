@@ -0,0 +1,131 @@
+"""Microbenchmarks em processo das partes quentes das rotas.
+
+Uso: ``python -m benchmarks.micro [--repeat 7] [--number 2000] [--json saida.json]``
+
+Mede, sem rede nem banco, a montagem das respostas de currículo
+(``serialize_curriculum`` e ``build_file_response`` com 200, 304 e 206), a
+validação dos schemas de entrada e saída e o caminho ``trusted_rows``. Cada
+caso roda ``--repeat`` rodadas de ``--number`` chamadas; o relatório traz a
+mediana e o mínimo por chamada, em microssegundos.
+"""
+
+import argparse
+import statistics
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from fastapi import Request
+from pydantic import TypeAdapter
+
+from benchmarks import report
+from benchmarks.serialization import make_rows
+from src.blog.schemas import BlogPostCreate
+from src.curriculum.download import build_file_response
+from src.curriculum.router import serialize_curriculum
+from src.curriculum.schema import Curriculum, CurriculumCreate
+from src.responses import trusted_rows
+from src.story_script.schemas import StoryScript, StoryScriptCreate
+
+
+def make_curriculum(count: int) -> list[dict]:
+    updated_at = datetime(2025, 10, 16, 12, 30, 5)
+    return [
+        {
+            "id": index,
+            "title": f"Currículo {index}",
+            "description": "Versão para vagas de backend",
+            "file_name": f"cv-{index}.pdf",
+            "content_type": "application/pdf",
+            "size_bytes": 250_000,
+            "content_sha256": f"{index:064x}",
+            "storage_backend": "local",
+            "storage_key": f"{index:064x}",
+            "created_at": updated_at - timedelta(days=index),
+            "updated_at": updated_at - timedelta(days=index),
+        }
+        for index in range(count)
+    ]
+
+
+def _request(**headers: str) -> Request:
+    raw = [(name.encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    entry = make_curriculum(1)[0]
+    entries = make_curriculum(50)
+    serialized = [serialize_curriculum(row) for row in entries]
+    stories = make_rows(50)
+    etag = f'"{entry["content_sha256"]}"'
+    full = _request()
+    not_modified = _request(**{"if-none-match": etag})
+    partial = _request(range="bytes=0-65535")
+    curriculum_list = TypeAdapter(List[Curriculum])
+    story_list = TypeAdapter(List[StoryScript])
+    blog_payload = {"title": "Post", "reading_time": 5, "content": "Texto " * 500}
+    story_payload = {key: stories[0][key] for key in StoryScriptCreate.model_fields}
+    curriculum_payload = {
+        "title": "CV",
+        "file_name": "cv.csv",
+        "csv_content": "nome,cargo\n" * 200,
+    }
+
+    return {
+        "serialize_curriculum": lambda: serialize_curriculum(entry),
+        "build_file_response/200": lambda: build_file_response(entry, full),
+        "build_file_response/304": lambda: build_file_response(entry, not_modified),
+        "build_file_response/206": lambda: build_file_response(entry, partial),
+        "validate/BlogPostCreate": lambda: BlogPostCreate.model_validate(blog_payload),
+        "validate/StoryScriptCreate": lambda: StoryScriptCreate.model_validate(
+            story_payload
+        ),
+        "validate/CurriculumCreate": lambda: CurriculumCreate.model_validate(
+            curriculum_payload
+        ),
+        "validate/List[Curriculum] x50": lambda: curriculum_list.dump_json(
+            curriculum_list.validate_python(serialized)
+        ),
+        "validate/List[StoryScript] x50": lambda: story_list.dump_json(
+            story_list.validate_python(stories)
+        ),
+        "trusted_rows/Curriculum x50": lambda: trusted_rows(Curriculum, serialized),
+        "trusted_rows/StoryScript x50": lambda: trusted_rows(StoryScript, stories),
+    }
+
+
+def run(repeat: int, number: int) -> dict[str, dict[str, float]]:
+    results = {}
+    for name, case in cases().items():
+        rounds = timeit.Timer(case).repeat(repeat=repeat, number=number)
+        per_call = [elapsed / number * 1_000_000 for elapsed in rounds]
+        results[name] = {
+            "median_us": round(statistics.median(per_call), 3),
+            "min_us": round(min(per_call), 3),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--json", dest="output", help="grava o relatório JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.number)
+    for name, result in results.items():
+        print(f"{name:32} {result['median_us']:10.2f} us  (min {result['min_us']:.2f})")
+    if args.output:
+        report.write(
+            {
+                "meta": report.meta(repeat=args.repeat, number=args.number),
+                "micro": results,
+            },
+            args.output,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Relatórios JSON dos benchmarks e comparação entre duas execuções.
+
+Uso: ``python -m benchmarks.report antes.json depois.json [--threshold 10]``
+
+Cada relatório tem ``meta`` (commit, Python, máquina) e seções com métricas
+numéricas por caso. A comparação casa as métricas pelo caminho
+``seção/caso/métrica`` e aponta as que pioraram mais que ``--threshold`` %;
+o código de saída é 1 quando há alguma regressão.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+# Métricas em que um valor maior é melhor; as demais são tempos.
+HIGHER_IS_BETTER = {"rps"}
+# Métricas comparadas; contagens e metadados ficam fora.
+COMPARED = {"p50_ms", "p90_ms", "p99_ms", "mean_ms", "rps", "median_us", "min_us"}
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def meta(**extra: Any) -> dict[str, Any]:
+    return {
+        "commit": _git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        **extra,
+    }
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Percentil por interpolação linear sobre ``values`` já ordenados."""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def latency_summary(latencies: Iterable[float], elapsed: float) -> dict[str, Any]:
+    """Resumo de latências em segundos; ``elapsed`` é a duração do cenário."""
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(ordered, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+    }
+
+
+def write(report: dict[str, Any], path: str | None) -> None:
+    """Grava o relatório em ``path`` ou o imprime quando não há destino."""
+    content = json.dumps(report, indent=2, sort_keys=True)
+    if path is None:
+        print(content)
+        return
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(content + "\n")
+
+
+def flatten(report: dict[str, Any]) -> dict[str, float]:
+    metrics: dict[str, float] = {}
+
+    def visit(prefix: str, node: Any) -> None:
+        if not isinstance(node, dict):
+            return
+        for key, value in node.items():
+            path = f"{prefix}/{key}" if prefix else key
+            if key in COMPARED and isinstance(value, (int, float)):
+                metrics[path] = value
+            else:
+                visit(path, value)
+
+    for section, content in report.items():
+        if section != "meta":
+            visit(section, content)
+    return metrics
+
+
+def compare(
+    before: dict[str, Any], after: dict[str, Any], threshold: float
+) -> list[tuple[str, float, float, float, bool]]:
+    """Linhas ``(métrica, antes, depois, variação %, regressão)`` em comum."""
+    old, new = flatten(before), flatten(after)
+    rows = []
+    for path in sorted(old.keys() & new.keys()):
+        if old[path] == 0:
+            continue
+        change = (new[path] - old[path]) / old[path] * 100
+        worse = -change if path.rsplit("/", 1)[-1] in HIGHER_IS_BETTER else change
+        rows.append((path, old[path], new[path], change, worse > threshold))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with open(args.before, encoding="utf-8") as file:
+        before = json.load(file)
+    with open(args.after, encoding="utf-8") as file:
+        after = json.load(file)
+
+    rows = compare(before, after, args.threshold)
+    print(f"{before['meta'].get('commit')} -> {after['meta'].get('commit')}")
+    for path, old, new, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{path:60} {old:12.3f} {new:12.3f} {change:+8.1f}%{flag}")
+
+    if any(regressed for *_, regressed in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
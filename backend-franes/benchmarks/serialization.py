@@ -0,0 +1,83 @@
+"""Compara o custo de CPU por resposta do caminho validado e do confiável.
+
+Uso: ``python -m benchmarks.serialization [--rows 100] [--repeat 200]``
+
+O caminho "validated" reproduz o que o FastAPI faz com um ``response_model``
+(valida as linhas, gera o dict JSON e codifica com ``json``); o "trusted" é o
+de ``src.responses.trusted_rows`` (projeta os campos e codifica com orjson).
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+import orjson
+from pydantic import TypeAdapter
+
+from src.responses import project
+from src.story_script.schemas import StoryScript
+
+
+def make_rows(count: int) -> list[dict]:
+    created_at = datetime(2025, 10, 16, 12, 30, 5)
+    return [
+        {
+            "id": index,
+            "title": f"Roteiro {index}",
+            "sub_title": "Um subtítulo qualquer",
+            "author_note": "Nota do autor " * 5,
+            "content": "Lorem ipsum dolor sit amet. " * 200,
+            "author_final_comment": "Comentário final " * 10,
+            "cover_image": {
+                "public_id": f"franes/cover-{index}",
+                "url": f"https://res.cloudinary.com/franes/image/upload/{index}.jpg",
+                "secure_url": f"https://res.cloudinary.com/franes/{index}.jpg",
+                "format": "jpg",
+                "width": 1200,
+                "height": 800,
+            },
+            "created_at": created_at - timedelta(minutes=index),
+            "updated_at": created_at - timedelta(minutes=index),
+        }
+        for index in range(count)
+    ]
+
+
+def measure(render: Callable[[], bytes], repeat: int) -> float:
+    """Tempo médio de CPU, em milissegundos, por chamada de ``render``."""
+    render()
+    started = time.process_time()
+    for _ in range(repeat):
+        render()
+    return (time.process_time() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    adapter = TypeAdapter(List[StoryScript])
+
+    def validated() -> bytes:
+        content = adapter.dump_python(adapter.validate_python(rows), mode="json")
+        return json.dumps(content, ensure_ascii=False).encode("utf-8")
+
+    def trusted() -> bytes:
+        return orjson.dumps([project(StoryScript, row) for row in rows])
+
+    validated_ms = measure(validated, args.repeat)
+    trusted_ms = measure(trusted, args.repeat)
+    print(f"{args.rows} story scripts per response, {args.repeat} runs")
+    print(f"validated: {validated_ms:8.3f} ms CPU/response")
+    print(f"trusted:   {trusted_ms:8.3f} ms CPU/response")
+    saved_ms = validated_ms - trusted_ms
+    print(f"saved:     {saved_ms:8.3f} ms ({validated_ms / trusted_ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
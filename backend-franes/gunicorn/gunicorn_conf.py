@@ -1,4 +1,5 @@
 import multiprocessing
+import os
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,6 +33,12 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_config: str = "/src/logging_production.ini"
 
+    # Mesmo env do app (src/config.py); o orçamento é o quanto do
+    # max_connections do Postgres este deploy pode usar.
+    database_pool_size: int = 16
+    database_pool_max_overflow: int = 10
+    database_connection_budget: int | None = None
+
     @property
     def computed_bind(self) -> str:
         return self.bind if self.bind else f"{self.host}:{self.port}"
@@ -54,6 +61,44 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
+# Os workers herdam este env e compartilham as gerações do cache por ele,
+# para que a escrita de um worker invalide o cache de todos (src/cache.py).
+os.environ.setdefault(
+    "CACHE_GENERATIONS_PATH", f"/dev/shm/franes-cache-{os.getpid()}"
+)
+
+
+def on_starting(_):
+    # Arquivos de métricas de uma execução anterior somariam séries de
+    # workers que não existem mais.
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory and os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name.endswith(".db"):
+                os.unlink(os.path.join(directory, name))
+
+
+def when_ready(server):
+    budget = settings.database_connection_budget
+    per_worker = settings.database_pool_size + settings.database_pool_max_overflow
+    if budget and workers * per_worker > budget:
+        server.log.warning(
+            "%s workers x %s connections (pool_size + max_overflow) = %s, "
+            "above DATABASE_CONNECTION_BUDGET=%s",
+            workers,
+            per_worker,
+            workers * per_worker,
+            budget,
+        )
+
+
+def on_exit(_):
+    try:
+        os.unlink(os.environ["CACHE_GENERATIONS_PATH"])
+    except OSError:
+        pass
+
+
 # Gunicorn config variables
 loglevel = settings.log_level
 workers = settings.computed_web_concurrency
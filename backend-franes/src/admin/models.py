@@ -2,10 +2,12 @@ from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
+    Index,
     Integer,
     String,
     Table,
     UniqueConstraint,
+    and_,
     func,
 )
 
@@ -19,6 +21,8 @@ users = Table(
     Column("password_hash", String(255), nullable=False),
     Column("is_active", Boolean, nullable=False, server_default="true"),
     Column("is_admin", Boolean, nullable=False, server_default="false"),
+    # Incrementado quando senha, status ou permissão mudam; invalida tokens antigos
+    Column("token_version", Integer, nullable=False, server_default="0"),
     Column("created_at", DateTime, nullable=False, server_default=func.now()),
     Column(
         "updated_at",
@@ -29,3 +33,11 @@ users = Table(
     ),
     UniqueConstraint("username", name="users_username_key"),
 )
+
+# Só os admins ativos, contados antes de rebaixar/apagar um admin. O
+# predicado repete o das consultas (IS true) para o planner poder usá-lo.
+Index(
+    "users_active_admins_idx",
+    users.c.id,
+    postgresql_where=and_(users.c.is_admin.is_(True), users.c.is_active.is_(True)),
+)
@@ -1,23 +1,28 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.exc import IntegrityError
 
 from src.admin.models import users
 from src.admin.schemas import User, UserCreate, UserUpdate
-from src.auth.dependencies import get_current_admin_user
-from src.auth.utils import hash_password
-from src.database import execute, fetch_all, fetch_one
+from src.auth.dependencies import PRINCIPAL_CACHE_NAMESPACE, get_current_admin_user
+from src.auth.utils import hash_password_async
+from src.cache import invalidate
+from src.database import fetch_one, fetch_page, get_db_connection
+from src.pagination import PageParams, page_params, set_next_cursor
+from src.timing import TimedRoute
 
 router = APIRouter(
     prefix="/admin/users",
     tags=["Admin Users"],
-    dependencies=[Depends(get_current_admin_user)],
+    dependencies=[Depends(get_db_connection), Depends(get_current_admin_user)],
+    route_class=TimedRoute,
 )
 
 
-async def _count_admins(exclude_user_id: int | None = None) -> int:
+def count_admins_query(exclude_user_id: int | None = None) -> Select:
+    # Atendida pelo índice parcial users_active_admins_idx
     query = (
         select(func.count())
         .select_from(users)
@@ -25,7 +30,11 @@ async def _count_admins(exclude_user_id: int | None = None) -> int:
     )
     if exclude_user_id is not None:
         query = query.where(users.c.id != exclude_user_id)
-    result = await fetch_one(query)
+    return query
+
+
+async def _count_admins(exclude_user_id: int | None = None) -> int:
+    result = await fetch_one(count_admins_query(exclude_user_id))
     if not result:
         return 0
     return int(next(iter(result.values())))
@@ -35,7 +44,7 @@ async def _count_admins(exclude_user_id: int | None = None) -> int:
 async def create_user(payload: UserCreate) -> User:
     values = {
         "username": payload.username,
-        "password_hash": hash_password(payload.password),
+        "password_hash": await hash_password_async(payload.password),
         "is_active": payload.is_active,
         "is_admin": payload.is_admin,
     }
@@ -52,9 +61,14 @@ async def create_user(payload: UserCreate) -> User:
 
 
 @router.get("/", response_model=List[User])
-async def list_users() -> List[User]:
-    query = users.select()
-    return await fetch_all(query)
+async def list_users(
+    response: Response, page: PageParams = Depends(page_params)
+) -> List[User]:
+    rows, next_cursor = await fetch_page(
+        users.select(), users, limit=page.limit, after=page.after
+    )
+    set_next_cursor(response, next_cursor)
+    return rows
 
 
 @router.get("/{user_id}", response_model=User)
@@ -81,7 +95,7 @@ async def update_user(user_id: int, payload: UserUpdate) -> User:
     if "password" in update_data:
         password = update_data.pop("password")
         if password is not None:
-            update_data["password_hash"] = hash_password(password)
+            update_data["password_hash"] = await hash_password_async(password)
 
     new_is_admin = update_data.get("is_admin", existing["is_admin"])
     new_is_active = update_data.get("is_active", existing["is_active"])
@@ -98,6 +112,10 @@ async def update_user(user_id: int, payload: UserUpdate) -> User:
     if not update_data:
         return existing
 
+    # Senha, status e permissão novos derrubam os tokens emitidos antes.
+    if update_data.keys() & {"password_hash", "is_active", "is_admin"}:
+        update_data["token_version"] = users.c.token_version + 1
+
     query = (
         users.update()
         .where(users.c.id == user_id)
@@ -111,6 +129,7 @@ async def update_user(user_id: int, payload: UserUpdate) -> User:
             status_code=status.HTTP_409_CONFLICT,
             detail="Username already exists",
         ) from exc
+    invalidate(PRINCIPAL_CACHE_NAMESPACE)
 
     if updated is None:
         raise HTTPException(
@@ -122,17 +141,31 @@ async def update_user(user_id: int, payload: UserUpdate) -> User:
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: int) -> None:
-    existing = await fetch_one(users.select().where(users.c.id == user_id))
-    if existing is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+    # A checagem de "último admin" vai no próprio DELETE; só quando nada é
+    # apagado uma segunda consulta decide entre 404 e 400.
+    other_admins = (
+        select(users.c.id)
+        .where(
+            users.c.is_admin.is_(True),
+            users.c.is_active.is_(True),
+            users.c.id != user_id,
         )
-
-    if existing["is_admin"] and await _count_admins(exclude_user_id=user_id) == 0:
+        .exists()
+    )
+    query = (
+        users.delete()
+        .where(users.c.id == user_id, or_(users.c.is_admin.is_(False), other_admins))
+        .returning(users.c.id)
+    )
+    deleted = await fetch_one(query, commit_after=True)
+    if deleted is None:
+        if await fetch_one(select(users.c.id).where(users.c.id == user_id)) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete the last active admin user",
         )
 
-    query = users.delete().where(users.c.id == user_id)
-    await execute(query, commit_after=True)
+    invalidate(PRINCIPAL_CACHE_NAMESPACE)
@@ -1,4 +1,14 @@
-from sqlalchemy import JSON, Column, DateTime, Integer, String, Table, func
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    func,
+)
 
 from src.database import metadata
 
@@ -10,4 +20,16 @@ art = Table(
     Column("created_at", DateTime, server_default=func.now(), nullable=False),
     Column("description", String(300), nullable=False),
     Column("image", JSON, nullable=True),
+    Column(
+        "updated_at",
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    ),
+    # Versão de content_versions da última escrita; /sync lê por ela
+    Column("version", BigInteger, server_default="0", nullable=False),
+    # Listagens paginam por (created_at, id) decrescentes
+    Index("art_created_at_idx", "created_at", "id"),
+    Index("art_version_idx", "version", "id"),
 )
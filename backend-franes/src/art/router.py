@@ -1,59 +1,142 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from src.art.models import art
-from src.art.schemas import ArtScript, CreateArt
+from src.art.schemas import ArtBulkUpdate, ArtScript, CreateArt
 from src.auth.dependencies import get_current_admin_user
-from src.database import execute, fetch_all, fetch_one
+from src.bulk import (
+    BulkResult,
+    bulk_create,
+    bulk_delete,
+    bulk_response,
+    bulk_update,
+    checked_rows,
+    read_bulk_items,
+)
+from src.cache import cached, invalidate
+from src.database import (
+    fetch_one,
+    fetch_page,
+    get_db_connection,
+    write_returning,
+)
+from src.http_cache import CachePolicy, public_cache, purge
+from src.pagination import PageParams, page_params, set_next_cursor
+from src.responses import trusted_rows
+from src.timing import TimedRoute
+from src.versions.router import bump_version, record_deletion
 
 router = APIRouter(
     prefix="/art",
     tags=["Art"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
 )
 
-@router.post("/", response_model=ArtScript, status_code=status.HTTP_201_CREATED)
-async def create_art(
-    art_object: CreateArt, _: dict = Depends(get_current_admin_user)
-):
+CACHE_NAMESPACE = "art"
+HTTP_CACHE_POLICY = CachePolicy(max_age=300, stale_while_revalidate=3600)
+
+
+def art_values(art_object: CreateArt) -> dict:
+    """Colunas gravadas para ``art_object``, com a imagem já em JSON."""
     image_payload = None
     if art_object.image:
         image_payload = art_object.image.model_dump(
             mode="json", exclude_none=True
         )
+    return {
+        "title": art_object.title,
+        "description": art_object.description,
+        "image": image_payload,
+    }
 
-    query = (
-        art.insert()
-        .values(
-            title=art_object.title,
-            description=art_object.description,
-            image=image_payload,
-        )
-        .returning(art)
-    )
-    created_art = await fetch_one(query, commit_after=True)
+
+@router.post("/", response_model=ArtScript, status_code=status.HTTP_201_CREATED)
+async def create_art(
+    art_object: CreateArt, _: dict = Depends(get_current_admin_user)
+):
+    query = art.insert().values(**art_values(art_object)).returning(art)
+    version = await bump_version(art)
+    created_art = await fetch_one(query.values(version=version), commit_after=True)
+    invalidate(CACHE_NAMESPACE)
+    purge("art/list")
     return created_art
 
-@router.get("/", response_model=List[ArtScript])
-async def list_arts():
-    query = art.select()
-    return await fetch_all(query)
+@router.get(
+    "/",
+    response_model=List[ArtScript],
+    dependencies=[Depends(public_cache(HTTP_CACHE_POLICY, "art", "art/list"))],
+)
+async def list_arts(
+    response: Response, page: PageParams = Depends(page_params)
+):
+    rows, next_cursor = await cached(
+        CACHE_NAMESPACE,
+        ("list", page.limit, page.after),
+        lambda: fetch_page(art.select(), art, limit=page.limit, after=page.after),
+    )
+    set_next_cursor(response, next_cursor)
+    return trusted_rows(ArtScript, rows, response)
+
+# As rotas /bulk vêm antes de /{art_id} para não casarem com ele.
+@router.post("/bulk", response_model=BulkResult[ArtScript])
+async def bulk_create_arts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    items, errors = await read_bulk_items(request, CreateArt)
+    rows = checked_rows(
+        art, [(index, art_values(item)) for index, item in items], errors
+    )
+    created = await bulk_create(art, rows, tuple(art.c))
+    if created:
+        invalidate(CACHE_NAMESPACE)
+        purge("art/list")
+    return bulk_response(ArtScript, created, errors)
+
+@router.put("/bulk", response_model=BulkResult[ArtScript])
+async def bulk_update_arts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    items, errors = await read_bulk_items(request, ArtBulkUpdate)
+    rows = checked_rows(
+        art,
+        [(index, {"id": item.id, **art_values(item)}) for index, item in items],
+        errors,
+    )
+    updated = await bulk_update(art, rows, tuple(art.c), errors)
+    if updated:
+        invalidate(CACHE_NAMESPACE)
+        purge("art/list", *(f"art/{row['id']}" for row in updated))
+    return bulk_response(ArtScript, updated, errors)
 
-@router.get("/{art_id}", response_model=ArtScript)
+@router.post("/bulk/delete", response_model=BulkResult[int])
+async def bulk_delete_arts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    ids, errors = await read_bulk_items(request, int)
+    deleted = await bulk_delete(art, ids, errors)
+    if deleted:
+        invalidate(CACHE_NAMESPACE)
+        purge("art/list", *(f"art/{row_id}" for row_id in deleted))
+    return bulk_response(None, deleted, errors)
+
+@router.get(
+    "/{art_id}",
+    response_model=ArtScript,
+    dependencies=[Depends(public_cache(HTTP_CACHE_POLICY, "art", "art/{art_id}"))],
+)
 async def get_art_by_id(art_id: int):
     query = art.select().where(art.c.id == art_id)
-    the_art = await fetch_one(query)
+    the_art = await cached(CACHE_NAMESPACE, ("id", art_id), lambda: fetch_one(query))
     if the_art is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Art not found")
-    return the_art
+    return trusted_rows(ArtScript, the_art)
 
 @router.put("/{art_id}", response_model=ArtScript)
 async def update_art(
     art_id: int, art_data: CreateArt, _: dict = Depends(get_current_admin_user)
 ):
-    select_query = art.select().where(art.c.id == art_id)
-    if not await fetch_one(select_query):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Art not found")
     image_payload = None
     if art_data.image:
         image_payload = art_data.image.model_dump(
@@ -75,7 +158,13 @@ async def update_art(
         .values(update_values)
         .returning(art)
     )
-    updated_art = await fetch_one(update_query, commit_after=True)
+    version = await bump_version(art)
+    updated_art = await write_returning(
+        update_query.values(version=version),
+        HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Art not found"),
+    )
+    invalidate(CACHE_NAMESPACE)
+    purge("art/list", f"art/{art_id}")
     return updated_art
 
 
@@ -83,10 +172,13 @@ async def update_art(
 async def delete_art(
     art_id: int, _: dict = Depends(get_current_admin_user)
 ):
-    select_query = art.select().where(art.c.id == art_id)
-    if not await fetch_one(select_query):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Art not found")
-
-    delete_query = art.delete().where(art.c.id == art_id)
-    await execute(delete_query, commit_after=True)
+    delete_query = art.delete().where(art.c.id == art_id).returning(art.c.id)
+    if await fetch_one(delete_query) is None:
+        # Nada foi escrito; a transação é desfeita no fim do request
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Art not found"
+        )
+    await record_deletion(art, art_id)
+    invalidate(CACHE_NAMESPACE)
+    purge("art/list", f"art/{art_id}")
     return
@@ -19,10 +19,15 @@ class ArtBase(BaseModel):
 class CreateArt(ArtBase):
     pass
 
+# Item de atualização em lote: os campos da arte mais o id
+class ArtBulkUpdate(CreateArt):
+    id: int
+
 # Representa o dado como ele vem do banco de dados
 class ArtScript(ArtBase):
     id: int
     created_at: datetime
+    updated_at: datetime
 
     model_config = ConfigDict(
         from_attributes=True # Permite converter automaticamente de ORM para Pydantic ler os dados
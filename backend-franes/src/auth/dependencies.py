@@ -1,19 +1,53 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy import select
 
 from src.admin.models import users
-from src.auth.utils import verify_password
+from src.auth.utils import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+from src.cache import cache, cached
 from src.config import settings
-from src.database import fetch_one
+from src.database import LazyConnection, execute, fetch_one, get_db_connection
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/admin/auth/token")
 
+# Namespace do cache de principals; update_user/delete_user o invalidam.
+PRINCIPAL_CACHE_NAMESPACE = "admin_principals"
+
+
+class _ClaimsTrust:
+    """Momento a partir do qual os claims embutidos nos tokens são confiáveis.
+
+    Começa no import do processo e avança sempre que este worker observa uma
+    invalidação de principals (local ou vinda de outro worker). Tokens
+    emitidos antes disso podem carregar permissões já revogadas e passam pelo
+    banco; os emitidos depois refletem o estado atual do usuário.
+    """
+
+    def __init__(self) -> None:
+        self.generation = cache.generation(PRINCIPAL_CACHE_NAMESPACE)
+        self.trusted_after = time.time()
+
+    def allows(self, issued_at: int) -> bool:
+        generation = cache.generation(PRINCIPAL_CACHE_NAMESPACE)
+        if generation != self.generation:
+            self.generation = generation
+            self.trusted_after = time.time()
+        return issued_at >= self.trusted_after
+
+
+_claims_trust = _ClaimsTrust()
+
 
 async def authenticate_admin_user(username: str, password: str) -> dict[str, Any] | None:
     query = users.select().where(users.c.username == username)
@@ -24,20 +58,49 @@ async def authenticate_admin_user(username: str, password: str) -> dict[str, Any
     if not user["is_active"] or not user["is_admin"]:
         return None
 
-    if not verify_password(password, user["password_hash"]):
+    if not await verify_password_async(password, user["password_hash"]):
         return None
 
+    if needs_rehash(user["password_hash"]):
+        # Custo do bcrypt mudou: aproveita a senha em mãos para regravar o hash.
+        new_hash = await hash_password_async(password)
+        await execute(
+            users.update()
+            .where(users.c.id == user["id"])
+            .values(password_hash=new_hash),
+            commit_after=True,
+        )
+
     return user
 
 
+def principal_claims(user: dict[str, Any]) -> dict[str, Any]:
+    """Claims extras do token de ``user``: a versão e, se ativado, o status."""
+    claims: dict[str, Any] = {"ver": user["token_version"]}
+    if settings.ADMIN_TOKEN_EMBED_CLAIMS:
+        claims.update(
+            usr=user["username"], adm=user["is_admin"], act=user["is_active"]
+        )
+    return claims
+
+
 def create_access_token(
-    *, subject: str, expires_delta: timedelta | None = None
+    *,
+    subject: str,
+    expires_delta: timedelta | None = None,
+    claims: dict[str, Any] | None = None,
 ) -> str:
     expire_delta = expires_delta or timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
-    expire_at = datetime.now(timezone.utc) + expire_delta
-    to_encode = {"sub": subject, "exp": expire_at}
+    issued_at = datetime.now(timezone.utc)
+    expire_at = issued_at + expire_delta
+    to_encode = {
+        **(claims or {}),
+        "sub": subject,
+        "iat": int(issued_at.timestamp()),
+        "exp": expire_at,
+    }
     encoded_jwt = jwt.encode(
         to_encode,
         settings.ADMIN_TOKEN_SECRET,
@@ -48,6 +111,7 @@ def create_access_token(
 
 async def get_current_admin_user(
     token: str = Depends(oauth2_scheme),
+    _db: LazyConnection = Depends(get_db_connection),
 ) -> dict[str, Any]:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -71,10 +135,57 @@ async def get_current_admin_user(
     except (TypeError, ValueError):
         raise credentials_exception
 
-    user = await fetch_one(users.select().where(users.c.id == user_id))
-    if not user or not user["is_active"] or not user["is_admin"]:
+    issued_at = payload.get("iat")
+    token_version = payload.get("ver", 0)
+    if (
+        settings.ADMIN_TOKEN_EMBED_CLAIMS
+        and isinstance(issued_at, int)
+        and {"usr", "adm", "act"} <= payload.keys()
+        and _claims_trust.allows(issued_at)
+    ):
+        # A versão vem do banco, não do token: é ela que derruba os tokens
+        # antigos. Fica em cache por usuário, compartilhada entre os tokens.
+        user = {
+            "id": user_id,
+            "username": payload["usr"],
+            "is_admin": payload["adm"],
+            "is_active": payload["act"],
+            "token_version": await cached(
+                PRINCIPAL_CACHE_NAMESPACE,
+                ("ver", user_id),
+                lambda: _load_token_version(user_id),
+                ttl=settings.ADMIN_PRINCIPAL_CACHE_TTL_SECONDS,
+            ),
+        }
+    else:
+        user = await cached(
+            PRINCIPAL_CACHE_NAMESPACE,
+            (user_id, issued_at),
+            lambda: _load_principal(user_id),
+            ttl=settings.ADMIN_PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+
+    if (
+        not user
+        or not user["is_active"]
+        or not user["is_admin"]
+        or user["token_version"] != token_version
+    ):
         raise credentials_exception
 
+    return user
+
+
+async def _load_principal(user_id: int) -> dict[str, Any] | None:
+    user = await fetch_one(users.select().where(users.c.id == user_id))
+    if user is None:
+        return None
+
     sanitized_user = dict(user)
     sanitized_user.pop("password_hash", None)
     return sanitized_user
+
+
+async def _load_token_version(user_id: int) -> int | None:
+    row = await fetch_one(select(users.c.token_version).where(users.c.id == user_id))
+    return None if row is None else row["token_version"]
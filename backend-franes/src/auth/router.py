@@ -8,15 +8,19 @@ from src.admin.models import users
 from src.auth.dependencies import (
     authenticate_admin_user,
     create_access_token,
+    principal_claims,
 )
 from src.auth.schemas import AdminCredentials, Token
-from src.auth.utils import hash_password
+from src.auth.utils import hash_password_async
 from src.config import settings
-from src.database import fetch_one
+from src.database import fetch_one, get_db_connection
+from src.timing import TimedRoute
 
 router = APIRouter(
     prefix="/admin/auth",
     tags=["Auth"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
 )
 
 
@@ -37,6 +41,7 @@ async def login_for_access_token(
         expires_delta=timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         ),
+        claims=principal_claims(user),
     )
     return Token(access_token=access_token)
 
@@ -59,7 +64,7 @@ async def bootstrap_admin(credentials: AdminCredentials) -> Token:
 
     values = {
         "username": credentials.username,
-        "password_hash": hash_password(credentials.password),
+        "password_hash": await hash_password_async(credentials.password),
         "is_active": True,
         "is_admin": True,
     }
@@ -77,5 +82,6 @@ async def bootstrap_admin(credentials: AdminCredentials) -> Token:
         expires_delta=timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         ),
+        claims=principal_claims(created),
     )
     return Token(access_token=access_token)
@@ -1,6 +1,8 @@
 from sqlalchemy import (
+    BigInteger,
     Column,
     DateTime,
+    Index,
     Integer,
     String,
     Table,
@@ -8,6 +10,7 @@ from sqlalchemy import (
 )
 
 from src.database import metadata
+from src.search.columns import public_columns, search_vector
 
 #Define a estrutura da tabela blog_posts no banco de dados
 blog_posts = Table(
@@ -18,4 +21,21 @@ blog_posts = Table(
     Column("reading_time", Integer, nullable=False),
     Column("created_at", DateTime, server_default=func.now(), nullable=False),
     Column("content", String, nullable=False),
+    Column(
+        "updated_at",
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    ),
+    # Versão de content_versions da última escrita; /sync lê por ela
+    Column("version", BigInteger, server_default="0", nullable=False),
+    # Título pesa mais que o conteúdo no ranking da busca
+    search_vector(("title", "A"), ("content", "B")),
+    Index("blog_posts_search_vector_idx", "search_vector", postgresql_using="gin"),
+    Index("blog_posts_created_at_idx", "created_at", "id"),
+    Index("blog_posts_version_idx", "version", "id"),
 )
+
+# Colunas devolvidas pela API (tudo menos o search_vector)
+COLUMNS = public_columns(blog_posts)
@@ -2,18 +2,58 @@
 # Contem a logica para receber as requisicoes HTTP e interagir com o banco de dados
 # +--------------------------------------------------------------------------------
 
-from typing import List
+from typing import List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
 
 from src.auth.dependencies import get_current_admin_user
-from src.blog.models import blog_posts
-from src.blog.schemas import BlogPost, BlogPostCreate
-from src.database import execute, fetch_all, fetch_one
+from src.blog.models import COLUMNS, blog_posts
+from src.blog.schemas import (
+    BlogPost,
+    BlogPostBulkUpdate,
+    BlogPostCreate,
+    BlogPostSummary,
+)
+from src.bulk import (
+    BulkResult,
+    bulk_create,
+    bulk_delete,
+    bulk_response,
+    bulk_update,
+    checked_rows,
+    read_bulk_items,
+)
+from src.cache import cached, invalidate
+from src.constants import ResponseFields
+from src.database import (
+    fetch_one,
+    fetch_page,
+    get_db_connection,
+    write_returning,
+)
+from src.http_cache import CachePolicy, public_cache, purge
+from src.pagination import PageParams, page_params, set_next_cursor
+from src.responses import trusted_rows
+from src.timing import TimedRoute
+from src.versions.router import bump_version, record_deletion
 
 router = APIRouter(
     prefix="/blog",
     tags=["Blog"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
+)
+
+CACHE_NAMESPACE = "blog"
+HTTP_CACHE_POLICY = CachePolicy(max_age=60, stale_while_revalidate=600)
+
+# Colunas lidas no modo resumido; content nunca sai do banco nesse caso
+SUMMARY_COLUMNS = (
+    blog_posts.c.id,
+    blog_posts.c.title,
+    blog_posts.c.reading_time,
+    blog_posts.c.created_at,
 )
 
 #futuramente criar meddleware para ver se o user e admin
@@ -35,31 +75,113 @@ async def create_blog_post(
             reading_time=post.reading_time,
             content=post.content,
         )
-        .returning(blog_posts)  # Pede ao banco para retornar a linha inserida
+        .returning(*COLUMNS)  # Pede ao banco para retornar a linha inserida
     )
 
+    version = await bump_version(blog_posts)
     # A função fetchone executa a query e já retorna o resultado formatado
-    created_post = await fetch_one(query, commit_after=True)
+    created_post = await fetch_one(query.values(version=version), commit_after=True)
+    invalidate(CACHE_NAMESPACE)
+    purge("blog/list")
     return created_post
 
-@router.get("/", response_model=List[BlogPost])
-async def get_all_posts():
-    query = blog_posts.select()
-    return await fetch_all(query)
+@router.get(
+    "/",
+    response_model=Union[List[BlogPost], List[BlogPostSummary]],
+    dependencies=[Depends(public_cache(HTTP_CACHE_POLICY, "blog", "blog/list"))],
+)
+async def get_all_posts(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    fields: ResponseFields = Query(default=ResponseFields.FULL),
+):
+    """
+    Lista os posts do mais recente para o mais antigo, uma página por vez.
+    O cursor da próxima página vem no header X-Next-Cursor.
+    Com fields=summary o content não é lido nem enviado.
+    """
+    query = select(*COLUMNS)
+    if fields is ResponseFields.SUMMARY:
+        query = select(*SUMMARY_COLUMNS)
+
+    posts, next_cursor = await cached(
+        CACHE_NAMESPACE,
+        ("list", fields, page.limit, page.after),
+        lambda: fetch_page(query, blog_posts, limit=page.limit, after=page.after),
+    )
+    set_next_cursor(response, next_cursor)
+    model = BlogPostSummary if fields is ResponseFields.SUMMARY else BlogPost
+    return trusted_rows(model, posts, response)
+
+# As rotas /bulk vêm antes de /{post_id} para não casarem com ele.
+@router.post("/bulk", response_model=BulkResult[BlogPost])
+async def bulk_create_blog_posts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    """
+    Cria vários posts de uma vez, a partir de um array JSON ou NDJSON.
+    Itens inválidos voltam em errors (pelo índice) e não impedem os demais,
+    que são gravados num único INSERT.
+    """
+    items, errors = await read_bulk_items(request, BlogPostCreate)
+    rows = checked_rows(
+        blog_posts, [(index, post.model_dump()) for index, post in items], errors
+    )
+    created = await bulk_create(blog_posts, rows, COLUMNS)
+    if created:
+        invalidate(CACHE_NAMESPACE)
+        purge("blog/list")
+    return bulk_response(BlogPost, created, errors)
+
+@router.put("/bulk", response_model=BulkResult[BlogPost])
+async def bulk_update_blog_posts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    """
+    Atualiza vários posts (cada item com seu id) num único UPDATE.
+    Ids que não existem voltam em errors.
+    """
+    items, errors = await read_bulk_items(request, BlogPostBulkUpdate)
+    rows = checked_rows(
+        blog_posts, [(index, post.model_dump()) for index, post in items], errors
+    )
+    updated = await bulk_update(blog_posts, rows, COLUMNS, errors)
+    if updated:
+        invalidate(CACHE_NAMESPACE)
+        purge("blog/list", *(f"blog/{row['id']}" for row in updated))
+    return bulk_response(BlogPost, updated, errors)
+
+@router.post("/bulk/delete", response_model=BulkResult[int])
+async def bulk_delete_blog_posts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    """
+    Deleta os posts de um array de ids e devolve os ids apagados.
+    """
+    ids, errors = await read_bulk_items(request, int)
+    deleted = await bulk_delete(blog_posts, ids, errors)
+    if deleted:
+        invalidate(CACHE_NAMESPACE)
+        purge("blog/list", *(f"blog/{row_id}" for row_id in deleted))
+    return bulk_response(None, deleted, errors)
 
-@router.get("/{post_id}", response_model=BlogPost)
+@router.get(
+    "/{post_id}",
+    response_model=BlogPost,
+    dependencies=[Depends(public_cache(HTTP_CACHE_POLICY, "blog", "blog/{post_id}"))],
+)
 async def get_post_by_id(post_id: int):
     """
     Retorna um post específico pelo seu ID.
     Se o post não for encontrado, retorna um erro 404.
     """
-    query = blog_posts.select().where(blog_posts.c.id == post_id)
-    post = await fetch_one(query)
+    query = select(*COLUMNS).where(blog_posts.c.id == post_id)
+    post = await cached(CACHE_NAMESPACE, ("id", post_id), lambda: fetch_one(query))
 
     if post is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
 
-    return post
+    return trusted_rows(BlogPost, post)
 
 @router.put("/{post_id}", response_model=BlogPost)
 async def update_post(
@@ -71,16 +193,19 @@ async def update_post(
     Atualiza um post existente.
     Retorna o post com os dados atualizados.
     """
-    select_query = blog_posts.select().where(blog_posts.c.id == post_id)
-    if not await fetch_one(select_query):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
     update_query = (
         blog_posts.update()
         .where(blog_posts.c.id == post_id)
         .values(post_data.model_dump())
-        .returning(blog_posts)
+        .returning(*COLUMNS)
     )
-    updated_post = await fetch_one(update_query, commit_after=True)
+    version = await bump_version(blog_posts)
+    updated_post = await write_returning(
+        update_query.values(version=version),
+        HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"),
+    )
+    invalidate(CACHE_NAMESPACE)
+    purge("blog/list", f"blog/{post_id}")
     return updated_post
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -91,10 +216,17 @@ async def delete_post(
     Deleta um post.
     Retorna uma resposta vazia com status 204 se for bem-sucedido.
     """
-    select_query = blog_posts.select().where(blog_posts.c.id == post_id)
-    if not await fetch_one(select_query):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-
-    delete_query = blog_posts.delete().where(blog_posts.c.id == post_id)
-    await execute(delete_query, commit_after=True)
+    delete_query = (
+        blog_posts.delete()
+        .where(blog_posts.c.id == post_id)
+        .returning(blog_posts.c.id)
+    )
+    if await fetch_one(delete_query) is None:
+        # Nada foi escrito; a transação é desfeita no fim do request
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Post not found"
+        )
+    await record_deletion(blog_posts, post_id)
+    invalidate(CACHE_NAMESPACE)
+    purge("blog/list", f"blog/{post_id}")
     return {}
@@ -17,12 +17,26 @@ class BlogPostBase(BaseModel):
 class BlogPostCreate(BlogPostBase):
     pass
 
+# Item de atualização em lote: os campos do post mais o id
+class BlogPostBulkUpdate(BlogPostCreate):
+    id: int
+
 # Schema para retorno de post(read), herda do base e adiciona id e created_at
 # Representa o dado como ele vem do banco de dados
 class BlogPost(BlogPostBase):
     id: int
     created_at: datetime
+    updated_at: datetime
 
     model_config = ConfigDict(
         from_attributes=True # Permite converter automaticamente de ORM para Pydantic ler os dados
     )
+
+# Versão resumida para listagens, sem o conteúdo completo do post
+class BlogPostSummary(BaseModel):
+    id: int
+    title: str
+    reading_time: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,291 @@
+from typing import Any, Generic, Iterable, List, Mapping, TypeVar
+
+import orjson
+from fastapi import HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import Column, Table, Update, column, values
+
+from src.config import settings
+from src.database import execute, fetch_all
+from src.responses import project
+from src.timing import phase
+from src.versions.router import bump_version, record_deletions_statement
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+T = TypeVar("T")
+
+
+class BulkItemError(BaseModel):
+    # Posição do item no array (ou linha do NDJSON), a partir de 0
+    index: int
+    detail: Any
+
+
+class BulkResult(BaseModel, Generic[T]):
+    items: List[T]
+    errors: List[BulkItemError]
+
+
+def too_many_items() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"No máximo {settings.BULK_MAX_ITEMS} itens por requisição.",
+    )
+
+
+def body_too_large() -> HTTPException:
+    limit_mib = settings.BULK_MAX_BODY_BYTES / (1024 * 1024)
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Corpo maior que o limite de {limit_mib:g} MiB.",
+    )
+
+
+async def _read_body(request: Request) -> bytes:
+    """Lê o corpo parando em ``BULK_MAX_BODY_BYTES``, antes de decodificar.
+
+    Um ``Content-Length`` acima do limite é recusado sem ler nada; sem ele
+    (chunked), a leitura é interrompida assim que o limite é passado.
+    """
+    max_size = settings.BULK_MAX_BODY_BYTES
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise body_too_large()
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_size:
+            raise body_too_large()
+    return bytes(body)
+
+
+def _raw_items(body: bytes, content_type: str) -> list[tuple[int, Any]]:
+    """Itens crus do corpo: um array JSON ou um objeto por linha (NDJSON).
+
+    Linhas de NDJSON que não são JSON viram ``ValueError`` no próprio item,
+    para serem reportadas junto com os erros de validação.
+    """
+    if content_type.split(";")[0].strip().lower() == NDJSON_MEDIA_TYPE:
+        items = []
+        for index, line in enumerate(
+            line for line in body.splitlines() if line.strip()
+        ):
+            try:
+                items.append((index, orjson.loads(line)))
+            except orjson.JSONDecodeError as exc:
+                items.append((index, ValueError(str(exc))))
+        return items
+
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        payload = None
+    if not isinstance(payload, list):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="O corpo deve ser um array JSON ou NDJSON.",
+        )
+    return list(enumerate(payload))
+
+
+def column_errors(table: Table, row: Mapping[str, Any]) -> list[str]:
+    """Valores que o banco recusaria pelo tamanho da coluna.
+
+    Checados antes da escrita para que um item longo demais vire erro do
+    item, e não derrube o ``INSERT`` do lote inteiro.
+    """
+    errors = []
+    for name, value in row.items():
+        length = getattr(table.c[name].type, "length", None)
+        if isinstance(value, str) and length is not None and len(value) > length:
+            errors.append(f"{name}: no máximo {length} caracteres")
+    return errors
+
+
+async def read_bulk_items(
+    request: Request, model: type[T]
+) -> tuple[list[tuple[int, T]], list[BulkItemError]]:
+    """Valida todos os itens do corpo de uma vez, separando os inválidos."""
+    content_type = request.headers.get("content-type", "")
+    raw_items = _raw_items(await _read_body(request), content_type)
+    if len(raw_items) > settings.BULK_MAX_ITEMS:
+        raise too_many_items()
+
+    adapter = TypeAdapter(model)
+    items: list[tuple[int, T]] = []
+    errors: list[BulkItemError] = []
+    with phase("validate"):
+        for index, raw in raw_items:
+            if isinstance(raw, ValueError):
+                errors.append(BulkItemError(index=index, detail=str(raw)))
+                continue
+            try:
+                items.append((index, adapter.validate_python(raw)))
+            except ValidationError as exc:
+                errors.append(
+                    BulkItemError(
+                        index=index,
+                        detail=orjson.loads(exc.json(include_url=False)),
+                    )
+                )
+    return items, errors
+
+
+def checked_rows(
+    table: Table,
+    rows: Iterable[tuple[int, dict[str, Any]]],
+    errors: list[BulkItemError],
+) -> list[tuple[int, dict[str, Any]]]:
+    """Linhas que cabem nas colunas; as demais vão para ``errors``."""
+    accepted = []
+    for index, row in rows:
+        problems = column_errors(table, row)
+        if problems:
+            errors.append(BulkItemError(index=index, detail=problems))
+        else:
+            accepted.append((index, row))
+    return accepted
+
+
+def _unique_ids(
+    ids: Iterable[tuple[int, int]], errors: list[BulkItemError]
+) -> dict[int, int]:
+    """Índice do item de cada id; as repetições vão para ``errors``."""
+    unique: dict[int, int] = {}
+    for index, row_id in ids:
+        if row_id in unique:
+            errors.append(BulkItemError(index=index, detail="id repetido no lote"))
+        else:
+            unique[row_id] = index
+    return unique
+
+
+def bulk_update_statement(
+    table: Table, rows: list[dict[str, Any]], returning: Iterable[Column]
+) -> Update:
+    """``UPDATE ... FROM (VALUES ...)``: todas as linhas num só statement.
+
+    Cada linha traz o ``id`` e os mesmos campos; o ``WHERE`` casa pela chave
+    primária e o ``RETURNING`` devolve só as que existiam.
+    """
+    names = list(rows[0])
+    data = (
+        values(*(column(name, table.c[name].type) for name in names), name="data")
+        .data([tuple(row[name] for name in names) for row in rows])
+    )
+    return (
+        table.update()
+        .where(table.c.id == data.c.id)
+        .values({name: data.c[name] for name in names if name != "id"})
+        .returning(*returning)
+    )
+
+
+async def bulk_create(
+    table: Table,
+    rows: list[tuple[int, dict[str, Any]]],
+    returning: Iterable[Column],
+) -> list[dict[str, Any]]:
+    """Insere ``rows`` numa transação e devolve as linhas na ordem de entrada.
+
+    Roda como executemany: o SQLAlchemy junta as linhas em ``INSERT``s de
+    vários ``VALUES`` (insertmanyvalues) e o ``RETURNING`` volta ordenado
+    pelos parâmetros. Todas as linhas recebem a mesma versão.
+    """
+    if not rows:
+        return []
+
+    version = await bump_version(table)
+    return await fetch_all(
+        table.insert().returning(*returning, sort_by_parameter_order=True),
+        commit_after=True,
+        parameters=[{**row, "version": version} for _, row in rows],
+    )
+
+
+async def bulk_update(
+    table: Table,
+    rows: list[tuple[int, dict[str, Any]]],
+    returning: Iterable[Column],
+    errors: list[BulkItemError],
+) -> list[dict[str, Any]]:
+    """Atualiza ``rows`` (cada uma com ``id``) num único ``UPDATE``.
+
+    Ids repetidos no lote e ids que não existem viram erro do item.
+    """
+    unique = _unique_ids(((index, row["id"]) for index, row in rows), errors)
+    if not unique:
+        return []
+
+    by_index = dict(rows)
+    version = await bump_version(table)
+    statement = bulk_update_statement(
+        table, [by_index[index] for index in unique.values()], returning
+    ).values(version=version)
+    updated = {row["id"]: row for row in await fetch_all(statement, commit_after=True)}
+
+    for row_id, index in unique.items():
+        if row_id not in updated:
+            errors.append(BulkItemError(index=index, detail="Not found"))
+    return [updated[row_id] for row_id in unique if row_id in updated]
+
+
+async def bulk_delete(
+    table: Table, ids: list[tuple[int, int]], errors: list[BulkItemError]
+) -> list[int]:
+    """Apaga ``ids`` com um ``DELETE ... RETURNING`` e grava os tombstones.
+
+    Ids repetidos no lote e ids que não existem viram erro do item, como em
+    :func:`bulk_update`.
+    """
+    unique = _unique_ids(ids, errors)
+    if not unique:
+        return []
+
+    deleted = {
+        row["id"]
+        for row in await fetch_all(
+            table.delete().where(table.c.id.in_(unique)).returning(table.c.id)
+        )
+    }
+    for row_id, index in unique.items():
+        if row_id not in deleted:
+            errors.append(BulkItemError(index=index, detail="Not found"))
+    if not deleted:
+        # Nada apagado: sem versão nova nem commit
+        return []
+
+    # A versão é tomada depois do DELETE, na mesma transação dos tombstones
+    version = await bump_version(table)
+    await execute(
+        record_deletions_statement(table, sorted(deleted), version),
+        commit_after=True,
+    )
+    return [row_id for row_id in unique if row_id in deleted]
+
+
+def bulk_response(
+    model: type[BaseModel] | None,
+    items: list[Any],
+    errors: list[BulkItemError],
+) -> Any:
+    """``BulkResult`` com os erros em ordem de índice.
+
+    Com ``model``, as linhas seguem o atalho de ``trusted_rows``: só os
+    campos do schema, direto para o orjson.
+    """
+    errors = sorted(errors, key=lambda error: error.index)
+    if model is None or not settings.RESPONSE_TRUSTED_ROWS:
+        return {"items": items, "errors": errors}
+
+    with phase("serialize"):
+        return ORJSONResponse(
+            {
+                "items": [project(model, row) for row in items],
+                "errors": [error.model_dump() for error in errors],
+            }
+        )
+
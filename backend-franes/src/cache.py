@@ -0,0 +1,222 @@
+import fcntl
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from src.config import settings
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+
+
+class SharedGenerations:
+    """Contadores de geração por namespace num arquivo mapeado em memória.
+
+    Todos os workers do Gunicorn no mesmo host abrem o mesmo arquivo (em
+    ``/dev/shm``), então uma invalidação feita em um worker é vista pelos
+    outros na próxima leitura do cache, sem round trip ao banco. Cada
+    namespace cai num dos ``SLOTS`` contadores pelo CRC32 do nome; colisões
+    só causam invalidações a mais.
+    """
+
+    SLOTS = 64
+    _SLOT = struct.Struct("<Q")
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        size = self.SLOTS * self._SLOT.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+
+    def _offset(self, namespace: str) -> int:
+        slot = zlib.crc32(namespace.encode("utf-8")) % self.SLOTS
+        return slot * self._SLOT.size
+
+    def get(self, namespace: str) -> int:
+        return self._SLOT.unpack_from(self._map, self._offset(namespace))[0]
+
+    def bump(self, namespace: str) -> int:
+        offset = self._offset(namespace)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            value = self._SLOT.unpack_from(self._map, offset)[0] + 1
+            self._SLOT.pack_into(self._map, offset, value)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return value
+
+
+def approx_size(value: Any) -> int:
+    """Estimativa barata, em bytes, do que uma linha/lista ocupa em memória."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            approx_size(key) + approx_size(item) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(approx_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResponseCache:
+    """Cache de leitura local ao processo, com TTL, LRU e limite de memória.
+
+    As chaves são agrupadas por namespace (um por recurso: ``"blog"``,
+    ``"art"``...) e qualquer escrita no recurso invalida o namespace inteiro,
+    já que listas e detalhes dependem das mesmas linhas. Com ``shared``, as
+    invalidações também valem para os outros processos que usam o arquivo.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        shared: SharedGenerations | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._shared = shared
+        self._shared_seen: dict[str, int] = {}
+        self._entries: OrderedDict[tuple[str, Hashable], _Entry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, namespace: str, key: Hashable) -> tuple[bool, Any]:
+        self._sync(namespace)
+        entry = self._entries.get((namespace, key))
+        if entry is None or entry.expires_at <= self._clock():
+            if entry is not None:
+                self._remove((namespace, key))
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end((namespace, key))
+        self.hits += 1
+        return True, entry.value
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        generation: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        # Uma escrita que invalidou o namespace durante a leitura torna o
+        # valor carregado obsoleto; nesse caso ele não entra no cache.
+        current = self.generation(namespace)
+        if generation is not None and generation != current:
+            return
+
+        size = approx_size(value)
+        if size > self.max_bytes:
+            return
+
+        self._remove((namespace, key))
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[(namespace, key)] = _Entry(value, size, expires_at)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def generation(self, namespace: str) -> int:
+        self._sync(namespace)
+        return self._generations.get(namespace, 0)
+
+    def invalidate(self, namespace: str) -> None:
+        if self._shared is not None:
+            self._shared_seen[namespace] = self._shared.bump(namespace)
+        self._drop(namespace)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def _sync(self, namespace: str) -> None:
+        """Descarta o namespace se outro processo o invalidou desde a última vez."""
+        if self._shared is None:
+            return
+        current = self._shared.get(namespace)
+        if self._shared_seen.setdefault(namespace, current) != current:
+            self._shared_seen[namespace] = current
+            self._drop(namespace)
+
+    def _drop(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        for cache_key in [key for key in self._entries if key[0] == namespace]:
+            self._remove(cache_key)
+
+    def _remove(self, cache_key: tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+cache = ResponseCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    max_bytes=settings.CACHE_MAX_BYTES,
+    ttl=settings.CACHE_TTL_SECONDS,
+    shared=(
+        SharedGenerations(settings.CACHE_GENERATIONS_PATH)
+        if settings.CACHE_GENERATIONS_PATH
+        else None
+    ),
+)
+
+
+async def cached(
+    namespace: str,
+    key: Hashable,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: float | None = None,
+) -> Any:
+    """Lê do cache ou executa ``loader`` e guarda o resultado.
+
+    ``ttl`` substitui o ``CACHE_TTL_SECONDS`` padrão só para esta entrada.
+    """
+    if not settings.CACHE_ENABLED:
+        return await loader()
+
+    hit, value = cache.get(namespace, key)
+    if hit:
+        return value
+
+    generation = cache.generation(namespace)
+    value = await loader()
+    cache.set(namespace, key, value, generation=generation, ttl=ttl)
+    return value
+
+
+def invalidate(namespace: str) -> None:
+    cache.invalidate(namespace)
@@ -0,0 +1,266 @@
+import hashlib
+import zlib
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.cache import ResponseCache, cache
+from src.config import settings
+
+try:
+    import brotli
+except ImportError:  # opcionais; sem eles só gzip é oferecido
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Namespace do cache onde ficam os corpos já comprimidos, por digest do
+# corpo original; conteúdo novo gera digest novo, então nunca é invalidado.
+CACHE_NAMESPACE = "compressed"
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 6
+
+# Ordem de preferência do servidor quando o cliente aceita mais de uma
+ENCODINGS = tuple(
+    name
+    for name, available in (
+        ("br", brotli is not None),
+        ("zstd", zstandard is not None),
+        ("gzip", True),
+    )
+    if available
+)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+class _Gzip:
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _Brotli:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _Zstd:
+    def __init__(self) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+COMPRESSORS: dict[str, Callable[[], _Gzip | _Brotli | _Zstd]] = {
+    "gzip": _Gzip,
+    "br": _Brotli,
+    "zstd": _Zstd,
+}
+
+
+def negotiate(accept_encoding: str | None) -> str | None:
+    """Codificação a usar para o ``Accept-Encoding`` dado, ou ``None``."""
+    if not accept_encoding:
+        return None
+
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                continue
+        accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = [
+        (accepted.get(name, wildcard), -index, name)
+        for index, name in enumerate(ENCODINGS)
+    ]
+    quality, _, name = max(candidates)
+    return name if quality > 0 else None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    compressor = COMPRESSORS[encoding]()
+    return compressor.compress(data) + compressor.flush()
+
+
+def is_compressible(content_type: str | None) -> bool:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type.endswith("+json")
+        or media_type in COMPRESSIBLE_TYPES
+    )
+
+
+class CompressionMiddleware:
+    """Middleware ASGI que comprime respostas conforme o ``Accept-Encoding``.
+
+    Comprime corpos de tipo textual (JSON, CSV...) a partir de
+    ``COMPRESSION_MIN_SIZE`` bytes; PDF e outros formatos já comprimidos,
+    respostas parciais (206) e as que já têm ``Content-Encoding`` passam
+    direto. Downloads em streaming são comprimidos pedaço a pedaço.
+
+    Respostas públicas (GET sem ``Authorization``) inteiras guardam as
+    versões comprimidas em ``store`` pelo digest do corpo: enquanto o
+    conteúdo não muda, cada codificação é comprimida uma vez só.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        store: ResponseCache | None = cache,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.store = store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate(request_headers.get("accept-encoding"))
+        if encoding is None or "range" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(
+            send,
+            encoding,
+            self.minimum_size or settings.COMPRESSION_MIN_SIZE,
+            self.store if _is_public(scope, request_headers) else None,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+def _is_public(scope: Scope, headers: Headers) -> bool:
+    return scope["method"] in ("GET", "HEAD") and "authorization" not in headers
+
+
+class _CompressingResponder:
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        minimum_size: int,
+        store: ResponseCache | None,
+    ) -> None:
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.store = store
+        self._start: Message | None = None
+        # None: ainda não decidido; False: repassa sem mexer
+        self._compressor: _Gzip | _Brotli | _Zstd | bool | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            if not self._should_compress(message):
+                self._compressor = False
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self._compressor is False:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._compressor is None:
+            if not more_body:
+                await self._send_whole(body)
+                return
+            self._compressor = COMPRESSORS[self.encoding]()
+            self._prepare_headers(content_length=None)
+            await self._send(self._start)
+
+        chunk = self._compressor.compress(body)
+        if not more_body:
+            chunk += self._compressor.flush()
+        if chunk or not more_body:
+            await self._send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+    def _should_compress(self, message: Message) -> bool:
+        headers = Headers(raw=message["headers"])
+        status = message["status"]
+        if status < 200 or status >= 300 or status in (204, 206):
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        if not is_compressible(headers.get("content-type")):
+            return False
+        length = headers.get("content-length")
+        return not (length and length.isdigit() and int(length) < self.minimum_size)
+
+    async def _send_whole(self, body: bytes) -> None:
+        if len(body) < self.minimum_size:
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        compressed = self._compressed(body)
+        self._prepare_headers(content_length=len(compressed))
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    def _compressed(self, body: bytes) -> bytes:
+        if self.store is None or self._start["status"] != 200:
+            return compress(body, self.encoding)
+
+        key = (hashlib.blake2b(body, digest_size=16).digest(), self.encoding)
+        hit, compressed = self.store.get(CACHE_NAMESPACE, key)
+        if not hit:
+            compressed = compress(body, self.encoding)
+            self.store.set(CACHE_NAMESPACE, key, compressed)
+        return compressed
+
+    def _prepare_headers(self, content_length: int | None) -> None:
+        headers = MutableHeaders(scope=self._start)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        # A versão comprimida não é idêntica byte a byte à original; o ETag
+        # vira fraco, o que ainda vale para If-None-Match (304).
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
@@ -66,10 +66,48 @@ class Config(CustomBaseSettings):
     DATABASE_URL: PostgresDsn
     DATABASE_ASYNC_URL: PostgresDsn
     DATABASE_POOL_SIZE: int = 16
+    DATABASE_POOL_MAX_OVERFLOW: int = 10
     DATABASE_POOL_TTL: int = 60 * 20  # 20 minutes
     DATABASE_POOL_PRE_PING: bool = True
     DATABASE_SSL_MODE: str | None = None
     DATABASE_SSL_ROOT_CERT: str | None = None
+    DATABASE_SLOW_QUERY_MS: int = 200
+    # EXPLAIN (ANALYZE, BUFFERS) das consultas lentas; nunca roda em produção
+    DATABASE_EXPLAIN_SLOW_QUERIES: bool = False
+    DATABASE_EXPLAIN_INTERVAL: int = 60 * 10  # 10 minutes
+
+    PAGINATION_DEFAULT_LIMIT: int = 20
+    PAGINATION_MAX_LIMIT: int = 100
+    # Linhas alteradas por resposta do /sync (padrão e máximo do ?limit)
+    SYNC_MAX_LIMIT: int = 500
+    # Itens aceitos por requisição nas rotas /bulk, e o tamanho do corpo
+    BULK_MAX_ITEMS: int = 1000
+    BULK_MAX_BODY_BYTES: int = 8 * 1024 * 1024  # 8 MiB
+
+    CURRICULUM_STORAGE_BACKEND: str = "database"
+    CURRICULUM_STORAGE_PATH: str = "storage/curriculum"
+    CURRICULUM_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024  # 10 MiB
+
+    # Respostas de leitura saem direto das linhas do banco, sem revalidação
+    RESPONSE_TRUSTED_ROWS: bool = True
+
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: int = 300
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # 32 MiB
+    # Arquivo compartilhado entre workers para propagar invalidações; o
+    # gunicorn_conf.py define um em /dev/shm quando o env não traz nenhum.
+    CACHE_GENERATIONS_PATH: str | None = None
+
+    # Cache-Control/ETag nas leituras públicas. No modo edge o CDN guarda as
+    # respostas por HTTP_CACHE_EDGE_MAX_AGE e as escritas o purgam por
+    # surrogate key em HTTP_CACHE_PURGE_URL.
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_EDGE_MODE: bool = False
+    HTTP_CACHE_EDGE_MAX_AGE: int = 24 * 60 * 60
+    HTTP_CACHE_SURROGATE_KEY_HEADER: str = "Surrogate-Key"
+    HTTP_CACHE_PURGE_URL: str | None = None
+    HTTP_CACHE_PURGE_TOKEN: str | None = None
 
     ENVIRONMENT: Environment = Environment.PRODUCTION
 
@@ -78,6 +116,14 @@ class Config(CustomBaseSettings):
     ADMIN_TOKEN_SECRET: str = "change-me"
     ADMIN_TOKEN_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    ADMIN_PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
+    # Tokens carregam is_admin/is_active e dispensam carregar o usuário
+    # enquanto nenhuma alteração for observada depois do iat; só a
+    # token_version é conferida no banco, em cache por usuário.
+    ADMIN_TOKEN_EMBED_CLAIMS: bool = False
 
     CORS_ORIGINS: list[str] = [
         "http://localhost:3030",
@@ -90,6 +136,16 @@ class Config(CustomBaseSettings):
 
     APP_VERSION: str = "0.1"
 
+    METRICS_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = True
+    # Permite perfilar um request com X-Profile-Token (ver /profiling/token);
+    # desligado por padrão, ligue só em ambientes de debug
+    PROFILING_ENABLED: bool = False
+    PROFILE_TOKEN_EXPIRE_MINUTES: int = 5
+    # Respostas textuais menores que isso saem sem compressão
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+
     @model_validator(mode="after")
     def validate_sentry_non_local(self) -> "Config":
         if self.ENVIRONMENT.is_deployed and not self.SENTRY_DSN:
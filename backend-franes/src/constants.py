@@ -8,6 +8,14 @@ DB_NAMING_CONVENTION = {
     "pk": "%(table_name)s_pkey",
 }
 
+# Dicionário do Postgres usado nas colunas search_vector e nas buscas
+TEXT_SEARCH_CONFIG = "portuguese"
+
+
+class ResponseFields(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
 
 class Environment(str, Enum):
     LOCAL = "LOCAL"
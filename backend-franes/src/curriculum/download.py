@@ -0,0 +1,145 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.curriculum.storage import get_storage
+
+
+def content_type_for(file_name: str) -> str:
+    if file_name.lower().endswith(".pdf"):
+        return "application/pdf"
+    return "text/csv; charset=utf-8"
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Intervalo ``(start, end)`` inclusivo pedido em ``Range: bytes=...``.
+
+    Devolve ``None`` quando o header deve ser ignorado (ausente, outra
+    unidade ou múltiplos intervalos) e levanta ``ValueError`` quando o
+    intervalo não pode ser atendido.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last):
+        return None
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(size - suffix, 0), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("Unsatisfiable range")
+    return start, min(end, size - 1)
+
+
+def _http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _parse_http_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # If-None-Match usa comparação fraca: "W/" é ignorado dos dois lados.
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    since = _parse_http_date(request.headers.get("if-modified-since"))
+    return since is not None and last_modified.replace(microsecond=0) <= since
+
+
+def _range_applies(request: Request, etag: str, last_modified: datetime) -> bool:
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if if_range.startswith('"'):
+        # If-Range só aceita comparação forte.
+        return if_range == etag
+    since = _parse_http_date(if_range)
+    return since is not None and last_modified.replace(microsecond=0) <= since
+
+
+def build_file_response(entry: Dict, request: Request) -> Response:
+    """Transmite o arquivo direto do storage, com ETag, 304 e Range.
+
+    O ETag é o SHA-256 gravado no upload, então respostas 304 e 416 saem só
+    com os metadados da linha, sem abrir o arquivo no storage.
+    """
+    record = dict(entry)
+    filename = record.get("file_name") or "curriculum.csv"
+    media_type = record.get("content_type") or content_type_for(filename)
+    size = record["size_bytes"]
+    etag = f'"{record["content_sha256"]}"'
+    last_modified = record["updated_at"]
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": _http_date(last_modified),
+        "Accept-Ranges": "bytes",
+    }
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    byte_range = None
+    if _range_applies(request, etag, last_modified):
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers=headers,
+            )
+
+    storage = get_storage(record["storage_backend"])
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            storage.open(record["storage_key"]),
+            media_type=media_type,
+            headers=headers,
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        storage.open(record["storage_key"], start=start, end=end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
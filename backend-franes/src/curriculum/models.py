@@ -1,10 +1,16 @@
 from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
     Column,
     DateTime,
+    ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    SmallInteger,
     String,
     Table,
-    Text,
     func,
 )
 
@@ -17,7 +23,11 @@ curriculum_files = Table(
     Column("title", String(120), nullable=False),
     Column("description", String(300), nullable=True),
     Column("file_name", String(255), nullable=False),
-    Column("csv_content", Text, nullable=False),
+    Column("content_type", String(100), nullable=False),
+    Column("size_bytes", BigInteger, nullable=False),
+    Column("content_sha256", String(64), nullable=False),
+    Column("storage_backend", String(20), nullable=False),
+    Column("storage_key", String(64), nullable=False),
     Column("created_at", DateTime, server_default=func.now(), nullable=False),
     Column(
         "updated_at",
@@ -26,4 +36,37 @@ curriculum_files = Table(
         onupdate=func.now(),
         nullable=False,
     ),
+    # Versão de content_versions da última escrita; /sync lê por ela
+    Column("version", BigInteger, server_default="0", nullable=False),
+    # Listagem paginada e "latest" (ORDER BY created_at DESC LIMIT 1)
+    Index("curriculum_files_created_at_idx", "created_at", "id"),
+    Index("curriculum_files_version_idx", "version", "id"),
+)
+
+# Id da única linha de curriculum_latest
+LATEST_POINTER_ID = 1
+
+# Ponteiro para o currículo publicado (o mais recente), mantido pelas rotas
+# de escrita; /latest resolve por chave primária em vez de ordenar a tabela.
+curriculum_latest = Table(
+    "curriculum_latest",
+    metadata,
+    Column("id", SmallInteger, primary_key=True, autoincrement=False),
+    Column(
+        "curriculum_id",
+        Integer,
+        ForeignKey("curriculum_files.id", ondelete="SET NULL"),
+        nullable=True,
+    ),
+    CheckConstraint(f"id = {LATEST_POINTER_ID}", name="singleton"),
+)
+
+# Bytes dos arquivos guardados pelo backend "database" de src.curriculum.storage
+curriculum_file_chunks = Table(
+    "curriculum_file_chunks",
+    metadata,
+    Column("file_key", String(64), nullable=False),
+    Column("seq", Integer, nullable=False),
+    Column("data", LargeBinary, nullable=False),
+    PrimaryKeyConstraint("file_key", "seq"),
 )
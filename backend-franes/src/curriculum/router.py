@@ -1,47 +1,171 @@
 import base64
-from typing import AsyncIterator, Dict, List
+import binascii
+from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import Insert, Select, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.auth.dependencies import get_current_admin_user
-from src.curriculum.models import curriculum_files
+from src.cache import cached, invalidate
+from src.config import settings
+from src.curriculum.download import build_file_response, content_type_for
+from src.curriculum.models import (
+    LATEST_POINTER_ID,
+    curriculum_files,
+    curriculum_latest,
+)
 from src.curriculum.schema import (
     Curriculum,
+    CurriculumBase,
     CurriculumCreate,
     CurriculumUpdate,
 )
-from src.database import execute, fetch_all, fetch_one
+from src.curriculum.storage import FileTooLarge, StoredFile, get_storage
+from src.curriculum.upload import MAX_FIELD_SIZE, InvalidUpload, MultipartUpload
+from src.database import (
+    LazyConnection,
+    execute,
+    fetch_one,
+    fetch_page,
+    get_db_connection,
+    write_returning,
+)
+from src.http_cache import CachePolicy, public_cache, purge
+from src.pagination import PageParams, page_params, set_next_cursor
+from src.responses import trusted_rows
+from src.timing import TimedRoute, phase
+from src.versions.router import bump_version, record_deletion
 
 router = APIRouter(
     prefix="/curriculum",
     tags=["Curriculum"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
 )
 
+CACHE_NAMESPACE = "curriculum"
+HTTP_CACHE_POLICY = CachePolicy(max_age=300, stale_while_revalidate=3600)
+CURRICULUM_ITEM_KEYS = ("curriculum", "curriculum/{curriculum_id}")
+
 
 def serialize_curriculum(record: Dict) -> Dict:
-    """Normaliza o payload retornado para incluir informações de PDF."""
+    """Normaliza o payload retornado para incluir o link de download."""
     if record is None:
         return record
 
-    record_dict = dict(record)
+    with phase("serialize"):
+        record_dict = dict(record)
+        return {
+            **record_dict,
+            "pdf_url": f"/curriculum/{record_dict['id']}/download",
+        }
 
-    file_name = (record_dict.get("file_name") or "").lower()
-    stored_content = record_dict.get("csv_content")
-    pdf_base64 = None
-    csv_content = stored_content
-    if file_name.endswith(".pdf"):
-        pdf_base64 = stored_content
-        csv_content = None
 
+def latest_entry_query() -> Select:
+    """Currículo publicado, por chave primária via ``curriculum_latest``."""
+    return (
+        select(curriculum_files)
+        .select_from(
+            curriculum_latest.join(
+                curriculum_files,
+                curriculum_files.c.id == curriculum_latest.c.curriculum_id,
+            )
+        )
+        .where(curriculum_latest.c.id == LATEST_POINTER_ID)
+    )
+
+
+def refresh_latest_statement() -> Insert:
+    """Aponta ``curriculum_latest`` para o currículo mais recente.
+
+    Roda na mesma transação de cada INSERT/DELETE em ``curriculum_files``.
+    Edições não mudam o ``created_at`` e, portanto, nem o ponteiro. A
+    subconsulta lê uma entrada de ``curriculum_files_created_at_idx``.
+    """
+    newest = (
+        select(curriculum_files.c.id)
+        .order_by(
+            curriculum_files.c.created_at.desc(), curriculum_files.c.id.desc()
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+    statement = pg_insert(curriculum_latest).values(
+        id=LATEST_POINTER_ID, curriculum_id=newest
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[curriculum_latest.c.id],
+        set_={"curriculum_id": statement.excluded.curriculum_id},
+    )
+
+
+def stored_file_values(file_name: str, stored: StoredFile) -> Dict[str, Any]:
     return {
-        **record_dict,
-        "csv_content": csv_content,
-        "pdf_base64": pdf_base64,
-        "pdf_url": f"/curriculum/{record_dict['id']}/download",
+        "file_name": file_name,
+        "content_type": content_type_for(file_name),
+        "size_bytes": stored.size,
+        "content_sha256": stored.sha256,
+        "storage_backend": stored.backend,
+        "storage_key": stored.key,
     }
 
 
+async def store_payload_content(
+    pdf_base64: str | None, csv_content: str | None
+) -> StoredFile:
+    """Decodifica o conteúdo enviado em JSON uma única vez e grava os bytes."""
+    if pdf_base64:
+        try:
+            data = base64.b64decode(pdf_base64, validate=True)
+        except binascii.Error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Arquivo PDF inválido.",
+            )
+    else:
+        data = (csv_content or "").encode("utf-8")
+
+    return await get_storage().save_bytes(data)
+
+
+async def release_stored_file(backend: str, key: str) -> None:
+    """Apaga o arquivo se nenhuma outra entrada apontar para o mesmo conteúdo."""
+    query = (
+        select(func.count())
+        .select_from(curriculum_files)
+        .where(
+            curriculum_files.c.storage_backend == backend,
+            curriculum_files.c.storage_key == key,
+        )
+    )
+    result = await fetch_one(query)
+    if result and next(iter(result.values())):
+        return
+
+    await get_storage(backend).delete(key)
+
+
+async def insert_stored_entry(stored: StoredFile, **values: Any) -> Dict:
+    """Insere a entrada que aponta para ``stored`` e atualiza o ponteiro latest.
+
+    O arquivo já está no storage; se a escrita falhar ele é liberado, para
+    não ficar órfão.
+    """
+    query = curriculum_files.insert().values(**values).returning(curriculum_files)
+    try:
+        version = await bump_version(curriculum_files)
+        created = await fetch_one(query.values(version=version))
+        await execute(refresh_latest_statement(), commit_after=True)
+    except Exception:
+        await release_stored_file(stored.backend, stored.key)
+        raise
+    return created
+
+
 @router.post(
     "/",
     response_model=Curriculum,
@@ -51,47 +175,151 @@ async def create_curriculum_entry(
     payload: CurriculumCreate,
     _: dict = Depends(get_current_admin_user),
 ):
-    stored_content = payload.pdf_base64 or payload.csv_content or ""
-    query = (
-        curriculum_files.insert()
-        .values(
-            title=payload.title,
-            description=payload.description,
-            file_name=payload.file_name,
-            csv_content=stored_content,
+    stored = await store_payload_content(payload.pdf_base64, payload.csv_content)
+    created = await insert_stored_entry(
+        stored,
+        title=payload.title,
+        description=payload.description,
+        **stored_file_values(payload.file_name, stored),
+    )
+    invalidate(CACHE_NAMESPACE)
+    purge("curriculum/list", "curriculum/latest")
+    return serialize_curriculum(created)
+
+
+@router.post(
+    "/upload",
+    response_model=Curriculum,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["title", "file"],
+                        "properties": {
+                            "title": {"type": "string"},
+                            "description": {"type": "string"},
+                            "file_name": {"type": "string"},
+                            "file": {"type": "string", "format": "binary"},
+                        },
+                    }
+                }
+            },
+        }
+    },
+)
+async def upload_curriculum_entry(
+    request: Request,
+    db: LazyConnection = Depends(get_db_connection),
+    _: dict = Depends(get_current_admin_user),
+):
+    """Recebe o arquivo em multipart/form-data gravando-o no storage aos poucos.
+
+    Tamanho e SHA-256 são calculados enquanto os bytes chegam, e o upload é
+    interrompido assim que passa de ``CURRICULUM_MAX_UPLOAD_BYTES``.
+    """
+    max_size = settings.CURRICULUM_MAX_UPLOAD_BYTES
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size + 4 * MAX_FIELD_SIZE:
+        raise upload_too_large()
+
+    # Não segura uma conexão do pool enquanto o corpo chega; o INSERT do
+    # final pega outra.
+    await db.close()
+    try:
+        upload = MultipartUpload(request.headers, request.stream())
+        stored = await get_storage().save(upload.file_chunks(), max_size=max_size)
+    except InvalidUpload as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
         )
-        .returning(curriculum_files)
+    except FileTooLarge:
+        raise upload_too_large()
+
+    try:
+        metadata = CurriculumBase.model_validate(
+            {
+                "file_name": upload.file_name,
+                **upload.fields,
+            }
+        )
+    except ValidationError as exc:
+        await release_stored_file(stored.backend, stored.key)
+        raise RequestValidationError(exc.errors())
+
+    created = await insert_stored_entry(
+        stored,
+        title=metadata.title,
+        description=metadata.description,
+        **stored_file_values(metadata.file_name, stored),
     )
-    created = await fetch_one(query, commit_after=True)
+    invalidate(CACHE_NAMESPACE)
+    purge("curriculum/list", "curriculum/latest")
     return serialize_curriculum(created)
 
 
-@router.get("/", response_model=List[Curriculum])
-async def list_curriculum_entries():
-    query = curriculum_files.select()
-    entries = await fetch_all(query)
-    return [serialize_curriculum(entry) for entry in entries]
+def upload_too_large() -> HTTPException:
+    limit_mib = settings.CURRICULUM_MAX_UPLOAD_BYTES / (1024 * 1024)
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Arquivo maior que o limite de {limit_mib:g} MiB.",
+    )
 
 
-@router.get("/latest", response_model=Curriculum)
-async def get_latest_curriculum_entry():
-    query = (
-        curriculum_files.select()
-        .order_by(curriculum_files.c.created_at.desc())
-        .limit(1)
+@router.get(
+    "/",
+    response_model=List[Curriculum],
+    dependencies=[
+        Depends(public_cache(HTTP_CACHE_POLICY, "curriculum", "curriculum/list"))
+    ],
+)
+async def list_curriculum_entries(
+    response: Response, page: PageParams = Depends(page_params)
+):
+    entries, next_cursor = await cached(
+        CACHE_NAMESPACE,
+        ("list", page.limit, page.after),
+        lambda: fetch_page(
+            curriculum_files.select(),
+            curriculum_files,
+            limit=page.limit,
+            after=page.after,
+        ),
+    )
+    set_next_cursor(response, next_cursor)
+    return trusted_rows(
+        Curriculum, [serialize_curriculum(entry) for entry in entries], response
     )
-    entry = await fetch_one(query)
+
+
+@router.get(
+    "/latest",
+    response_model=Curriculum,
+    dependencies=[
+        Depends(public_cache(HTTP_CACHE_POLICY, "curriculum", "curriculum/latest"))
+    ],
+)
+async def get_latest_curriculum_entry():
+    query = latest_entry_query()
+    entry = await cached(CACHE_NAMESPACE, ("latest",), lambda: fetch_one(query))
     if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Nenhum currículo disponível no momento.",
         )
-    return serialize_curriculum(entry)
+    return trusted_rows(Curriculum, serialize_curriculum(entry))
 
 
 @router.get(
     "/latest/download",
     response_class=StreamingResponse,
+    dependencies=[
+        Depends(public_cache(HTTP_CACHE_POLICY, "curriculum", "curriculum/latest"))
+    ],
     responses={
         status.HTTP_200_OK: {
             "content": {"text/csv": {}},
@@ -99,52 +327,59 @@ async def get_latest_curriculum_entry():
         }
     },
 )
-async def download_latest_curriculum_entry() -> StreamingResponse:
-    query = (
-        curriculum_files.select()
-        .order_by(curriculum_files.c.created_at.desc())
-        .limit(1)
-    )
-    entry = await fetch_one(query)
+async def download_latest_curriculum_entry(request: Request) -> Response:
+    query = latest_entry_query()
+    entry = await cached(CACHE_NAMESPACE, ("latest",), lambda: fetch_one(query))
     if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Nenhum currículo disponível para download.",
         )
 
-    return build_file_response(entry)
+    return build_file_response(entry, request)
 
 
 @router.get(
     "/{curriculum_id}/download",
     response_class=StreamingResponse,
+    dependencies=[Depends(public_cache(HTTP_CACHE_POLICY, *CURRICULUM_ITEM_KEYS))],
 )
-async def download_curriculum_entry(curriculum_id: int) -> StreamingResponse:
+async def download_curriculum_entry(
+    curriculum_id: int, request: Request
+) -> Response:
     query = curriculum_files.select().where(
         curriculum_files.c.id == curriculum_id,
     )
-    entry = await fetch_one(query)
+    entry = await cached(
+        CACHE_NAMESPACE, ("id", curriculum_id), lambda: fetch_one(query)
+    )
     if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Curriculum entry not found",
         )
 
-    return build_file_response(entry)
+    return build_file_response(entry, request)
 
 
-@router.get("/{curriculum_id}", response_model=Curriculum)
+@router.get(
+    "/{curriculum_id}",
+    response_model=Curriculum,
+    dependencies=[Depends(public_cache(HTTP_CACHE_POLICY, *CURRICULUM_ITEM_KEYS))],
+)
 async def get_curriculum_entry(curriculum_id: int):
     query = curriculum_files.select().where(
         curriculum_files.c.id == curriculum_id
     )
-    entry = await fetch_one(query)
+    entry = await cached(
+        CACHE_NAMESPACE, ("id", curriculum_id), lambda: fetch_one(query)
+    )
     if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Curriculum entry not found",
         )
-    return serialize_curriculum(entry)
+    return trusted_rows(Curriculum, serialize_curriculum(entry))
 
 
 @router.put("/{curriculum_id}", response_model=Curriculum)
@@ -153,21 +388,42 @@ async def update_curriculum_entry(
     payload: CurriculumUpdate,
     _: dict = Depends(get_current_admin_user),
 ):
-    select_query = curriculum_files.select().where(
-        curriculum_files.c.id == curriculum_id
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Curriculum entry not found",
     )
-    existing = await fetch_one(select_query)
-    if existing is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Curriculum entry not found",
-        )
-
     update_data = payload.model_dump(exclude_unset=True)
-    if "pdf_base64" in update_data:
-        update_data["csv_content"] = update_data.pop("pdf_base64")
+    pdf_base64 = update_data.pop("pdf_base64", None)
+    csv_content = update_data.pop("csv_content", None)
+    stored = None
+    previous = None
+    if pdf_base64 or csv_content:
+        # Trava a linha até o UPDATE: o arquivo anterior só é liberado depois
+        # dele, e um DELETE concorrente espera em vez de sumir com a entrada.
+        existing = await fetch_one(
+            select(
+                curriculum_files.c.file_name,
+                curriculum_files.c.storage_backend,
+                curriculum_files.c.storage_key,
+            )
+            .where(curriculum_files.c.id == curriculum_id)
+            .with_for_update()
+        )
+        if existing is None:
+            raise not_found
+        previous = (existing["storage_backend"], existing["storage_key"])
+        stored = await store_payload_content(pdf_base64, csv_content)
+        file_name = update_data.get("file_name") or existing["file_name"]
+        update_data.update(stored_file_values(file_name, stored))
+    elif update_data.get("file_name"):
+        update_data["content_type"] = content_type_for(update_data["file_name"])
     if not update_data:
-        return existing
+        entry = await fetch_one(
+            curriculum_files.select().where(curriculum_files.c.id == curriculum_id)
+        )
+        if entry is None:
+            raise not_found
+        return serialize_curriculum(entry)
 
     update_query = (
         curriculum_files.update()
@@ -175,7 +431,17 @@ async def update_curriculum_entry(
         .values(update_data)
         .returning(curriculum_files)
     )
-    updated = await fetch_one(update_query, commit_after=True)
+    try:
+        version = await bump_version(curriculum_files)
+        updated = await write_returning(update_query.values(version=version), not_found)
+    except Exception:
+        if stored is not None:
+            await release_stored_file(stored.backend, stored.key)
+        raise
+    invalidate(CACHE_NAMESPACE)
+    purge("curriculum/list", "curriculum/latest", f"curriculum/{curriculum_id}")
+    if stored is not None and (stored.backend, stored.key) != previous:
+        await release_stored_file(*previous)
     return serialize_curriculum(updated)
 
 
@@ -184,50 +450,23 @@ async def delete_curriculum_entry(
     curriculum_id: int,
     _: dict = Depends(get_current_admin_user),
 ):
-    select_query = curriculum_files.select().where(
-        curriculum_files.c.id == curriculum_id
+    delete_query = (
+        curriculum_files.delete()
+        .where(curriculum_files.c.id == curriculum_id)
+        .returning(curriculum_files.c.storage_backend, curriculum_files.c.storage_key)
     )
-    if not await fetch_one(select_query):
+    deleted = await fetch_one(delete_query)
+    if deleted is None:
+        # Nada foi escrito; a transação é desfeita no fim do request
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Curriculum entry not found",
         )
+    await record_deletion(curriculum_files, curriculum_id, commit_after=False)
+    # O FK zera o ponteiro se este era o publicado; o refresh escolhe o
+    # próximo na mesma transação, sem janela em que /latest dá 404.
+    await execute(refresh_latest_statement(), commit_after=True)
+    invalidate(CACHE_NAMESPACE)
+    purge("curriculum/list", "curriculum/latest", f"curriculum/{curriculum_id}")
+    await release_stored_file(deleted["storage_backend"], deleted["storage_key"])
 
-    delete_query = curriculum_files.delete().where(
-        curriculum_files.c.id == curriculum_id
-    )
-    await execute(delete_query, commit_after=True)
-
-
-def build_file_response(entry: Dict) -> StreamingResponse:
-    record = dict(entry)
-    filename = record.get("file_name") or "curriculum.csv"
-    stored_content = record.get("csv_content") or ""
-    is_pdf = filename.lower().endswith(".pdf")
-
-    if is_pdf:
-        try:
-            file_bytes = base64.b64decode(stored_content, validate=True)
-        except (base64.binascii.Error, TypeError):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Arquivo PDF inválido armazenado.",
-            )
-        media_type = "application/pdf"
-    else:
-        file_bytes = stored_content.encode("utf-8")
-        media_type = "text/csv; charset=utf-8"
-
-    async def file_iterator() -> AsyncIterator[bytes]:
-        yield file_bytes
-
-    headers = {
-        "Content-Disposition": f'attachment; filename="{filename}"',
-        "Content-Type": media_type,
-    }
-
-    return StreamingResponse(
-        file_iterator(),
-        media_type=media_type,
-        headers=headers,
-    )
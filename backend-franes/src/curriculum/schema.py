@@ -42,8 +42,9 @@ class CurriculumUpdate(BaseModel):
 
 class Curriculum(CurriculumBase):
     id: int
-    csv_content: str | None = None
-    pdf_base64: str | None = None
+    content_type: str
+    size_bytes: int
+    content_sha256: str
     pdf_url: str | None = None
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,211 @@
+import hashlib
+import os
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator
+
+import anyio
+from sqlalchemy import select
+
+from src.config import settings
+from src.curriculum.models import curriculum_file_chunks
+from src.database import engine
+
+# Faz parte do formato gravado: o backend "database" calcula offsets de
+# Range a partir dele, então não deve mudar sem migrar os chunks existentes.
+CHUNK_SIZE = 256 * 1024
+
+
+class FileTooLarge(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    backend: str
+    key: str
+    size: int
+    sha256: str
+
+
+class _DigestingReader:
+    """Repassa os chunks recebidos calculando tamanho e SHA-256 no caminho."""
+
+    def __init__(self, chunks: AsyncIterable[bytes], max_size: int | None) -> None:
+        self._chunks = chunks
+        self._max_size = max_size
+        self.size = 0
+        self.digest = hashlib.sha256()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.size += len(chunk)
+            if self._max_size is not None and self.size > self._max_size:
+                raise FileTooLarge()
+            self.digest.update(chunk)
+            yield chunk
+
+
+async def _rechunk(chunks: AsyncIterable[bytes], size: int) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+class FileStorage(ABC):
+    """Interface comum dos backends onde os arquivos de currículo são guardados.
+
+    ``open`` devolve os bytes em pedaços de até ``CHUNK_SIZE``, opcionalmente
+    limitados ao intervalo ``[start, end]`` (inclusivo, como no header Range).
+    """
+
+    name: str
+
+    @abstractmethod
+    async def save(
+        self, chunks: AsyncIterable[bytes], max_size: int | None = None
+    ) -> StoredFile: ...
+
+    @abstractmethod
+    def open(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    async def save_bytes(self, data: bytes) -> StoredFile:
+        return await self.save(_single_chunk(data))
+
+
+class LocalFileStorage(FileStorage):
+    """Diretório endereçado por conteúdo: a chave é o SHA-256 do arquivo.
+
+    Também serve de substituto local para um object storage.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        self.root = Path(root)
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    async def save(
+        self, chunks: AsyncIterable[bytes], max_size: int | None = None
+    ) -> StoredFile:
+        tmp_dir = self.root / "tmp"
+        await anyio.Path(tmp_dir).mkdir(parents=True, exist_ok=True)
+        tmp_path = tmp_dir / uuid.uuid4().hex
+
+        reader = _DigestingReader(chunks, max_size)
+        try:
+            async with await anyio.open_file(tmp_path, "wb") as file:
+                async for chunk in reader:
+                    await file.write(chunk)
+
+            key = reader.digest.hexdigest()
+            final_path = self.path_for(key)
+            await anyio.Path(final_path.parent).mkdir(parents=True, exist_ok=True)
+            await anyio.to_thread.run_sync(os.replace, tmp_path, final_path)
+        finally:
+            await anyio.Path(tmp_path).unlink(missing_ok=True)
+
+        return StoredFile(self.name, key, reader.size, key)
+
+    async def open(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        remaining = None if end is None else end - start + 1
+        async with await anyio.open_file(self.path_for(key), "rb") as file:
+            if start:
+                await file.seek(start)
+            while remaining is None or remaining > 0:
+                size = CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+                chunk = await file.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def delete(self, key: str) -> None:
+        await anyio.Path(self.path_for(key)).unlink(missing_ok=True)
+
+
+class DatabaseFileStorage(FileStorage):
+    """Guarda os bytes em ``curriculum_file_chunks`` como bytea em pedaços fixos."""
+
+    name = "database"
+
+    async def save(
+        self, chunks: AsyncIterable[bytes], max_size: int | None = None
+    ) -> StoredFile:
+        key = uuid.uuid4().hex
+        reader = _DigestingReader(chunks, max_size)
+        async with engine.begin() as connection:
+            seq = 0
+            async for chunk in _rechunk(reader, CHUNK_SIZE):
+                await connection.execute(
+                    curriculum_file_chunks.insert().values(
+                        file_key=key, seq=seq, data=chunk
+                    )
+                )
+                seq += 1
+
+        return StoredFile(self.name, key, reader.size, reader.digest.hexdigest())
+
+    async def open(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        query = (
+            select(curriculum_file_chunks.c.seq, curriculum_file_chunks.c.data)
+            .where(
+                curriculum_file_chunks.c.file_key == key,
+                curriculum_file_chunks.c.seq >= start // CHUNK_SIZE,
+            )
+            .order_by(curriculum_file_chunks.c.seq)
+        )
+        if end is not None:
+            query = query.where(curriculum_file_chunks.c.seq <= end // CHUNK_SIZE)
+
+        async with engine.connect() as connection:
+            result = await connection.stream(query)
+            async for seq, data in result:
+                offset = seq * CHUNK_SIZE
+                lower = max(start - offset, 0)
+                upper = len(data) if end is None else min(end - offset + 1, len(data))
+                yield data[lower:upper]
+
+    async def delete(self, key: str) -> None:
+        async with engine.begin() as connection:
+            await connection.execute(
+                curriculum_file_chunks.delete().where(
+                    curriculum_file_chunks.c.file_key == key
+                )
+            )
+
+
+def get_storage(name: str | None = None) -> FileStorage:
+    """Backend pelo nome gravado na linha, ou o configurado para novos uploads."""
+    name = name or settings.CURRICULUM_STORAGE_BACKEND
+    if name == LocalFileStorage.name:
+        return LocalFileStorage(settings.CURRICULUM_STORAGE_PATH)
+    if name == DatabaseFileStorage.name:
+        return DatabaseFileStorage()
+
+    raise ValueError(f"Unknown curriculum storage backend: {name}")
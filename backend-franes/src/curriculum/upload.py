@@ -0,0 +1,127 @@
+from typing import AsyncIterable, AsyncIterator, Mapping
+
+try:
+    from python_multipart.exceptions import MultipartParseError
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ModuleNotFoundError:  # python-multipart < 0.0.13
+    from multipart.exceptions import MultipartParseError
+    from multipart.multipart import MultipartParser, parse_options_header
+
+FILE_FIELD = "file"
+# Os campos de texto do formulário (título, descrição, nome do arquivo) são
+# curtos; tudo o que passar disso é rejeitado antes de chegar ao banco.
+MAX_FIELD_SIZE = 4 * 1024
+
+
+class InvalidUpload(Exception):
+    pass
+
+
+class MultipartUpload:
+    """Lê um corpo ``multipart/form-data`` repassando o arquivo conforme chega.
+
+    Os bytes da parte ``file`` saem por :meth:`file_chunks` à medida que o
+    corpo é lido, sem juntar o documento em memória nem em arquivo temporário.
+    Os demais campos ficam em ``fields`` e só estão completos depois que o
+    iterador termina, já que podem vir antes ou depois do arquivo.
+    """
+
+    def __init__(
+        self, headers: Mapping[str, str], stream: AsyncIterable[bytes]
+    ) -> None:
+        content_type, params = parse_options_header(headers.get("content-type"))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise InvalidUpload("Envie o arquivo como multipart/form-data.")
+
+        self._stream = stream
+        self._parser = MultipartParser(
+            params[b"boundary"],
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_end": self._on_part_end,
+                "on_end": self._on_end,
+            },
+        )
+        self.fields: dict[str, str] = {}
+        self.file_name: str | None = None
+        self._pending: list[bytes] = []
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._field_name: str | None = None
+        self._field_data = bytearray()
+        self._in_file = False
+        self._ended = False
+
+    async def file_chunks(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                self._parser.write(chunk)
+                if self._pending:
+                    data = b"".join(self._pending)
+                    self._pending.clear()
+                    yield data
+            self._parser.finalize()
+        except MultipartParseError:
+            raise InvalidUpload("Corpo multipart malformado.")
+
+        # Sem o boundary final o corpo foi cortado no meio do caminho
+        if not self._ended:
+            raise InvalidUpload("Corpo multipart incompleto.")
+        if self.file_name is None:
+            raise InvalidUpload("Nenhum arquivo enviado no campo 'file'.")
+
+    def _on_part_begin(self) -> None:
+        self._disposition = b""
+        self._field_name = None
+        self._field_data.clear()
+        self._in_file = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_name.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        if b"name" not in options:
+            raise InvalidUpload("Parte do formulário sem nome.")
+
+        self._field_name = options[b"name"].decode("utf-8", errors="replace")
+        if b"filename" not in options:
+            return
+        if self._field_name != FILE_FIELD or self.file_name is not None:
+            raise InvalidUpload("Envie um único arquivo no campo 'file'.")
+
+        self.file_name = options[b"filename"].decode("utf-8", errors="replace")
+        self._in_file = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._pending.append(data[start:end])
+            return
+
+        self._field_data += data[start:end]
+        if len(self._field_data) > MAX_FIELD_SIZE:
+            raise InvalidUpload(f"Campo '{self._field_name}' muito grande.")
+
+    def _on_part_end(self) -> None:
+        if not self._in_file:
+            self.fields[self._field_name] = self._field_data.decode(
+                "utf-8", errors="replace"
+            )
+
+    def _on_end(self) -> None:
+        self._ended = True
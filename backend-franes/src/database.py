@@ -1,18 +1,32 @@
+import base64
+import json
 import ssl
-from typing import Any
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, AsyncGenerator, AsyncIterator
 
+from fastapi import Request
 from sqlalchemy import (
     CursorResult,
+    Delete,
     Insert,
     MetaData,
     Select,
+    Table,
     Update,
+    tuple_,
 )
 from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
 from sqlalchemy.engine import make_url
 
 from src.config import settings
 from src.constants import DB_NAMING_CONVENTION
+from src.metrics import db_timer
+from src.pool_metrics import PoolMetrics
+from src.query_log import current_route, query_log
+from src.timing import phase
 
 async_url = make_url(str(settings.DATABASE_ASYNC_URL))
 query = dict(async_url.query)
@@ -29,69 +43,238 @@ if settings.DATABASE_SSL_MODE and settings.DATABASE_SSL_MODE.lower() != "disable
 engine = create_async_engine(
     DATABASE_URL,
     pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_POOL_MAX_OVERFLOW,
     pool_recycle=settings.DATABASE_POOL_TTL,
     pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
     connect_args=connect_args,
 )
 metadata = MetaData(naming_convention=DB_NAMING_CONVENTION)
 
+pool_metrics = PoolMetrics(recycle_seconds=settings.DATABASE_POOL_TTL)
+pool_metrics.install(engine.sync_engine.pool)
+
+
+async def _checkout() -> AsyncConnection:
+    """``engine.connect()`` timing how long the pool took to hand it over."""
+    started = time.perf_counter()
+    connection = await engine.connect()
+    pool_metrics.observe_checkout(time.perf_counter() - started)
+    return connection
+
+
+class LazyConnection:
+    """Request-scoped connection, checked out of the pool on first use only.
+
+    Every helper call in the request shares it, so reads and the write that
+    follows them run on one connection; requests answered from the cache
+    never touch the pool. Anything not committed is rolled back on close.
+    """
+
+    def __init__(self) -> None:
+        self._connection: AsyncConnection | None = None
+
+    @property
+    def checked_out(self) -> bool:
+        return self._connection is not None
+
+    async def get(self) -> AsyncConnection:
+        if self._connection is None:
+            self._connection = await _checkout()
+        return self._connection
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+
+_request_connection: ContextVar[LazyConnection | None] = ContextVar(
+    "request_connection", default=None
+)
+
+
+async def get_db_connection(
+    request: Request = None,
+) -> AsyncGenerator[LazyConnection, None]:
+    """Dependency that installs the request's :class:`LazyConnection`."""
+    lazy = _request_connection.get()
+    if lazy is not None:
+        yield lazy
+        return
+
+    route = getattr(request.scope.get("route"), "path", None) if request else None
+    lazy = LazyConnection()
+    token = _request_connection.set(lazy)
+    route_token = current_route.set(route)
+    try:
+        yield lazy
+    finally:
+        current_route.reset(route_token)
+        _request_connection.reset(token)
+        await lazy.close()
+
+
+@asynccontextmanager
+async def _connection_for(
+    connection: AsyncConnection | None,
+) -> AsyncIterator[AsyncConnection]:
+    if connection is not None:
+        yield connection
+        return
+
+    lazy = _request_connection.get()
+    if lazy is not None:
+        shared = await lazy.get()
+        try:
+            yield shared
+        except Exception:
+            # Keeps the shared connection usable for the rest of the request.
+            if shared.in_transaction():
+                await shared.rollback()
+            raise
+        return
+
+    connection = await _checkout()
+    try:
+        yield connection
+    finally:
+        await connection.close()
+
 
 async def fetch_one(
-    select_query: Select | Insert | Update,
+    select_query: Select | Insert | Update | Delete,
     connection: AsyncConnection | None = None,
     commit_after: bool = False,
 ) -> dict[str, Any] | None:
-    if not connection:
-        async with engine.connect() as connection:
+    with db_timer("fetch_one"), phase("db"):
+        async with _connection_for(connection) as connection:
             cursor = await _execute_query(select_query, connection, commit_after)
             return cursor.first()._asdict() if cursor.rowcount > 0 else None
 
-    cursor = await _execute_query(select_query, connection, commit_after)
-    return cursor.first()._asdict() if cursor.rowcount > 0 else None
-
 
 async def fetch_all(
-    select_query: Select | Insert | Update,
+    select_query: Select | Insert | Update | Delete,
     connection: AsyncConnection | None = None,
     commit_after: bool = False,
+    parameters: list[dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
-    if not connection:
-        async with engine.connect() as connection:
-            cursor = await _execute_query(select_query, connection, commit_after)
-            return [r._asdict() for r in cursor.all()]
+    """Run a query and return every row.
 
-    cursor = await _execute_query(select_query, connection, commit_after)
-    return [r._asdict() for r in cursor.all()]
+    With ``parameters`` it runs as an executemany; for ``INSERT ...
+    RETURNING`` SQLAlchemy batches the rows into multi-row ``VALUES``
+    statements and returns all of them.
+    """
+    with db_timer("fetch_all"), phase("db"):
+        async with _connection_for(connection) as connection:
+            cursor = await _execute_query(
+                select_query, connection, commit_after, parameters
+            )
+            return [r._asdict() for r in cursor.all()]
 
 
 async def execute(
-    query: Insert | Update,
-    connection: AsyncConnection = None,
+    query: Insert | Update | Delete,
+    connection: AsyncConnection | None = None,
     commit_after: bool = False,
 ) -> None:
-    if not connection:
-        async with engine.connect() as connection:
+    with db_timer("execute"), phase("db"):
+        async with _connection_for(connection) as connection:
             await _execute_query(query, connection, commit_after)
-            return
 
-    await _execute_query(query, connection, commit_after)
+
+async def write_returning(
+    query: Update | Delete,
+    not_found: Exception,
+    connection: AsyncConnection | None = None,
+) -> dict[str, Any]:
+    """Roda um ``UPDATE``/``DELETE ... RETURNING`` e só faz commit se casou.
+
+    Sem linha, ``not_found`` sobe de dentro da transação, que é desfeita
+    junto com o que veio antes dela no request (ex.: o bump de versão).
+    """
+    with db_timer("write_returning"), phase("db"):
+        async with _connection_for(connection) as connection:
+            cursor = await _execute_query(query, connection)
+            row = cursor.first()
+            if row is None:
+                raise not_found
+            await connection.commit()
+            return row._asdict()
+
+
+async def fetch_page(
+    select_query: Select,
+    table: Table,
+    limit: int,
+    after: str | None = None,
+    connection: AsyncConnection | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Fetch one keyset page ordered by ``(created_at, id)`` descending.
+
+    Returns the rows and the opaque cursor for the next page, or ``None``
+    when there is nothing left to read.
+    """
+    query = keyset_page_query(select_query, table, limit, after)
+    rows = await fetch_all(query, connection)
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last_row = rows[-1]
+    return rows, encode_cursor(last_row["created_at"], last_row["id"])
+
+
+def keyset_page_query(
+    select_query: Select, table: Table, limit: int, after: str | None = None
+) -> Select:
+    """The query :func:`fetch_page` runs, with one extra row to detect more.
+
+    Served by the ``<table>_created_at_idx`` index on ``(created_at, id)``,
+    scanned backwards.
+    """
+    order_columns = (table.c.created_at, table.c.id)
+    query = select_query.order_by(*(column.desc() for column in order_columns))
+    if after is not None:
+        query = query.where(tuple_(*order_columns) < tuple_(*decode_cursor(after)))
+    return query.limit(limit + 1)
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of :func:`encode_cursor`; raises ``ValueError`` on bad input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        created_at = datetime.fromisoformat(raw_created_at)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+    if not isinstance(row_id, int) or isinstance(row_id, bool):
+        raise ValueError("Invalid pagination cursor")
+    # As colunas são naive; comparar com um datetime com fuso quebra no asyncpg
+    if created_at.tzinfo is not None:
+        raise ValueError("Invalid pagination cursor")
+
+    return created_at, row_id
 
 
 async def _execute_query(
-    query: Select | Insert | Update,
+    query: Select | Insert | Update | Delete,
     connection: AsyncConnection,
     commit_after: bool = False,
+    parameters: list[dict[str, Any]] | None = None,
 ) -> CursorResult:
-    result = await connection.execute(query)
+    started = time.perf_counter()
+    if parameters is None:
+        result = await connection.execute(query)
+    else:
+        result = await connection.execute(query, parameters)
+    await query_log.record(result, time.perf_counter() - started, connection)
     if commit_after:
         await connection.commit()
 
     return result
-
-# se tirar da aviso
-async def get_db_connection() -> AsyncConnection: # type: ignore
-    connection = await engine.connect()
-    try:
-        yield connection
-    finally:
-        await connection.close()
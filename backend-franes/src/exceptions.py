@@ -25,9 +25,21 @@ class BadRequest(DetailedHTTPException):
     DETAIL = "Bad Request"
 
 
+class InvalidCursor(BadRequest):
+    DETAIL = "Invalid pagination cursor"
+
+
 class NotAuthenticated(DetailedHTTPException):
     STATUS_CODE = status.HTTP_401_UNAUTHORIZED
     DETAIL = "User not authenticated"
 
     def __init__(self) -> None:
         super().__init__(headers={"WWW-Authenticate": "Bearer"})
+
+
+class ServiceUnavailable(DetailedHTTPException):
+    STATUS_CODE = status.HTTP_503_SERVICE_UNAVAILABLE
+    DETAIL = "Server busy, try again later"
+
+    def __init__(self) -> None:
+        super().__init__(headers={"Retry-After": "1"})
@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+import httpx
+from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Atributo de request.state onde a rota deixa a política e as surrogate keys
+STATE_ATTRIBUTE = "http_cache"
+
+PURGE_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Quanto tempo browsers e CDN podem reaproveitar uma resposta pública."""
+
+    max_age: int
+    stale_while_revalidate: int = 0
+
+    def cache_control(self) -> str:
+        directives = ["public", f"max-age={self.max_age}"]
+        if settings.HTTP_CACHE_EDGE_MODE:
+            # O CDN segura a resposta até um purge; browsers seguem o max-age
+            directives.append(f"s-maxage={settings.HTTP_CACHE_EDGE_MAX_AGE}")
+        if self.stale_while_revalidate:
+            directives.append(
+                f"stale-while-revalidate={self.stale_while_revalidate}"
+            )
+        return ", ".join(directives)
+
+
+def public_cache(policy: CachePolicy, *keys: str) -> Callable[[Request], None]:
+    """Dependência que marca a rota como cacheável por browsers e CDN.
+
+    ``keys`` são as surrogate keys da resposta e aceitam os path params da
+    rota (``"blog/{post_id}"``); ``purge`` com as mesmas keys derruba a
+    resposta no CDN.
+    """
+
+    def mark_public(request: Request) -> None:
+        surrogate_keys = [key.format(**request.path_params) for key in keys]
+        setattr(request.state, STATE_ATTRIBUTE, (policy, surrogate_keys))
+
+    return mark_public
+
+
+def weak_etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Comparação fraca do If-None-Match, como manda a RFC 9110."""
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+_pending_purges: set[asyncio.Task] = set()
+
+
+def purge(*keys: str) -> None:
+    """Pede ao CDN, em segundo plano, para descartar as respostas com ``keys``.
+
+    Sem ``HTTP_CACHE_PURGE_URL`` não faz nada: as respostas expiram pelo
+    ``Cache-Control``.
+    """
+    if not settings.HTTP_CACHE_PURGE_URL or not keys:
+        return
+
+    task = asyncio.get_running_loop().create_task(
+        _send_purge(list(dict.fromkeys(keys)))
+    )
+    _pending_purges.add(task)
+    task.add_done_callback(_pending_purges.discard)
+
+
+async def _send_purge(keys: list[str]) -> None:
+    headers = {settings.HTTP_CACHE_SURROGATE_KEY_HEADER: " ".join(keys)}
+    if settings.HTTP_CACHE_PURGE_TOKEN:
+        headers["Authorization"] = f"Bearer {settings.HTTP_CACHE_PURGE_TOKEN}"
+    try:
+        async with httpx.AsyncClient(timeout=PURGE_TIMEOUT_SECONDS) as client:
+            response = await client.post(settings.HTTP_CACHE_PURGE_URL, headers=headers)
+            response.raise_for_status()
+    except httpx.HTTPError:
+        logger.exception("edge purge failed for %s", " ".join(keys))
+
+
+def _uncacheable(cache_control: str) -> bool:
+    directives = {
+        directive.split("=")[0].strip().lower()
+        for directive in cache_control.split(",")
+    }
+    return not directives.isdisjoint({"no-store", "private"})
+
+
+class HttpCacheMiddleware:
+    """Middleware ASGI que aplica a política das rotas marcadas com ``public_cache``.
+
+    Respostas 200/304 de GET ganham ``Cache-Control``, surrogate keys e, se a
+    rota ainda não definiu um, um ETag fraco do corpo; um ``If-None-Match``
+    que bate vira 304 sem corpo. Downloads por streaming já trazem o próprio
+    ETag e passam só com os headers. Fica por dentro da compressão, então o
+    ETag é sempre o do corpo sem compressão. Respostas que já se declaram
+    ``no-store`` ou ``private`` (o dump de um request perfilado, por exemplo)
+    passam intactas.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not settings.HTTP_CACHE_ENABLED
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                marked = scope.get("state", {}).get(STATE_ATTRIBUTE)
+                headers = MutableHeaders(scope=message)
+                if (
+                    message["status"] not in (200, 304)
+                    or marked is None
+                    or _uncacheable(headers.get("cache-control", ""))
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                policy, surrogate_keys = marked
+                headers["Cache-Control"] = policy.cache_control()
+                if surrogate_keys:
+                    headers[settings.HTTP_CACHE_SURROGATE_KEY_HEADER] = " ".join(
+                        surrogate_keys
+                    )
+                if "etag" in headers or message["status"] == 304:
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if message.get("more_body", False):
+                # Corpo em streaming: sai sem ETag
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            etag = weak_etag(body)
+            headers = MutableHeaders(scope=start)
+            headers["ETag"] = etag
+            if if_none_match and etag_matches(if_none_match, etag):
+                start["status"] = 304
+                for name in ("content-length", "content-type"):
+                    if name in headers:
+                        del headers[name]
+                body = b""
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
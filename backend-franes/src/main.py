@@ -1,18 +1,37 @@
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from datetime import timedelta
+from typing import Any, AsyncGenerator
 
 import sentry_sdk
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from src.admin.router import router as admin_users_router
 from src.art.router import router as art
+from src.auth.dependencies import create_access_token, get_current_admin_user
 from src.auth.router import router as auth_router
 from src.blog.router import router as blog_router
+from src.cache import cache
+from src.compression import CompressionMiddleware
 from src.config import app_configs, settings
+from src.curriculum.router import refresh_latest_statement
 from src.curriculum.router import router as curriculum_router
-from src.database import engine, metadata
+from src.database import engine, metadata, pool_metrics
+from src.http_cache import HttpCacheMiddleware
+from src.metrics import METRICS_PATH, PrometheusMiddleware
+from src.metrics import render as render_metrics
+from src.pagination import NEXT_CURSOR_HEADER
+from src.query_log import query_log
+from src.search.router import router as search_router
 from src.story_script.router import router as story_script
+from src.sync.router import router as sync_router
+from src.timing import (
+    SERVER_TIMING_HEADER,
+    ServerTimingMiddleware,
+    profile_subject,
+)
+from src.versions.router import router as versions_router
 
 
 @asynccontextmanager
@@ -20,11 +39,18 @@ async def lifespan(_application: FastAPI) -> AsyncGenerator:
     if settings.ENVIRONMENT.is_debug:
         async with engine.begin() as connection:
             await connection.run_sync(metadata.create_all)
+            # Em produção a migração preenche o ponteiro; aqui, create_all
+            # pode ter criado curriculum_latest vazia ao lado de dados antigos.
+            await connection.execute(refresh_latest_statement())
     yield
     # Shutdown
 
 
-app = FastAPI(**app_configs, lifespan=lifespan)
+app = FastAPI(
+    **app_configs,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -33,8 +59,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"),
     allow_headers=settings.CORS_HEADERS,
+    expose_headers=(
+        NEXT_CURSOR_HEADER,
+        "ETag",
+        "Last-Modified",
+        "Accept-Ranges",
+        "Content-Range",
+        SERVER_TIMING_HEADER,
+    ),
 )
 
+app.add_middleware(PrometheusMiddleware, pool_gauges=pool_metrics.gauges)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(HttpCacheMiddleware)
+app.add_middleware(CompressionMiddleware)
+
 if settings.ENVIRONMENT.is_deployed:
     sentry_sdk.init(
         dsn=settings.SENTRY_DSN,
@@ -46,9 +85,53 @@ if settings.ENVIRONMENT.is_deployed:
 async def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
 
+
+@app.get(METRICS_PATH, include_in_schema=False)
+async def metrics() -> Response:
+    return render_metrics()
+
+
+@app.get("/cache/stats", include_in_schema=False)
+async def cache_stats(
+    _: dict = Depends(get_current_admin_user),
+) -> dict[str, int]:
+    return cache.stats()
+
+
+@app.get("/pool/stats", include_in_schema=False)
+async def pool_stats(
+    _: dict = Depends(get_current_admin_user),
+) -> dict[str, Any]:
+    return pool_metrics.snapshot()
+
+
+@app.get("/queries/stats", include_in_schema=False)
+async def query_stats(
+    _: dict = Depends(get_current_admin_user),
+) -> list[dict[str, Any]]:
+    return query_log.snapshot()
+
+
+@app.post("/profiling/token", include_in_schema=False)
+async def profiling_token(
+    user: dict = Depends(get_current_admin_user),
+) -> dict[str, str]:
+    """Token curto para perfilar requests via header X-Profile-Token."""
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    token = create_access_token(
+        subject=profile_subject(user["id"]),
+        expires_delta=timedelta(minutes=settings.PROFILE_TOKEN_EXPIRE_MINUTES),
+    )
+    return {"profile_token": token}
+
 app.include_router(blog_router)
 app.include_router(story_script)
+app.include_router(search_router)
 app.include_router(art)
 app.include_router(curriculum_router)
+app.include_router(versions_router)
+app.include_router(sync_router)
 app.include_router(auth_router)
 app.include_router(admin_users_router)
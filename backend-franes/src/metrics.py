@@ -0,0 +1,171 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from fastapi import Response, status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess,
+    )
+except ImportError:  # prometheus-client só vem no grupo prod
+    Histogram = None
+
+METRICS_PATH = "/metrics"
+
+# Limites (em segundos) dos histogramas do pool; o último bucket é +Inf.
+POOL_CHECKOUT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+POOL_LIFETIME_BUCKETS = (1, 10, 60, 300, 600, 1200, 1800, 3600, 7200)
+
+if Histogram is not None:
+    REQUEST_DURATION = Histogram(
+        "http_request_duration_seconds",
+        "Tempo de resposta por rota.",
+        ("method", "route", "status"),
+    )
+    REQUESTS_IN_PROGRESS = Gauge(
+        "http_requests_in_progress",
+        "Requisições sendo atendidas agora.",
+        ("method",),
+        multiprocess_mode="livesum",
+    )
+    RESPONSE_SIZE = Histogram(
+        "http_response_size_bytes",
+        "Tamanho do corpo das respostas por rota.",
+        ("route",),
+        buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    )
+    DB_QUERY_DURATION = Histogram(
+        "db_query_duration_seconds",
+        "Tempo de cada chamada aos helpers de src.database, com checkout.",
+        ("helper",),
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+    )
+    DB_POOL_CHECKOUT_DURATION = Histogram(
+        "db_pool_checkout_duration_seconds",
+        "Espera por uma conexão do pool, com o pre-ping.",
+        buckets=POOL_CHECKOUT_BUCKETS,
+    )
+    DB_POOL_CONNECTION_LIFETIME = Histogram(
+        "db_pool_connection_lifetime_seconds",
+        "Tempo de vida das conexões fechadas pelo pool.",
+        buckets=POOL_LIFETIME_BUCKETS,
+    )
+    DB_POOL_EVENTS = Counter(
+        "db_pool_connection_events",
+        "Conexões abertas, fechadas, recicladas e invalidadas pelo pool.",
+        ("event",),
+    )
+    DB_POOL_CONNECTIONS = Gauge(
+        "db_pool_connections",
+        "Conexões do pool por estado, atualizadas a cada requisição.",
+        ("state",),
+        multiprocess_mode="livesum",
+    )
+
+
+def enabled() -> bool:
+    return settings.METRICS_ENABLED and Histogram is not None
+
+
+@contextmanager
+def db_timer(helper: str) -> Iterator[None]:
+    if not enabled():
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        DB_QUERY_DURATION.labels(helper).observe(time.perf_counter() - started)
+
+
+def histogram_snapshot(histogram: Any) -> dict[str, Any]:
+    """Buckets acumulados, soma e contagem de um histograma sem labels.
+
+    Lê só o processo atual, mesmo em modo multiprocess.
+    """
+    snapshot: dict[str, Any] = {"buckets": {}, "sum": 0.0, "count": 0}
+    for metric in histogram.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_bucket"):
+                snapshot["buckets"][sample.labels["le"]] = int(sample.value)
+            elif sample.name.endswith("_sum"):
+                snapshot["sum"] = sample.value
+            elif sample.name.endswith("_count"):
+                snapshot["count"] = int(sample.value)
+    return snapshot
+
+
+class PrometheusMiddleware:
+    """Middleware ASGI que mede latência, tamanho e concorrência por rota.
+
+    A rota é o template do path (``/blog/{post_id}``), não a URL, para não
+    explodir a cardinalidade das séries. ``pool_gauges`` (ex.:
+    ``pool_metrics.gauges``) alimenta ``db_pool_connections`` no fim de cada
+    requisição.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        pool_gauges: Callable[[], dict[str, int]] | None = None,
+    ) -> None:
+        self.app = app
+        self.pool_gauges = pool_gauges
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not enabled() or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.labels(method, route, str(status_code)).observe(elapsed)
+            RESPONSE_SIZE.labels(route).observe(size)
+            if self.pool_gauges is not None:
+                for state, value in self.pool_gauges().items():
+                    DB_POOL_CONNECTIONS.labels(state).set(value)
+
+
+def render() -> Response:
+    """Expõe as métricas; com Gunicorn, soma as de todos os workers."""
+    if not enabled():
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
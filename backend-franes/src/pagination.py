@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from fastapi import Query, Response
+
+from src.config import settings
+from src.database import decode_cursor
+from src.exceptions import InvalidCursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class PageParams:
+    limit: int
+    after: str | None = None
+
+
+def page_params(
+    limit: int = Query(
+        default=settings.PAGINATION_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.PAGINATION_MAX_LIMIT,
+    ),
+    after: str | None = Query(default=None, max_length=200),
+) -> PageParams:
+    if after is not None:
+        try:
+            decode_cursor(after)
+        except ValueError:
+            raise InvalidCursor()
+
+    return PageParams(limit=limit, after=after)
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    """Expose the cursor of the following page, if any, as a response header."""
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,93 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+from src import metrics
+
+
+class PoolMetrics:
+    """Contadores e histogramas do pool de conexões do processo atual.
+
+    Os eventos do SQLAlchemy alimentam aberturas, fechamentos, reciclagens e
+    invalidações (inclusive falhas de pre-ping); o tempo de checkout é medido
+    por ``src.database`` em volta de ``engine.connect()``, que inclui a espera
+    por uma conexão livre e o pre-ping. Os eventos vão para o contador
+    ``db_pool_connection_events`` e checkout e tempo de vida para os
+    histogramas do Prometheus em ``src.metrics``; todos saem em ``/metrics``.
+    """
+
+    def __init__(self, recycle_seconds: float) -> None:
+        self.recycle_seconds = recycle_seconds
+        self.opened = 0
+        self.closed = 0
+        self.recycled = 0
+        self.invalidated = 0
+        self._pool: Pool | None = None
+
+    def install(self, pool: Pool) -> None:
+        self._pool = pool
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "close", self._on_close)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        event.listen(pool, "soft_invalidate", self._on_invalidate)
+
+    def observe_checkout(self, seconds: float) -> None:
+        if metrics.enabled():
+            metrics.DB_POOL_CHECKOUT_DURATION.observe(seconds)
+
+    def _on_connect(self, _dbapi_connection, connection_record) -> None:
+        connection_record.info["connected_at"] = time.monotonic()
+        self.opened += 1
+        self._count("opened")
+
+    def _on_close(self, _dbapi_connection, connection_record) -> None:
+        self.closed += 1
+        self._count("closed")
+        connected_at = connection_record.info.pop("connected_at", None)
+        if connected_at is None:
+            return
+        lifetime = time.monotonic() - connected_at
+        if metrics.enabled():
+            metrics.DB_POOL_CONNECTION_LIFETIME.observe(lifetime)
+        if 0 < self.recycle_seconds <= lifetime:
+            self.recycled += 1
+            self._count("recycled")
+
+    def _on_invalidate(self, _dbapi_connection, _connection_record, _exc) -> None:
+        self.invalidated += 1
+        self._count("invalidated")
+
+    @staticmethod
+    def _count(event: str) -> None:
+        if metrics.enabled():
+            metrics.DB_POOL_EVENTS.labels(event).inc()
+
+    def gauges(self) -> dict[str, int]:
+        if self._pool is None:
+            return {}
+        pool = self._pool
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
+    def snapshot(self) -> dict[str, Any]:
+        snapshot = {
+            **self.gauges(),
+            "opened": self.opened,
+            "closed": self.closed,
+            "recycled": self.recycled,
+            "invalidated": self.invalidated,
+        }
+        if metrics.enabled():
+            snapshot["checkout_seconds"] = metrics.histogram_snapshot(
+                metrics.DB_POOL_CHECKOUT_DURATION
+            )
+            snapshot["lifetime_seconds"] = metrics.histogram_snapshot(
+                metrics.DB_POOL_CONNECTION_LIFETIME
+            )
+        return snapshot
@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from sqlalchemy import CursorResult
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Template da rota que está executando a consulta; definido por
+# src.database.get_db_connection.
+current_route: ContextVar[str | None] = ContextVar("current_route", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+MAX_FINGERPRINTS = 500
+
+
+@dataclass
+class QueryStats:
+    statement: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    rows: int = 0
+    slow: int = 0
+    last_route: str | None = None
+
+
+def fingerprint(statement: str) -> str:
+    """Identificador estável de um SQL já com placeholders no lugar dos valores."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+def redact(parameters: Any) -> str:
+    """Descreve os parâmetros só pelo tipo, sem nunca registrar os valores."""
+    if isinstance(parameters, dict):
+        return ", ".join(
+            f"{name}={type(value).__name__}" for name, value in parameters.items()
+        )
+    if isinstance(parameters, Sequence) and not isinstance(parameters, (str, bytes)):
+        return ", ".join(type(value).__name__ for value in parameters)
+    return type(parameters).__name__
+
+
+class QueryLog:
+    """Estatísticas por fingerprint e log das consultas lentas do processo."""
+
+    def __init__(self, max_fingerprints: int = MAX_FINGERPRINTS) -> None:
+        self.max_fingerprints = max_fingerprints
+        self._stats: OrderedDict[str, QueryStats] = OrderedDict()
+        self._explained: dict[str, float] = {}
+
+    async def record(
+        self, result: CursorResult, elapsed: float, connection: AsyncConnection
+    ) -> None:
+        context = getattr(result, "context", None)
+        statement = getattr(context, "statement", None)
+        if statement is None:
+            return
+
+        key = fingerprint(statement)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = QueryStats(_WHITESPACE.sub(" ", statement))
+            if len(self._stats) > self.max_fingerprints:
+                self._stats.popitem(last=False)
+        self._stats.move_to_end(key)
+
+        rows = max(result.rowcount, 0)
+        route = current_route.get()
+        stats.count += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.rows += rows
+        stats.last_route = route
+
+        if elapsed * 1000 < settings.DATABASE_SLOW_QUERY_MS:
+            return
+
+        stats.slow += 1
+        parameters = context.parameters[0] if context.parameters else ()
+        logger.warning(
+            "slow query %s: %.1f ms, %s rows, route=%s, params=[%s]: %s",
+            key,
+            elapsed * 1000,
+            rows,
+            route,
+            redact(parameters),
+            stats.statement,
+        )
+        if self._should_explain(key, stats.statement):
+            await self._explain(key, statement, parameters, connection)
+
+    def _should_explain(self, key: str, statement: str) -> bool:
+        # ANALYZE executa a consulta de novo: só SELECTs, fora de produção e
+        # no máximo uma vez por fingerprint a cada intervalo.
+        if not settings.DATABASE_EXPLAIN_SLOW_QUERIES:
+            return False
+        if not settings.ENVIRONMENT.is_debug:
+            return False
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return False
+        now = time.monotonic()
+        last = self._explained.get(key)
+        if last is not None and now - last < settings.DATABASE_EXPLAIN_INTERVAL:
+            return False
+        self._explained[key] = now
+        return True
+
+    async def _explain(
+        self,
+        key: str,
+        statement: str,
+        parameters: Any,
+        connection: AsyncConnection,
+    ) -> None:
+        try:
+            # O savepoint impede que uma falha aqui aborte a transação do request.
+            async with connection.begin_nested():
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                )
+                plan = "\n".join(row[0] for row in result)
+        except Exception:
+            logger.exception("EXPLAIN failed for slow query %s", key)
+            return
+
+        logger.warning("plan for slow query %s:\n%s", key, plan)
+
+    def snapshot(self, limit: int = 50) -> list[dict[str, Any]]:
+        """As ``limit`` consultas com mais tempo acumulado."""
+        ranked = sorted(
+            self._stats.items(), key=lambda item: item[1].total_seconds, reverse=True
+        )
+        return [
+            {
+                "fingerprint": key,
+                "statement": stats.statement,
+                "count": stats.count,
+                "total_ms": round(stats.total_seconds * 1000, 3),
+                "mean_ms": round(stats.total_seconds * 1000 / stats.count, 3),
+                "max_ms": round(stats.max_seconds * 1000, 3),
+                "rows": stats.rows,
+                "slow": stats.slow,
+                "last_route": stats.last_route,
+            }
+            for key, stats in ranked[:limit]
+        ]
+
+
+query_log = QueryLog()
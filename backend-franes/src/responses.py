@@ -0,0 +1,39 @@
+from typing import Any, Iterable, Mapping
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from src.config import settings
+from src.timing import phase
+
+
+def project(model: type[BaseModel], row: Mapping[str, Any]) -> dict[str, Any]:
+    """Mantém só as colunas que ``model`` expõe, como o response_model faria."""
+    return {name: row.get(name) for name in model.model_fields}
+
+
+def trusted_rows(
+    model: type[BaseModel],
+    content: Mapping[str, Any] | Iterable[Mapping[str, Any]],
+    response: Response | None = None,
+    status_code: int = 200,
+) -> Any:
+    """Serializa linhas lidas do nosso banco sem revalidá-las pelo pydantic.
+
+    As linhas já passaram pelos schemas na escrita, então basta projetar os
+    campos do ``model`` e entregar ao orjson. Headers definidos em
+    ``response`` (ex.: X-Next-Cursor) são copiados para a resposta. Com
+    ``RESPONSE_TRUSTED_ROWS`` desligado o conteúdo volta intacto e segue o
+    caminho normal de validação do ``response_model``.
+    """
+    if not settings.RESPONSE_TRUSTED_ROWS:
+        return content
+
+    with phase("serialize"):
+        if isinstance(content, Mapping):
+            body: Any = project(model, content)
+        else:
+            body = [project(model, row) for row in content]
+        headers = dict(response.headers) if response is not None else None
+        return ORJSONResponse(body, status_code=status_code, headers=headers)
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.constants import TEXT_SEARCH_CONFIG
+
+SEARCH_VECTOR = "search_vector"
+
+
+def search_vector_expression(*weighted: tuple[str, str]) -> str:
+    """SQL do tsvector com peso por coluna, ex.: ``("title", "A")``."""
+    return " || ".join(
+        f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce({name}, '')),"
+        f" '{weight}')"
+        for name, weight in weighted
+    )
+
+
+def search_vector(*weighted: tuple[str, str]) -> Column:
+    """Coluna gerada (STORED) com o documento de busca da linha.
+
+    O Postgres a recalcula a cada INSERT/UPDATE, então nenhuma rota precisa
+    mantê-la; ela existe só para o índice GIN e o ranking de ``/search``.
+    """
+    return Column(
+        SEARCH_VECTOR,
+        TSVECTOR,
+        Computed(search_vector_expression(*weighted), persisted=True),
+    )
+
+
+def public_columns(table) -> tuple[Column, ...]:
+    """Colunas da tabela sem o ``search_vector``, que nunca sai na API."""
+    return tuple(column for column in table.c if column.name != SEARCH_VECTOR)
@@ -0,0 +1,159 @@
+import base64
+import html
+import json
+from typing import Any, List
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy import Select, String, func, literal, select, tuple_, union_all
+
+from src.blog.models import blog_posts
+from src.config import settings
+from src.constants import TEXT_SEARCH_CONFIG
+from src.database import fetch_all, get_db_connection
+from src.exceptions import InvalidCursor
+from src.pagination import PageParams, set_next_cursor
+from src.responses import trusted_rows
+from src.search.schemas import SearchKind, SearchResult
+from src.story_script.models import story_script
+from src.timing import TimedRoute
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
+)
+
+SOURCES = {
+    SearchKind.BLOG: blog_posts,
+    SearchKind.STORY_SCRIPT: story_script,
+}
+
+# O ts_headline não escapa HTML; os termos saem entre estes delimitadores e
+# viram <mark> só depois do escape do trecho.
+_START_SEL = "\x02"
+_STOP_SEL = "\x03"
+HEADLINE_OPTIONS = (
+    f'StartSel="{_START_SEL}", StopSel="{_STOP_SEL}", '
+    'MaxWords=25, MinWords=8, MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+
+def encode_search_cursor(rank: float, kind: str, row_id: int) -> str:
+    payload = json.dumps([rank, kind, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, str, int]:
+    """Inverso de :func:`encode_search_cursor`; ``ValueError`` se inválido."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, kind, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        SearchKind(kind)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid search cursor") from exc
+
+    if (
+        not isinstance(rank, (int, float))
+        or isinstance(rank, bool)
+        or not isinstance(row_id, int)
+        or isinstance(row_id, bool)
+    ):
+        raise ValueError("Invalid search cursor")
+
+    return float(rank), kind, row_id
+
+
+def search_page_params(
+    limit: int = Query(
+        default=settings.PAGINATION_DEFAULT_LIMIT,
+        ge=1,
+        le=settings.PAGINATION_MAX_LIMIT,
+    ),
+    after: str | None = Query(default=None, max_length=200),
+) -> PageParams:
+    if after is not None:
+        try:
+            decode_search_cursor(after)
+        except ValueError:
+            raise InvalidCursor()
+
+    return PageParams(limit=limit, after=after)
+
+
+def highlight(snippet: str) -> str:
+    escaped = html.escape(snippet, quote=False)
+    return escaped.replace(_START_SEL, "<mark>").replace(_STOP_SEL, "</mark>")
+
+
+def search_query(
+    text: str, kinds: list[SearchKind], limit: int, after: str | None = None
+) -> Select:
+    """Busca ranqueada em keyset por ``(rank, kind, id)`` decrescentes.
+
+    Cada tabela entra com o filtro ``search_vector @@ query``, atendido pelo
+    índice GIN; o ``ts_headline``, que relê o texto, só roda nas linhas da
+    página.
+    """
+    query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, text)
+    branches = [
+        select(
+            literal(kind.value, String).label("kind"),
+            table.c.id,
+            table.c.title,
+            table.c.created_at,
+            func.ts_rank_cd(table.c.search_vector, query).label("rank"),
+            table.c.content,
+        ).where(table.c.search_vector.op("@@")(query))
+        for kind, table in SOURCES.items()
+        if kind in kinds
+    ]
+    matches = (
+        branches[0] if len(branches) == 1 else union_all(*branches)
+    ).subquery("matches")
+
+    order = (matches.c.rank, matches.c.kind, matches.c.id)
+    page = select(matches).order_by(*(column.desc() for column in order))
+    if after is not None:
+        page = page.where(tuple_(*order) < tuple_(*decode_search_cursor(after)))
+    page = page.limit(limit + 1).subquery("page")
+
+    return select(
+        page.c.kind,
+        page.c.id,
+        page.c.title,
+        page.c.created_at,
+        page.c.rank,
+        func.ts_headline(
+            TEXT_SEARCH_CONFIG, page.c.content, query, HEADLINE_OPTIONS
+        ).label("snippet"),
+    ).order_by(page.c.rank.desc(), page.c.kind.desc(), page.c.id.desc())
+
+
+@router.get("/", response_model=List[SearchResult])
+async def search(
+    response: Response,
+    q: str = Query(min_length=2, max_length=200),
+    kind: SearchKind | None = Query(default=None),
+    page: PageParams = Depends(search_page_params),
+):
+    """
+    Busca textual em posts e roteiros, dos mais relevantes para os menos.
+    Aceita a sintaxe do websearch_to_tsquery ("frase exata", -termo, or).
+    O cursor da próxima página vem no header X-Next-Cursor.
+    """
+    kinds = [kind] if kind is not None else list(SearchKind)
+    rows: list[dict[str, Any]] = await fetch_all(
+        search_query(q, kinds, page.limit, page.after)
+    )
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        next_cursor = encode_search_cursor(last["rank"], last["kind"], last["id"])
+    for row in rows:
+        row["snippet"] = highlight(row["snippet"])
+
+    set_next_cursor(response, next_cursor)
+    return trusted_rows(SearchResult, rows, response)
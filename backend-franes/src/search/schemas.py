@@ -0,0 +1,19 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class SearchKind(str, Enum):
+    BLOG = "blog"
+    STORY_SCRIPT = "story_script"
+
+
+class SearchResult(BaseModel):
+    kind: SearchKind
+    id: int
+    title: str
+    # Trecho com os termos encontrados entre <mark>; o resto vem escapado
+    snippet: str
+    rank: float
+    created_at: datetime
@@ -1,6 +1,17 @@
-from sqlalchemy import JSON, Column, DateTime, Integer, String, Table, func
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Table,
+    func,
+)
 
 from src.database import metadata
+from src.search.columns import public_columns, search_vector
 
 story_script = Table(
     "story_script",
@@ -13,4 +24,19 @@ story_script = Table(
     Column("content", String, nullable=False),
     Column("author_final_comment", String, nullable=True),
     Column("cover_image", JSON, nullable=True),
+    Column(
+        "updated_at",
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    ),
+    # Versão de content_versions da última escrita; /sync lê por ela
+    Column("version", BigInteger, server_default="0", nullable=False),
+    search_vector(("title", "A"), ("sub_title", "B"), ("content", "C")),
+    Index("story_script_search_vector_idx", "search_vector", postgresql_using="gin"),
+    Index("story_script_created_at_idx", "created_at", "id"),
+    Index("story_script_version_idx", "version", "id"),
 )
+
+COLUMNS = public_columns(story_script)
@@ -1,17 +1,72 @@
-from typing import List
+from typing import List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
 
 from src.auth.dependencies import get_current_admin_user
-from src.database import execute, fetch_all, fetch_one
-from src.story_script.models import story_script
-from src.story_script.schemas import StoryScript, StoryScriptCreate
+from src.bulk import (
+    BulkResult,
+    bulk_create,
+    bulk_delete,
+    bulk_response,
+    bulk_update,
+    checked_rows,
+    read_bulk_items,
+)
+from src.cache import cached, invalidate
+from src.constants import ResponseFields
+from src.database import (
+    fetch_one,
+    fetch_page,
+    get_db_connection,
+    write_returning,
+)
+from src.http_cache import CachePolicy, public_cache, purge
+from src.pagination import PageParams, page_params, set_next_cursor
+from src.responses import trusted_rows
+from src.story_script.models import COLUMNS, story_script
+from src.story_script.schemas import (
+    StoryScript,
+    StoryScriptBulkUpdate,
+    StoryScriptCreate,
+    StoryScriptSummary,
+)
+from src.timing import TimedRoute
+from src.versions.router import bump_version, record_deletion
 
 router = APIRouter(
     prefix="/story-script",
     tags=["Story Script"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
+)
+
+CACHE_NAMESPACE = "story_script"
+HTTP_CACHE_POLICY = CachePolicy(max_age=60, stale_while_revalidate=600)
+
+SUMMARY_COLUMNS = (
+    story_script.c.id,
+    story_script.c.title,
+    story_script.c.sub_title,
+    story_script.c.author_note,
+    story_script.c.cover_image,
+    story_script.c.created_at,
 )
 
+
+def story_script_values(payload: StoryScriptCreate) -> dict:
+    """Colunas gravadas para ``payload``, com a capa já em JSON."""
+    cover_image_payload = None
+    if payload.cover_image:
+        cover_image_payload = payload.cover_image.model_dump(
+            mode="json", exclude_none=True
+        )
+    return {
+        **payload.model_dump(exclude={"cover_image"}),
+        "cover_image": cover_image_payload,
+    }
+
+
 @router.post(
     "/", response_model=StoryScript, status_code=status.HTTP_201_CREATED
 )
@@ -19,40 +74,109 @@ async def create_story_script(
     story_script_par: StoryScriptCreate,
     _: dict = Depends(get_current_admin_user),
 ):
-    cover_image_payload = None
-    if story_script_par.cover_image:
-        cover_image_payload = story_script_par.cover_image.model_dump(
-            mode="json", exclude_none=True
-        )
-
     query = (
         story_script.insert()
-        .values(
-            title=story_script_par.title,
-            sub_title=story_script_par.sub_title,
-            author_note=story_script_par.author_note,
-            content=story_script_par.content,
-            author_final_comment=story_script_par.author_final_comment,
-            cover_image=cover_image_payload,
-        )
-        .returning(story_script)
+        .values(**story_script_values(story_script_par))
+        .returning(*COLUMNS)
     )
-    created_post = await fetch_one(query, commit_after=True)
+    version = await bump_version(story_script)
+    created_post = await fetch_one(query.values(version=version), commit_after=True)
+    invalidate(CACHE_NAMESPACE)
+    purge("story_script/list")
     return created_post
 
-@router.get("/", response_model=List[StoryScript])
-async def list_story_script():
-    query = story_script.select()
-    return await fetch_all(query)
+@router.get(
+    "/",
+    response_model=Union[List[StoryScript], List[StoryScriptSummary]],
+    dependencies=[
+        Depends(public_cache(HTTP_CACHE_POLICY, "story_script", "story_script/list"))
+    ],
+)
+async def list_story_script(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    fields: ResponseFields = Query(default=ResponseFields.FULL),
+):
+    query = select(*COLUMNS)
+    if fields is ResponseFields.SUMMARY:
+        query = select(*SUMMARY_COLUMNS)
+
+    rows, next_cursor = await cached(
+        CACHE_NAMESPACE,
+        ("list", fields, page.limit, page.after),
+        lambda: fetch_page(query, story_script, limit=page.limit, after=page.after),
+    )
+    set_next_cursor(response, next_cursor)
+    model = StoryScriptSummary if fields is ResponseFields.SUMMARY else StoryScript
+    return trusted_rows(model, rows, response)
+
+# As rotas /bulk vêm antes de /{story_script_id} para não casarem com ele.
+@router.post("/bulk", response_model=BulkResult[StoryScript])
+async def bulk_create_story_scripts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    items, errors = await read_bulk_items(request, StoryScriptCreate)
+    rows = checked_rows(
+        story_script,
+        [(index, story_script_values(item)) for index, item in items],
+        errors,
+    )
+    created = await bulk_create(story_script, rows, COLUMNS)
+    if created:
+        invalidate(CACHE_NAMESPACE)
+        purge("story_script/list")
+    return bulk_response(StoryScript, created, errors)
+
+@router.put("/bulk", response_model=BulkResult[StoryScript])
+async def bulk_update_story_scripts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    items, errors = await read_bulk_items(request, StoryScriptBulkUpdate)
+    rows = checked_rows(
+        story_script,
+        [
+            (index, {**story_script_values(item), "id": item.id})
+            for index, item in items
+        ],
+        errors,
+    )
+    updated = await bulk_update(story_script, rows, COLUMNS, errors)
+    if updated:
+        invalidate(CACHE_NAMESPACE)
+        purge("story_script/list", *(f"story_script/{row['id']}" for row in updated))
+    return bulk_response(StoryScript, updated, errors)
+
+@router.post("/bulk/delete", response_model=BulkResult[int])
+async def bulk_delete_story_scripts(
+    request: Request, _: dict = Depends(get_current_admin_user)
+):
+    ids, errors = await read_bulk_items(request, int)
+    deleted = await bulk_delete(story_script, ids, errors)
+    if deleted:
+        invalidate(CACHE_NAMESPACE)
+        purge("story_script/list", *(f"story_script/{row_id}" for row_id in deleted))
+    return bulk_response(None, deleted, errors)
 
-@router.get("/{story_script_id}", response_model=StoryScript)
+@router.get(
+    "/{story_script_id}",
+    response_model=StoryScript,
+    dependencies=[
+        Depends(
+            public_cache(
+                HTTP_CACHE_POLICY, "story_script", "story_script/{story_script_id}"
+            )
+        )
+    ],
+)
 async def get_story_script_by_id(story_script_id: int):
-    query = story_script.select().where(story_script.c.id == story_script_id)
-    post = await fetch_one(query)
+    query = select(*COLUMNS).where(story_script.c.id == story_script_id)
+    post = await cached(
+        CACHE_NAMESPACE, ("id", story_script_id), lambda: fetch_one(query)
+    )
 
     if post is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Story script not found")
-    return post
+    return trusted_rows(StoryScript, post)
 
 @router.put("/{story_script_id}", response_model=StoryScript)
 async def update_story_script(
@@ -60,9 +184,6 @@ async def update_story_script(
     post_data: StoryScriptCreate,
     _: dict = Depends(get_current_admin_user),
 ):
-    select_query = story_script.select().where(story_script.c.id == story_script_id)
-    if not await fetch_one(select_query):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Story script not found")
     cover_image_payload = None
     if post_data.cover_image:
         cover_image_payload = post_data.cover_image.model_dump(
@@ -82,9 +203,17 @@ async def update_story_script(
         story_script.update()
         .where(story_script.c.id == story_script_id)
         .values(update_values)
-        .returning(story_script)
+        .returning(*COLUMNS)
+    )
+    version = await bump_version(story_script)
+    updated_story_script = await write_returning(
+        update_query.values(version=version),
+        HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Story script not found"
+        ),
     )
-    updated_story_script = await fetch_one(update_query, commit_after=True)
+    invalidate(CACHE_NAMESPACE)
+    purge("story_script/list", f"story_script/{story_script_id}")
     return updated_story_script
 
 
@@ -94,10 +223,17 @@ async def update_story_script(
 async def delete_story_script(
     story_script_id: int, _: dict = Depends(get_current_admin_user)
 ):
-    select_query = story_script.select().where(story_script.c.id == story_script_id)
-    if not await fetch_one(select_query):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Story script not found")
-
-    delete_query = story_script.delete().where(story_script.c.id == story_script_id)
-    await execute(delete_query, commit_after=True)
+    delete_query = (
+        story_script.delete()
+        .where(story_script.c.id == story_script_id)
+        .returning(story_script.c.id)
+    )
+    if await fetch_one(delete_query) is None:
+        # Nada foi escrito; a transação é desfeita no fim do request
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Story script not found"
+        )
+    await record_deletion(story_script, story_script_id)
+    invalidate(CACHE_NAMESPACE)
+    purge("story_script/list", f"story_script/{story_script_id}")
     return {}
@@ -22,11 +22,27 @@ class StoryScriptBase(BaseModel):
 class StoryScriptCreate(StoryScriptBase):
     pass
 
+# Item de atualização em lote: os campos do roteiro mais o id
+class StoryScriptBulkUpdate(StoryScriptCreate):
+    id: int
+
 # Representa o dado como ele vem do banco de dados
 class StoryScript(StoryScriptBase):
     id: int
     created_at: datetime
+    updated_at: datetime
 
     model_config = ConfigDict(
         from_attributes=True # Permite converter automaticamente de ORM para Pydantic ler os dados
     )
+
+# Versão resumida para listagens, sem content e author_final_comment
+class StoryScriptSummary(BaseModel):
+    id: int
+    title: str
+    sub_title: str
+    author_note: str
+    cover_image: CloudinaryAsset | None = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
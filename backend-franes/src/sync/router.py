@@ -0,0 +1,223 @@
+import base64
+import json
+from typing import Any, Callable, Dict, NamedTuple, Tuple, Union
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Column, Select, Table, select, tuple_
+
+from src.art.models import art
+from src.art.schemas import ArtScript
+from src.blog.models import COLUMNS as BLOG_COLUMNS
+from src.blog.models import blog_posts
+from src.blog.schemas import BlogPost
+from src.config import settings
+from src.curriculum.models import curriculum_files
+from src.curriculum.router import serialize_curriculum
+from src.curriculum.schema import Curriculum
+from src.database import fetch_all, get_db_connection
+from src.exceptions import InvalidCursor
+from src.responses import project
+from src.story_script.models import COLUMNS as STORY_COLUMNS
+from src.story_script.models import story_script
+from src.story_script.schemas import StoryScript
+from src.sync.schemas import SyncResult
+from src.timing import TimedRoute, phase
+from src.versions.models import content_deletions, content_versions
+
+router = APIRouter(
+    prefix="/sync",
+    tags=["Sync"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
+)
+
+
+class SyncSource(NamedTuple):
+    table: Table
+    columns: tuple[Column, ...]
+    model: type[BaseModel]
+    serialize: Callable[[Dict], Dict] | None = None
+
+
+SOURCES = (
+    SyncSource(art, tuple(art.c), ArtScript),
+    SyncSource(blog_posts, BLOG_COLUMNS, BlogPost),
+    SyncSource(
+        curriculum_files, tuple(curriculum_files.c), Curriculum, serialize_curriculum
+    ),
+    SyncSource(story_script, STORY_COLUMNS, StoryScript),
+)
+SOURCE_NAMES = frozenset(source.table.name for source in SOURCES)
+
+# Posição de uma tabela no cursor: a versão já sincronizada por inteiro, ou
+# ``(version, id)`` da última linha entregue quando a tabela ficou pela metade
+SyncPosition = Union[int, Tuple[int, int]]
+
+
+def _position_version(position: SyncPosition) -> int:
+    return position[0] if isinstance(position, tuple) else position
+
+
+def _is_position(value: Any) -> bool:
+    if isinstance(value, list):
+        return len(value) == 2 and all(type(item) is int for item in value)
+    return type(value) is int
+
+
+def encode_sync_cursor(versions: Dict[str, SyncPosition]) -> str:
+    payload = json.dumps(versions, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> Dict[str, SyncPosition]:
+    """Inverso de :func:`encode_sync_cursor`; ``ValueError`` se inválido."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        versions = json.loads(base64.urlsafe_b64decode(padded))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid sync cursor") from exc
+
+    if not isinstance(versions, dict) or not all(
+        name in SOURCE_NAMES and _is_position(position)
+        for name, position in versions.items()
+    ):
+        raise ValueError("Invalid sync cursor")
+
+    return {
+        name: tuple(position) if isinstance(position, list) else position
+        for name, position in versions.items()
+    }
+
+
+def sync_since(
+    since: str | None = Query(default=None, max_length=500),
+) -> Dict[str, SyncPosition]:
+    if since is None:
+        return {}
+    try:
+        return decode_sync_cursor(since)
+    except ValueError:
+        raise InvalidCursor()
+
+
+def changes_query(
+    source: SyncSource,
+    since: SyncPosition | None,
+    until: int,
+    limit: int | None = None,
+) -> Select:
+    """Linhas escritas depois de ``since`` e até ``until``, pelo índice de version.
+
+    Com ``limit`` lê uma linha a mais, para saber se a tabela ficou pela
+    metade; a próxima página continua de ``(version, id)`` da última linha.
+    """
+    table = source.table
+    query = select(*source.columns).where(table.c.version <= until)
+    if isinstance(since, tuple):
+        query = query.where(tuple_(table.c.version, table.c.id) > tuple_(*since))
+    elif since is not None:
+        query = query.where(table.c.version > since)
+    query = query.order_by(table.c.version, table.c.id)
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def deletions_query(table: Table, since: int, until: int) -> Select:
+    return (
+        select(content_deletions.c.row_id)
+        .where(
+            content_deletions.c.table_name == table.name,
+            content_deletions.c.version > since,
+            content_deletions.c.version <= until,
+        )
+        .order_by(content_deletions.c.version, content_deletions.c.row_id)
+    )
+
+
+@router.get("/", response_model=SyncResult)
+async def sync(
+    since: Dict[str, SyncPosition] = Depends(sync_since),
+    limit: int = Query(
+        default=settings.SYNC_MAX_LIMIT, ge=1, le=settings.SYNC_MAX_LIMIT
+    ),
+):
+    """
+    Linhas criadas/alteradas e ids apagados desde o cursor ``since``.
+    Sem cursor começa do zero. Devolve no máximo ``limit`` linhas alteradas;
+    o ``cursor`` da resposta vai como ``since`` na próxima chamada, e o
+    cliente repete enquanto ``has_more`` vier verdadeiro. Tabelas sem escrita
+    nova não são lidas.
+    """
+    rows = await fetch_all(
+        select(content_versions.c.table_name, content_versions.c.version)
+    )
+    current = dict.fromkeys(SOURCE_NAMES, 0)
+    current.update(
+        (row["table_name"], row["version"])
+        for row in rows
+        if row["table_name"] in SOURCE_NAMES
+    )
+
+    changed: Dict[str, list[Dict[str, Any]]] = {name: [] for name in SOURCE_NAMES}
+    deleted: Dict[str, list[int]] = {name: [] for name in SOURCE_NAMES}
+    cursor = dict(since)
+    remaining = limit
+    has_more = False
+    for source in SOURCES:
+        name = source.table.name
+        until = current[name]
+        previous = since.get(name)
+        if previous is not None and _position_version(previous) > until:
+            # Cursor de outro banco (ou restaurado de backup): refaz do zero
+            raise InvalidCursor()
+        if previous == until:
+            continue
+        if not remaining:
+            # Sem espaço nesta resposta: a tabela fica para a próxima chamada
+            has_more = True
+            continue
+
+        entries = await fetch_all(changes_query(source, previous, until, remaining))
+        position: SyncPosition = until
+        if len(entries) > remaining:
+            entries = entries[:remaining]
+            position = (entries[-1]["version"], entries[-1]["id"])
+            has_more = True
+        remaining -= len(entries)
+        cursor[name] = position
+
+        if source.serialize is not None:
+            entries = [source.serialize(entry) for entry in entries]
+        changed[name] = entries
+        if previous is not None:
+            # Só até a versão entregue; as seguintes saem junto com as linhas
+            deleted[name] = [
+                row["row_id"]
+                for row in await fetch_all(
+                    deletions_query(
+                        source.table,
+                        _position_version(previous),
+                        _position_version(position),
+                    )
+                )
+            ]
+
+    body = {
+        "cursor": encode_sync_cursor(cursor),
+        "has_more": has_more,
+        "versions": current,
+        "changed": changed,
+        "deleted": deleted,
+    }
+    if not settings.RESPONSE_TRUSTED_ROWS:
+        return body
+
+    # Mesmo atalho de trusted_rows: só projeta os campos de cada schema
+    with phase("serialize"):
+        for source in SOURCES:
+            name = source.table.name
+            changed[name] = [project(source.model, entry) for entry in changed[name]]
+        return ORJSONResponse(body)
@@ -0,0 +1,32 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from src.art.schemas import ArtScript
+from src.blog.schemas import BlogPost
+from src.curriculum.schema import Curriculum
+from src.story_script.schemas import StoryScript
+
+
+class SyncChanges(BaseModel):
+    art: List[ArtScript] = []
+    blog_posts: List[BlogPost] = []
+    curriculum_files: List[Curriculum] = []
+    story_script: List[StoryScript] = []
+
+
+class SyncDeletions(BaseModel):
+    art: List[int] = []
+    blog_posts: List[int] = []
+    curriculum_files: List[int] = []
+    story_script: List[int] = []
+
+
+class SyncResult(BaseModel):
+    # Vai como ``since`` na próxima chamada
+    cursor: str
+    # Há mais linhas além do ``limit``: chame de novo com ``cursor``
+    has_more: bool
+    versions: Dict[str, int]
+    changed: SyncChanges
+    deleted: SyncDeletions
@@ -0,0 +1,196 @@
+import cProfile
+import marshal
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine, Iterator
+
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.routing import APIRoute
+from jose import JWTError, jwt
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import settings
+from src.http_cache import STATE_ATTRIBUTE
+
+SERVER_TIMING_HEADER = "Server-Timing"
+PROFILE_HEADER = "X-Profile-Token"
+# Tokens de perfil usam um sub que get_current_admin_user não aceita, então
+# não servem como token de admin.
+PROFILE_SUBJECT_PREFIX = "profile:"
+# Fases sempre presentes no header, nesta ordem; total vai por último.
+PHASES = ("db", "validate", "serialize")
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar("_timings", default=None)
+_profiling = False
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Soma o tempo do bloco à fase ``name`` do request atual, se houver."""
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    names = [*PHASES, *(name for name in timings if name not in PHASES)]
+    return ", ".join(
+        f"{name};dur={timings.get(name, 0.0) * 1000:.3f}" for name in names
+    )
+
+
+def _timed(function: Any, name: str) -> Any:
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with phase(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """APIRoute que mede a validação e o dump do ``response_model``.
+
+    O FastAPI valida e serializa o retorno dentro do próprio handler, sem
+    ponto de extensão; os métodos do campo de resposta são embrulhados para
+    contar em ``validate`` e ``serialize``. Respostas de ``trusted_rows``
+    não passam por aqui.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        # Chamado na criação da rota e a cada include_router; o campo só é
+        # embrulhado uma vez.
+        for field in (
+            self.response_field,
+            getattr(self, "secure_cloned_response_field", None),
+        ):
+            if field is None or getattr(field, "_timed", False):
+                continue
+            field.validate = _timed(field.validate, "validate")
+            for method in ("serialize", "serialize_json"):
+                if hasattr(field, method):
+                    setattr(field, method, _timed(getattr(field, method), "serialize"))
+            field._timed = True
+        return super().get_route_handler()
+
+
+def profile_subject(user_id: int) -> str:
+    return f"{PROFILE_SUBJECT_PREFIX}{user_id}"
+
+
+def _valid_profile_token(token: str) -> bool:
+    try:
+        payload = jwt.decode(
+            token,
+            settings.ADMIN_TOKEN_SECRET,
+            algorithms=[settings.ADMIN_TOKEN_ALGORITHM],
+        )
+    except JWTError:
+        return False
+    return str(payload.get("sub", "")).startswith(PROFILE_SUBJECT_PREFIX)
+
+
+class ServerTimingMiddleware:
+    """Middleware ASGI que emite ``Server-Timing`` e perfila requests sob demanda.
+
+    ``total`` vai até o início da resposta; em downloads por streaming o
+    envio do corpo não entra na conta. Um request com ``X-Profile-Token``
+    válido (emitido em ``/profiling/token``) roda sob cProfile e devolve o
+    dump do pstats como anexo no lugar do corpo original, cujo status vai em
+    ``X-Profiled-Status``. O dump sai com ``no-store`` e sem a marcação de
+    ``public_cache`` da rota, para nunca ser guardado no lugar dela. O
+    cProfile vê a thread inteira, então requests concorrentes no mesmo worker
+    também aparecem no perfil.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile_token = Headers(scope=scope).get(PROFILE_HEADER)
+        if profile_token is not None and settings.PROFILING_ENABLED:
+            await self._profile(profile_token, scope, receive, send)
+            return
+
+        if not settings.SERVER_TIMING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        timings: dict[str, float] = {}
+        token = _timings.set(timings)
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timings["total"] = time.perf_counter() - started
+                MutableHeaders(scope=message).append(
+                    SERVER_TIMING_HEADER, format_server_timing(timings)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _timings.reset(token)
+
+    async def _profile(
+        self, profile_token: str, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        global _profiling
+
+        if not _valid_profile_token(profile_token):
+            response = ORJSONResponse(
+                {"detail": "Invalid profile token"},
+                status_code=status.HTTP_403_FORBIDDEN,
+            )
+            await response(scope, receive, send)
+            return
+        if _profiling:
+            response = ORJSONResponse(
+                {"detail": "Another request is being profiled"},
+                status_code=status.HTTP_409_CONFLICT,
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def discard(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        profiler = cProfile.Profile()
+        _profiling = True
+        profiler.enable()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.disable()
+            _profiling = False
+
+        scope.get("state", {}).pop(STATE_ATTRIBUTE, None)
+        profiler.create_stats()
+        response = Response(
+            marshal.dumps(profiler.stats),
+            media_type="application/octet-stream",
+            headers={
+                "Content-Disposition": 'attachment; filename="profile.prof"',
+                "X-Profiled-Status": str(status_code),
+                "Cache-Control": "no-store, private",
+            },
+        )
+        await response(scope, receive, send)
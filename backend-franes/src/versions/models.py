@@ -0,0 +1,43 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    Table,
+    func,
+)
+
+from src.database import metadata
+
+# Versão do conteúdo de cada tabela pública. As rotas de escrita incrementam
+# a linha da tabela na mesma transação da escrita; /versions lê todas por
+# chave primária, sem tocar nas tabelas de conteúdo.
+content_versions = Table(
+    "content_versions",
+    metadata,
+    Column("table_name", String(63), primary_key=True),
+    Column("version", BigInteger, nullable=False),
+    Column(
+        "updated_at",
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    ),
+)
+
+# Tombstones: ids apagados de cada tabela e a versão em que isso aconteceu,
+# para /sync avisar quem já tinha a linha.
+content_deletions = Table(
+    "content_deletions",
+    metadata,
+    Column("table_name", String(63), nullable=False),
+    Column("row_id", Integer, nullable=False),
+    Column("version", BigInteger, nullable=False),
+    Column("deleted_at", DateTime, server_default=func.now(), nullable=False),
+    PrimaryKeyConstraint("table_name", "row_id"),
+    Index("content_deletions_table_name_version_idx", "table_name", "version"),
+)
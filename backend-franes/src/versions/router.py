@@ -0,0 +1,86 @@
+from typing import Dict, Iterable
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import Insert, Table, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.art.models import art
+from src.blog.models import blog_posts
+from src.curriculum.models import curriculum_files
+from src.database import execute, fetch_all, fetch_one, get_db_connection
+from src.story_script.models import story_script
+from src.timing import TimedRoute
+from src.versions.models import content_deletions, content_versions
+
+router = APIRouter(
+    prefix="/versions",
+    tags=["Versions"],
+    dependencies=[Depends(get_db_connection)],
+    route_class=TimedRoute,
+)
+
+VERSIONED_TABLES = (art, blog_posts, curriculum_files, story_script)
+
+
+def bump_version_statement(table: Table) -> Insert:
+    """Incrementa a versão de ``table`` e devolve o novo valor.
+
+    Deve rodar na mesma transação da escrita, antes do commit: o lock na
+    linha de ``content_versions`` dura até o commit, então escritas
+    concorrentes na mesma tabela terminam na ordem das versões que receberam.
+    """
+    statement = pg_insert(content_versions).values(table_name=table.name, version=1)
+    return statement.on_conflict_do_update(
+        index_elements=[content_versions.c.table_name],
+        set_={"version": content_versions.c.version + 1, "updated_at": func.now()},
+    ).returning(content_versions.c.version)
+
+
+async def bump_version(table: Table) -> int:
+    """Roda :func:`bump_version_statement`; a escrita grava o valor em ``version``."""
+    row = await fetch_one(bump_version_statement(table))
+    return row["version"]
+
+
+def record_deletion_statement(table: Table, row_id: int, version: int) -> Insert:
+    """Tombstone de ``row_id``, na mesma transação do ``DELETE``."""
+    return content_deletions.insert().values(
+        table_name=table.name, row_id=row_id, version=version
+    )
+
+
+async def record_deletion(
+    table: Table, row_id: int, commit_after: bool = True
+) -> None:
+    """Versão nova e tombstone de ``row_id``, depois do ``DELETE`` que o apagou.
+
+    Só deve rodar quando o ``DELETE ... RETURNING`` devolveu a linha; um id
+    inexistente não ganha versão nem tombstone.
+    """
+    version = await bump_version(table)
+    await execute(
+        record_deletion_statement(table, row_id, version), commit_after=commit_after
+    )
+
+
+def record_deletions_statement(
+    table: Table, row_ids: Iterable[int], version: int
+) -> Insert:
+    """Tombstones de vários ids num só ``INSERT``."""
+    return content_deletions.insert().values(
+        [
+            {"table_name": table.name, "row_id": row_id, "version": version}
+            for row_id in row_ids
+        ]
+    )
+
+
+@router.get("/", response_model=Dict[str, int])
+async def get_versions():
+    """Versão atual de cada tabela; tabelas nunca escritas valem 0."""
+    rows = await fetch_all(
+        select(content_versions.c.table_name, content_versions.c.version)
+    )
+    versions = {table.name: 0 for table in VERSIONED_TABLES}
+    versions.update((row["table_name"], row["version"]) for row in rows)
+    return versions
@@ -0,0 +1,164 @@
+import anyio
+import pytest
+
+pytest.importorskip("jose")
+
+from fastapi import HTTPException  # noqa: E402
+
+from src.auth import dependencies  # noqa: E402
+from src.auth.dependencies import (  # noqa: E402
+    PRINCIPAL_CACHE_NAMESPACE,
+    create_access_token,
+    get_current_admin_user,
+    principal_claims,
+)
+from src.auth.utils import (  # noqa: E402
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+from src.cache import cache, invalidate  # noqa: E402
+from src.config import settings  # noqa: E402
+
+ADMIN = {
+    "id": 7,
+    "username": "franes",
+    "is_active": True,
+    "is_admin": True,
+    "token_version": 2,
+}
+
+
+@pytest.fixture
+def stored(monkeypatch) -> dict:
+    """Linha de ``users`` vista pelos loaders; os testes podem alterá-la."""
+    row = dict(ADMIN)
+
+    async def fake_load_token_version(user_id: int):
+        return row["token_version"]
+
+    monkeypatch.setattr(dependencies, "_load_token_version", fake_load_token_version)
+    return row
+
+
+@pytest.fixture
+def loads(monkeypatch, stored: dict) -> list[int]:
+    cache.clear()
+    calls: list[int] = []
+
+    async def fake_load(user_id: int):
+        calls.append(user_id)
+        return dict(stored)
+
+    monkeypatch.setattr(dependencies, "_load_principal", fake_load)
+    return calls
+
+
+def _token(user: dict = ADMIN) -> str:
+    return create_access_token(subject=str(user["id"]), claims=principal_claims(user))
+
+
+def test_principal_is_cached_until_users_change(loads: list[int]) -> None:
+    token = _token()
+
+    async def scenario():
+        await get_current_admin_user(token)
+        await get_current_admin_user(token)
+        invalidate(PRINCIPAL_CACHE_NAMESPACE)
+        return await get_current_admin_user(token)
+
+    principal = anyio.run(scenario)
+
+    assert principal["id"] == 7
+    assert loads == [7, 7]
+
+
+def test_token_from_older_version_is_rejected(loads: list[int]) -> None:
+    token = _token({**ADMIN, "token_version": 1})
+
+    with pytest.raises(HTTPException) as exc_info:
+        anyio.run(get_current_admin_user, token)
+
+    assert exc_info.value.status_code == 401
+
+
+def test_embedded_claims_skip_the_database(monkeypatch, loads: list[int]) -> None:
+    monkeypatch.setattr(settings, "ADMIN_TOKEN_EMBED_CLAIMS", True)
+    trust = dependencies._claims_trust
+    generation = cache.generation(PRINCIPAL_CACHE_NAMESPACE)
+    monkeypatch.setattr(trust, "generation", generation)
+    monkeypatch.setattr(trust, "trusted_after", 0)
+    token = _token()
+
+    principal = anyio.run(get_current_admin_user, token)
+
+    assert principal["username"] == "franes"
+    assert loads == []
+
+
+def test_embedded_claims_are_rechecked_after_user_changes(
+    monkeypatch, loads: list[int]
+) -> None:
+    monkeypatch.setattr(settings, "ADMIN_TOKEN_EMBED_CLAIMS", True)
+    token = _token()
+    invalidate(PRINCIPAL_CACHE_NAMESPACE)
+
+    anyio.run(get_current_admin_user, token)
+
+    assert loads == [7]
+
+
+def test_embedded_claims_of_a_token_from_before_update_user_are_rejected(
+    monkeypatch, loads: list[int], stored: dict
+) -> None:
+    from src.admin import router as admin_router
+    from src.admin.schemas import UserUpdate
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN_EMBED_CLAIMS", True)
+    # Confia nos claims mesmo depois da invalidação, como um worker que
+    # ainda não a observou
+    monkeypatch.setattr(dependencies._claims_trust, "allows", lambda issued_at: True)
+    token = _token()
+
+    async def fake_fetch_one(query, connection=None, commit_after=False):
+        if commit_after:
+            stored["token_version"] += 1
+        return dict(stored)
+
+    monkeypatch.setattr(admin_router, "fetch_one", fake_fetch_one)
+
+    async def scenario():
+        await get_current_admin_user(token)
+        await admin_router.update_user(7, UserUpdate(is_admin=True))
+        await get_current_admin_user(token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        anyio.run(scenario)
+
+    assert exc_info.value.status_code == 401
+    assert stored["token_version"] == 3
+    assert loads == []
+
+
+def test_password_hashing_runs_off_the_event_loop(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+    async def scenario():
+        hashed = await hash_password_async("s3cret-pass")
+        return hashed, await verify_password_async("s3cret-pass", hashed)
+
+    hashed, valid = anyio.run(scenario)
+
+    assert valid
+    assert not needs_rehash(hashed)
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    assert needs_rehash(hashed)
+
+
+def test_password_pool_rejects_when_queue_is_full(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        anyio.run(hash_password_async, "s3cret-pass")
+
+    assert exc_info.value.status_code == 503
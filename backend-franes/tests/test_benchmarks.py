@@ -0,0 +1,52 @@
+import pytest
+
+from benchmarks import report
+from benchmarks.load import parse_server_timing
+
+
+def test_percentile_interpolates_between_samples() -> None:
+    values = [0.01, 0.02, 0.03, 0.04]
+
+    assert report.percentile(values, 0.5) == pytest.approx(0.025)
+    assert report.percentile(values, 0.99) == pytest.approx(0.0397)
+    assert report.percentile([], 0.5) == 0.0
+
+
+def test_compare_flags_regressions_in_both_directions() -> None:
+    before = {
+        "meta": {"commit": "a"},
+        "load": {"all": {"p99_ms": 10.0, "rps": 100.0, "count": 1000}},
+        "micro": {"serialize_curriculum": {"median_us": 2.0}},
+    }
+    after = {
+        "meta": {"commit": "b"},
+        "load": {"all": {"p99_ms": 10.5, "rps": 80.0, "count": 900}},
+        "micro": {"serialize_curriculum": {"median_us": 1.0}},
+    }
+
+    rows = {
+        path: regressed
+        for path, *_, regressed in report.compare(before, after, threshold=10)
+    }
+
+    assert rows == {
+        "load/all/p99_ms": False,
+        "load/all/rps": True,
+        "micro/serialize_curriculum/median_us": False,
+    }
+
+
+def test_parse_server_timing() -> None:
+    header = "db;dur=1.500, validate;dur=0.000, total;dur=3.250"
+
+    assert parse_server_timing(header) == {"db": 1.5, "validate": 0.0, "total": 3.25}
+    assert parse_server_timing(None) == {}
+
+
+def test_micro_cases_run() -> None:
+    # Os schemas mudam; um campo novo obrigatório quebra os casos aqui
+    pytest.importorskip("sqlalchemy")
+    from benchmarks import micro
+
+    for name, case in micro.cases().items():
+        assert case() is not None, name
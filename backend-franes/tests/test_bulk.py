@@ -0,0 +1,238 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src import bulk  # noqa: E402
+from src.blog import router as blog_router  # noqa: E402
+from src.blog.models import blog_posts  # noqa: E402
+from src.bulk import (  # noqa: E402
+    NDJSON_MEDIA_TYPE,
+    _raw_items,
+    bulk_update_statement,
+    column_errors,
+)
+from src.config import settings  # noqa: E402
+from src.versions import router as versions_router  # noqa: E402
+
+NOW = datetime(2026, 10, 17)
+
+
+def _post(post_id: int, title: str = "t") -> dict:
+    return {
+        "id": post_id,
+        "title": title,
+        "reading_time": 1,
+        "content": "c",
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+@pytest.fixture
+def bumps(monkeypatch) -> list[str]:
+    tables: list[str] = []
+
+    async def fake_fetch_one(query, connection=None, commit_after=False):
+        tables.append(query.table.name)
+        return {"version": 5}
+
+    monkeypatch.setattr(versions_router, "fetch_one", fake_fetch_one)
+    return tables
+
+
+@pytest.fixture
+def purges(monkeypatch) -> list[tuple[str, ...]]:
+    calls: list[tuple[str, ...]] = []
+    monkeypatch.setattr(blog_router, "purge", lambda *keys: calls.append(keys))
+    return calls
+
+
+def test_raw_items_reads_arrays_and_ndjson() -> None:
+    assert _raw_items(b'[{"a": 1}, 2]', "application/json") == [(0, {"a": 1}), (1, 2)]
+
+    items = _raw_items(b'{"a": 1}\n\nnope\n3\n', f"{NDJSON_MEDIA_TYPE}; charset=utf-8")
+    assert items[0] == (0, {"a": 1})
+    assert isinstance(items[1][1], ValueError)
+    assert items[2] == (2, 3)
+
+
+def test_raw_items_rejects_non_arrays() -> None:
+    from fastapi import HTTPException
+
+    for body in (b'{"a": 1}', b"nope"):
+        with pytest.raises(HTTPException) as exc:
+            _raw_items(body, "application/json")
+        assert exc.value.status_code == 422
+
+
+def test_column_errors_checks_string_lengths() -> None:
+    assert column_errors(blog_posts, {"title": "x" * 100, "reading_time": 1}) == []
+    assert column_errors(blog_posts, {"title": "x" * 101}) == [
+        "title: no máximo 100 caracteres"
+    ]
+
+
+def test_bulk_update_statement_joins_a_values_list(compile_sql) -> None:
+    rows = [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]
+    sql = compile_sql(bulk_update_statement(blog_posts, rows, [blog_posts.c.id]))
+
+    assert sql.startswith("UPDATE blog_posts SET title=data.title, updated_at=now()")
+    assert "FROM (VALUES" in sql
+    assert "AS data (id, title) WHERE blog_posts.id = data.id" in sql
+    assert sql.endswith("RETURNING blog_posts.id")
+
+
+def test_bulk_create_reports_invalid_items(monkeypatch, admin_client, bumps) -> None:
+    calls = []
+
+    async def fake_fetch_all(
+        query, connection=None, commit_after=False, parameters=None
+    ):
+        calls.append((commit_after, parameters))
+        return [_post(10 + i, row["title"]) for i, row in enumerate(parameters)]
+
+    monkeypatch.setattr(bulk, "fetch_all", fake_fetch_all)
+    response = admin_client.post(
+        "/blog/bulk",
+        json=[
+            {"title": "a", "reading_time": 1, "content": "c"},
+            {"title": "b"},
+            {"title": "x" * 300, "reading_time": 1, "content": "c"},
+            {"title": "d", "reading_time": 2, "content": "c"},
+        ],
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["title"] for item in body["items"]] == ["a", "d"]
+    assert [error["index"] for error in body["errors"]] == [1, 2]
+    assert bumps == ["content_versions"]
+    assert len(calls) == 1
+    commit_after, parameters = calls[0]
+    assert commit_after
+    assert [row["version"] for row in parameters] == [5, 5]
+
+
+def test_bulk_update_reports_missing_and_repeated_ids(
+    monkeypatch, admin_client, bumps, compile_sql, purges
+) -> None:
+    async def fake_fetch_all(
+        query, connection=None, commit_after=False, parameters=None
+    ):
+        assert "FROM (VALUES" in compile_sql(query)
+        return [_post(1, "novo")]
+
+    monkeypatch.setattr(bulk, "fetch_all", fake_fetch_all)
+    item = {"reading_time": 1, "content": "c"}
+    response = admin_client.put(
+        "/blog/bulk",
+        json=[
+            {"id": 1, "title": "novo", **item},
+            {"id": 2, "title": "outro", **item},
+            {"id": 1, "title": "de novo", **item},
+        ],
+    )
+
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [1]
+    assert body["errors"] == [
+        {"index": 1, "detail": "Not found"},
+        {"index": 2, "detail": "id repetido no lote"},
+    ]
+    # As mesmas keys das rotas de um item só
+    assert purges == [("blog/list", "blog/1")]
+
+
+def test_bulk_delete_records_tombstones(
+    monkeypatch, admin_client, bumps, purges
+) -> None:
+    executed = []
+
+    async def fake_fetch_all(
+        query, connection=None, commit_after=False, parameters=None
+    ):
+        return [{"id": 3}, {"id": 4}]
+
+    async def fake_execute(query, connection=None, commit_after=False):
+        executed.append((query.table.name, commit_after))
+
+    monkeypatch.setattr(bulk, "fetch_all", fake_fetch_all)
+    monkeypatch.setattr(bulk, "execute", fake_execute)
+    response = admin_client.post(
+        "/blog/bulk/delete",
+        content=b"3\n4\n3\n7\n",
+        headers={"Content-Type": NDJSON_MEDIA_TYPE},
+    )
+
+    assert response.json() == {
+        "items": [3, 4],
+        "errors": [
+            {"index": 2, "detail": "id repetido no lote"},
+            {"index": 3, "detail": "Not found"},
+        ],
+    }
+    assert bumps == ["content_versions"]
+    assert executed == [("content_deletions", True)]
+    assert purges == [("blog/list", "blog/3", "blog/4")]
+
+
+def test_bulk_delete_without_matches_skips_version_and_commit(
+    monkeypatch, admin_client, bumps, purges
+) -> None:
+    executed = []
+
+    async def fake_fetch_all(
+        query, connection=None, commit_after=False, parameters=None
+    ):
+        assert not commit_after
+        return []
+
+    async def fake_execute(query, connection=None, commit_after=False):
+        executed.append(query)
+
+    monkeypatch.setattr(bulk, "fetch_all", fake_fetch_all)
+    monkeypatch.setattr(bulk, "execute", fake_execute)
+    response = admin_client.post("/blog/bulk/delete", json=[8])
+
+    assert response.json() == {
+        "items": [],
+        "errors": [{"index": 0, "detail": "Not found"}],
+    }
+    assert bumps == []
+    assert executed == []
+    assert purges == []
+
+
+def test_bulk_rejects_too_many_items(monkeypatch, admin_client) -> None:
+    monkeypatch.setattr(settings, "BULK_MAX_ITEMS", 2)
+
+    response = admin_client.post("/blog/bulk/delete", json=[1, 2, 3])
+
+    assert response.status_code == 413
+
+
+def test_bulk_rejects_large_bodies_before_parsing(monkeypatch, admin_client) -> None:
+    monkeypatch.setattr(settings, "BULK_MAX_BODY_BYTES", 10)
+
+    declared = admin_client.post("/blog/bulk/delete", json=list(range(20)))
+
+    def chunks():
+        yield b"[1, 2, 3,"
+        yield b" 4, 5, 6]"
+
+    streamed = admin_client.post("/blog/bulk/delete", content=chunks())
+
+    assert declared.status_code == 413
+    assert streamed.status_code == 413
+
+
+def test_bulk_routes_require_admin() -> None:
+    from src.main import app
+
+    response = TestClient(app).post("/art/bulk/delete", json=[1])
+
+    assert response.status_code in (401, 403)
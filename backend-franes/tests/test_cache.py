@@ -0,0 +1,114 @@
+import anyio
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from src.cache import (  # noqa: E402
+    ResponseCache,
+    SharedGenerations,
+    cached,
+    invalidate,
+)
+from src.cache import cache as shared_cache  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=10_000, ttl=60)
+
+    assert cache.get("blog", 1) == (False, None)
+    cache.set("blog", 1, {"id": 1})
+
+    assert cache.get("blog", 1) == (True, {"id": 1})
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=10, max_bytes=10_000, ttl=60, clock=clock)
+    cache.set("blog", 1, "post")
+
+    clock.now = 61
+
+    assert cache.get("blog", 1) == (False, None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = ResponseCache(max_entries=2, max_bytes=10_000, ttl=60)
+    cache.set("art", 1, "a")
+    cache.set("art", 2, "b")
+    cache.get("art", 1)
+    cache.set("art", 3, "c")
+
+    assert cache.get("art", 2) == (False, None)
+    assert cache.get("art", 1) == (True, "a")
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_respects_memory_bound() -> None:
+    cache = ResponseCache(max_entries=100, max_bytes=2_000, ttl=60)
+    for key in range(10):
+        cache.set("art", key, "x" * 500)
+
+    assert cache.stats()["bytes"] <= 2_000
+    assert cache.get("art", 9)[0]
+
+
+def test_invalidate_drops_only_the_namespace() -> None:
+    cache = ResponseCache(max_entries=10, max_bytes=10_000, ttl=60)
+    cache.set("blog", 1, "post")
+    cache.set("art", 1, "art")
+
+    cache.invalidate("blog")
+
+    assert cache.get("blog", 1) == (False, None)
+    assert cache.get("art", 1) == (True, "art")
+
+
+def test_cached_skips_values_loaded_across_an_invalidation() -> None:
+    shared_cache.clear()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        invalidate("story_script")  # escrita concorrente durante a leitura
+        return "stale"
+
+    async def scenario():
+        await cached("story_script", 1, loader)
+        await cached("story_script", 1, loader)
+
+    anyio.run(scenario)
+
+    assert len(calls) == 2
+
+
+def test_shared_generations_propagate_invalidation(tmp_path) -> None:
+    path = tmp_path / "generations"
+    worker_a = ResponseCache(
+        max_entries=10, max_bytes=10_000, ttl=60, shared=SharedGenerations(path)
+    )
+    worker_b = ResponseCache(
+        max_entries=10, max_bytes=10_000, ttl=60, shared=SharedGenerations(path)
+    )
+    worker_a.set("blog", 1, "post")
+    worker_b.set("blog", 1, "post")
+    worker_b.set("art", 1, "art")
+
+    worker_a.invalidate("blog")
+
+    assert worker_a.get("blog", 1) == (False, None)
+    assert worker_b.get("blog", 1) == (False, None)
+    assert worker_b.get("art", 1) == (True, "art")
+
+    worker_a.set("blog", 1, "fresh")
+    assert worker_a.get("blog", 1) == (True, "fresh")
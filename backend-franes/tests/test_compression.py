@@ -0,0 +1,159 @@
+import gzip
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from fastapi import FastAPI, Response  # noqa: E402
+from fastapi.responses import ORJSONResponse, StreamingResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src import compression  # noqa: E402
+from src.cache import ResponseCache  # noqa: E402
+from src.compression import (  # noqa: E402
+    CompressionMiddleware,
+    compress,
+    is_compressible,
+    negotiate,
+)
+
+ROWS = [{"id": i, "title": f"Post {i}", "content": "texto " * 20} for i in range(50)]
+CSV_CHUNKS = [b"id,nome\n"] + [f"{i},linha {i}\n".encode() * 20 for i in range(20)]
+
+
+def _app(store: ResponseCache | None) -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500, store=store)
+
+    @app.get("/posts")
+    async def posts():
+        return ORJSONResponse(ROWS, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small():
+        return {"id": 1}
+
+    @app.get("/file.pdf")
+    async def pdf():
+        return Response(b"%PDF-" + b"0" * 4096, media_type="application/pdf")
+
+    @app.get("/file.csv")
+    async def csv():
+        async def chunks():
+            for chunk in CSV_CHUNKS:
+                yield chunk
+
+        return StreamingResponse(chunks(), media_type="text/csv")
+
+    return app
+
+
+def _client(store: ResponseCache | None = None) -> TestClient:
+    return TestClient(_app(store))
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip;q=0.5, deflate", "gzip"),
+        ("gzip;q=0", None),
+        ("*", compression.ENCODINGS[0]),
+    ],
+)
+def test_negotiate(header, expected) -> None:
+    assert negotiate(header) == expected
+
+
+def test_negotiate_prefers_client_quality_over_server_order() -> None:
+    assert negotiate("br;q=0.1, zstd;q=0.2, gzip;q=0.9") == "gzip"
+
+
+@pytest.mark.skipif(compression.brotli is None, reason="brotli não instalado")
+def test_negotiate_prefers_brotli_on_ties() -> None:
+    assert negotiate("gzip, deflate, br, zstd") == "br"
+
+
+@pytest.mark.parametrize("encoding", compression.ENCODINGS)
+def test_compress_round_trips(encoding) -> None:
+    data = b"texto repetido " * 100
+    compressed = compress(data, encoding)
+
+    assert len(compressed) < len(data)
+    if encoding == "gzip":
+        assert gzip.decompress(compressed) == data
+
+
+def test_is_compressible() -> None:
+    assert is_compressible("application/json")
+    assert is_compressible("text/csv; charset=utf-8")
+    assert is_compressible("application/problem+json")
+    assert not is_compressible("application/pdf")
+    assert not is_compressible("image/png")
+    assert not is_compressible(None)
+
+
+def test_json_is_compressed_with_vary_and_weak_etag() -> None:
+    response = _client().get("/posts", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == ROWS
+
+
+def test_without_accept_encoding_body_is_untouched() -> None:
+    response = _client().get("/posts", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+    assert response.json() == ROWS
+
+
+def test_small_and_pdf_responses_are_not_compressed() -> None:
+    client = _client()
+
+    assert "content-encoding" not in client.get("/small").headers
+    assert "content-encoding" not in client.get("/file.pdf").headers
+
+
+def test_range_requests_are_not_compressed() -> None:
+    response = _client().get(
+        "/posts", headers={"Accept-Encoding": "gzip", "Range": "bytes=0-10"}
+    )
+
+    assert "content-encoding" not in response.headers
+
+
+def test_streaming_csv_is_compressed_incrementally() -> None:
+    response = _client().get("/file.csv", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.content == b"".join(CSV_CHUNKS)
+
+
+def test_public_responses_are_compressed_once_per_content() -> None:
+    store = ResponseCache(max_entries=10, max_bytes=1_000_000, ttl=60)
+    client = _client(store)
+
+    for _ in range(3):
+        response = client.get("/posts", headers={"Accept-Encoding": "gzip"})
+        assert response.json() == ROWS
+
+    assert store.stats()["entries"] == 1
+    assert store.stats()["hits"] == 2
+
+
+def test_authorized_responses_are_not_stored() -> None:
+    store = ResponseCache(max_entries=10, max_bytes=1_000_000, ttl=60)
+    response = _client(store).get(
+        "/posts",
+        headers={"Accept-Encoding": "gzip", "Authorization": "Bearer x"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert store.stats()["entries"] == 0
@@ -0,0 +1,89 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import Request  # noqa: E402
+
+from src.curriculum.download import build_file_response, parse_range  # noqa: E402
+
+ENTRY = {
+    "file_name": "cv.pdf",
+    "content_type": "application/pdf",
+    "size_bytes": 1000,
+    "content_sha256": "ab" * 32,
+    "storage_backend": "local",
+    "storage_key": "ab" * 32,
+    "updated_at": datetime(2025, 10, 16, 12, 30, 5, 123456),
+}
+ETAG = f'"{"ab" * 32}"'
+
+
+def _request(**headers: str) -> Request:
+    raw = [
+        (name.replace("_", "-").encode(), value.encode())
+        for name, value in headers.items()
+    ]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-99", (0, 99)),
+        ("bytes=900-", (900, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=990-2000", (990, 999)),
+        ("bytes=0-1,5-9", None),
+        ("items=0-1", None),
+        ("bytes=abc", None),
+    ],
+)
+def test_parse_range(header: str | None, expected: tuple[int, int] | None) -> None:
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=10-5", "bytes=-0"])
+def test_parse_range_rejects_unsatisfiable(header: str) -> None:
+    with pytest.raises(ValueError):
+        parse_range(header, 1000)
+
+
+def test_matching_etag_short_circuits_to_304() -> None:
+    response = build_file_response(ENTRY, _request(if_none_match=f"W/{ETAG}"))
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == ETAG
+    assert response.headers["last-modified"] == "Thu, 16 Oct 2025 12:30:05 GMT"
+
+
+def test_if_modified_since_short_circuits_to_304() -> None:
+    request = _request(if_modified_since="Thu, 16 Oct 2025 12:30:05 GMT")
+
+    assert build_file_response(ENTRY, request).status_code == 304
+
+
+def test_range_request_returns_partial_content() -> None:
+    response = build_file_response(ENTRY, _request(range="bytes=100-199"))
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 100-199/1000"
+    assert response.headers["content-length"] == "100"
+
+
+def test_stale_if_range_returns_full_file() -> None:
+    request = _request(range="bytes=100-199", if_range='"stale"')
+    response = build_file_response(ENTRY, request)
+
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "1000"
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+def test_unsatisfiable_range_returns_416() -> None:
+    response = build_file_response(ENTRY, _request(range="bytes=5000-"))
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */1000"
@@ -0,0 +1,120 @@
+import hashlib
+
+import anyio
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from src.curriculum import router as curriculum_router  # noqa: E402
+from src.curriculum.storage import (  # noqa: E402
+    CHUNK_SIZE,
+    FileStorage,
+    FileTooLarge,
+    LocalFileStorage,
+)
+
+PAYLOAD = bytes(range(256)) * (CHUNK_SIZE // 128)
+
+
+async def _chunks(data: bytes, size: int = 1000):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+async def _read(storage: LocalFileStorage, key: str, **kwargs) -> bytes:
+    return b"".join([chunk async for chunk in storage.open(key, **kwargs)])
+
+
+def test_local_storage_is_content_addressed(tmp_path) -> None:
+    storage = LocalFileStorage(tmp_path)
+
+    async def scenario():
+        first = await storage.save(_chunks(PAYLOAD))
+        second = await storage.save_bytes(PAYLOAD)
+        return first, second, await _read(storage, first.key)
+
+    first, second, content = anyio.run(scenario)
+
+    assert first == second
+    assert first.size == len(PAYLOAD)
+    assert first.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+    assert content == PAYLOAD
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_local_storage_reads_byte_ranges(tmp_path) -> None:
+    storage = LocalFileStorage(tmp_path)
+
+    async def scenario():
+        stored = await storage.save_bytes(PAYLOAD)
+        return await _read(
+            storage, stored.key, start=CHUNK_SIZE - 10, end=CHUNK_SIZE + 9
+        )
+
+    assert anyio.run(scenario) == PAYLOAD[CHUNK_SIZE - 10 : CHUNK_SIZE + 10]
+
+
+def test_local_storage_enforces_max_size(tmp_path) -> None:
+    storage = LocalFileStorage(tmp_path)
+
+    with pytest.raises(FileTooLarge):
+        anyio.run(lambda: storage.save(_chunks(PAYLOAD), max_size=CHUNK_SIZE))
+
+    assert list((tmp_path / "tmp").iterdir()) == []
+
+
+def test_file_storage_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        FileStorage()
+
+
+def test_failed_insert_releases_the_stored_file(tmp_path, monkeypatch) -> None:
+    storage = LocalFileStorage(tmp_path)
+    released = []
+
+    async def fake_bump_version(table):
+        return 1
+
+    async def failing_fetch_one(query, connection=None, commit_after=False):
+        raise RuntimeError("insert failed")
+
+    async def fake_release(backend, key):
+        released.append((backend, key))
+
+    monkeypatch.setattr(curriculum_router, "bump_version", fake_bump_version)
+    monkeypatch.setattr(curriculum_router, "fetch_one", failing_fetch_one)
+    monkeypatch.setattr(curriculum_router, "release_stored_file", fake_release)
+
+    async def scenario():
+        stored = await storage.save_bytes(PAYLOAD)
+        with pytest.raises(RuntimeError):
+            await curriculum_router.insert_stored_entry(stored, title="t")
+        return stored
+
+    stored = anyio.run(scenario)
+
+    assert released == [(stored.backend, stored.key)]
+
+
+def test_update_of_a_deleted_entry_is_a_404(monkeypatch, admin_client) -> None:
+    statements = []
+
+    async def fake_bump_version(table):
+        return 2
+
+    async def fake_fetch_one(query, connection=None, commit_after=False):
+        statements.append(type(query).__name__)
+        return None
+
+    async def fake_write_returning(query, not_found, connection=None):
+        statements.append(type(query).__name__)
+        raise not_found
+
+    monkeypatch.setattr(curriculum_router, "bump_version", fake_bump_version)
+    monkeypatch.setattr(curriculum_router, "fetch_one", fake_fetch_one)
+    monkeypatch.setattr(curriculum_router, "write_returning", fake_write_returning)
+    response = admin_client.put("/curriculum/5", json={"title": "novo"})
+
+    assert response.status_code == 404
+    # Um único UPDATE ... RETURNING, sem SELECT antes
+    assert statements == ["Update"]
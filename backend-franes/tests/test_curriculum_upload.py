@@ -0,0 +1,107 @@
+import anyio
+import pytest
+
+pytest.importorskip("python_multipart")
+
+from src.curriculum.upload import InvalidUpload, MultipartUpload  # noqa: E402
+
+BOUNDARY = "franes-boundary"
+HEADERS = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+FILE_BYTES = bytes(range(256)) * 64
+
+
+def _body(*parts: tuple[str, str | None, bytes]) -> bytes:
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += (
+            f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+            + content
+            + b"\r\n"
+        )
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+async def _stream(data: bytes, size: int = 100):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+def _read(upload: MultipartUpload) -> tuple[bytes, list[bytes]]:
+    async def scenario():
+        return [chunk async for chunk in upload.file_chunks()]
+
+    chunks = anyio.run(scenario)
+    return b"".join(chunks), chunks
+
+
+def test_upload_streams_file_and_collects_fields() -> None:
+    body = _body(
+        ("title", None, "Currículo".encode()),
+        ("file", "cv.pdf", FILE_BYTES),
+        ("description", None, b"Atualizado"),
+    )
+    upload = MultipartUpload(HEADERS, _stream(body))
+
+    content, chunks = _read(upload)
+
+    assert content == FILE_BYTES
+    assert len(chunks) > 1
+    assert upload.file_name == "cv.pdf"
+    assert upload.fields == {"title": "Currículo", "description": "Atualizado"}
+
+
+def test_upload_requires_a_file_part() -> None:
+    upload = MultipartUpload(HEADERS, _stream(_body(("title", None, b"CV"))))
+
+    with pytest.raises(InvalidUpload):
+        _read(upload)
+
+
+def test_upload_rejects_oversized_fields() -> None:
+    body = _body(("title", None, b"x" * 10_000), ("file", "cv.pdf", b"%PDF"))
+    upload = MultipartUpload(HEADERS, _stream(body))
+
+    with pytest.raises(InvalidUpload):
+        _read(upload)
+
+
+def test_upload_rejects_non_multipart_requests() -> None:
+    with pytest.raises(InvalidUpload):
+        MultipartUpload({"content-type": "application/json"}, _stream(b"{}"))
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        # Boundary de abertura cortado: o parser acusa o erro
+        f"--{BOUNDARY[:-3]}\r\n".encode() + b"x" * 10,
+        # Boundary final cortado: o corpo acaba antes do fim
+        _body(("file", "cv.pdf", FILE_BYTES))[: -len(BOUNDARY)],
+    ],
+)
+def test_upload_rejects_truncated_boundaries(body: bytes) -> None:
+    upload = MultipartUpload(HEADERS, _stream(body))
+
+    with pytest.raises(InvalidUpload):
+        _read(upload)
+
+
+def test_upload_route_answers_malformed_bodies_with_400(
+    monkeypatch, tmp_path, admin_client
+) -> None:
+    from src.config import settings
+
+    monkeypatch.setattr(settings, "CURRICULUM_STORAGE_BACKEND", "local")
+    monkeypatch.setattr(settings, "CURRICULUM_STORAGE_PATH", str(tmp_path))
+
+    response = admin_client.post(
+        "/curriculum/upload",
+        content=f"--{BOUNDARY[:-3]}\r\n".encode(),
+        headers=HEADERS,
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Corpo multipart malformado."}
@@ -0,0 +1,148 @@
+from datetime import datetime, timezone
+
+import anyio
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from src import database  # noqa: E402
+from src.database import decode_cursor, encode_cursor  # noqa: E402
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2025, 10, 16, 12, 30, 5, 123456)
+
+    cursor = encode_cursor(created_at, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not-a-cursor",
+        encode_cursor(datetime(2025, 1, 1), 1)[:-3],
+        encode_cursor(datetime(2025, 1, 1, tzinfo=timezone.utc), 1),
+    ],
+)
+def test_decode_cursor_rejects_garbage(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+class FakeResult:
+    def __init__(self, row) -> None:
+        self.row = row
+
+    def first(self):
+        return self.row
+
+
+class FakeRow:
+    def _asdict(self) -> dict:
+        return {"id": 1}
+
+
+class WriteConnection:
+    def __init__(self, row) -> None:
+        self.row = row
+        self.calls: list[str] = []
+
+    async def execute(self, query):
+        self.calls.append("execute")
+        return FakeResult(self.row)
+
+    def in_transaction(self) -> bool:
+        return True
+
+    async def commit(self) -> None:
+        self.calls.append("commit")
+
+    async def rollback(self) -> None:
+        self.calls.append("rollback")
+
+
+async def _no_log(*args) -> None:
+    pass
+
+
+def _write_returning(monkeypatch, connection: WriteConnection):
+    monkeypatch.setattr(database.query_log, "record", _no_log)
+    lazy = database.LazyConnection()
+    lazy._connection = connection
+
+    async def scenario():
+        token = database._request_connection.set(lazy)
+        try:
+            return await database.write_returning(object(), LookupError("missing"))
+        finally:
+            database._request_connection.reset(token)
+
+    return anyio.run(scenario)
+
+
+def test_write_returning_rolls_back_when_nothing_matched(monkeypatch) -> None:
+    connection = WriteConnection(None)
+
+    with pytest.raises(LookupError):
+        _write_returning(monkeypatch, connection)
+
+    # Desfaz também o que veio antes no request, como o bump de versão
+    assert connection.calls == ["execute", "rollback"]
+
+
+def test_write_returning_commits_a_match(monkeypatch) -> None:
+    connection = WriteConnection(FakeRow())
+
+    assert _write_returning(monkeypatch, connection) == {"id": 1}
+    assert connection.calls == ["execute", "commit"]
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.executed = 0
+        self.closed = False
+
+    async def execute(self, query):
+        self.executed += 1
+        return query
+
+    def in_transaction(self) -> bool:
+        return False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeEngine:
+    def __init__(self) -> None:
+        self.checkouts: list[FakeConnection] = []
+
+    async def connect(self) -> FakeConnection:
+        self.checkouts.append(FakeConnection())
+        return self.checkouts[-1]
+
+
+def test_request_connection_is_checked_out_lazily_and_shared(monkeypatch) -> None:
+    engine = FakeEngine()
+    monkeypatch.setattr(database, "engine", engine)
+
+    async def scenario():
+        dependency = database.get_db_connection()
+        lazy = await dependency.__anext__()
+        assert engine.checkouts == []
+
+        for _ in range(3):
+            await database.execute("SELECT 1")
+        await dependency.aclose()
+        return lazy
+
+    lazy = anyio.run(scenario)
+
+    assert len(engine.checkouts) == 1
+    assert engine.checkouts[0].executed == 3
+    assert engine.checkouts[0].closed
+    assert not lazy.checked_out
+    assert database._request_connection.get() is None
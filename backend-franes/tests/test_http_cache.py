@@ -0,0 +1,208 @@
+from datetime import timedelta
+
+import anyio
+import httpx
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from fastapi import Depends, FastAPI, HTTPException, Response  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src import http_cache  # noqa: E402
+from src.auth.dependencies import create_access_token  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.http_cache import (  # noqa: E402
+    CachePolicy,
+    HttpCacheMiddleware,
+    etag_matches,
+    public_cache,
+    purge,
+)
+from src.timing import (  # noqa: E402
+    PROFILE_HEADER,
+    ServerTimingMiddleware,
+    profile_subject,
+)
+
+POLICY = CachePolicy(max_age=60, stale_while_revalidate=600)
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    # Mesma ordem do src.main: o cache HTTP envolve o Server-Timing
+    app.add_middleware(ServerTimingMiddleware)
+    app.add_middleware(HttpCacheMiddleware)
+
+    @app.get(
+        "/posts/{post_id}",
+        dependencies=[Depends(public_cache(POLICY, "blog", "blog/{post_id}"))],
+    )
+    async def read_post(post_id: int):
+        if post_id == 404:
+            raise HTTPException(status_code=404)
+        return {"id": post_id}
+
+    @app.get("/private")
+    async def private():
+        return {"id": 1}
+
+    @app.get(
+        "/download",
+        dependencies=[Depends(public_cache(POLICY, "curriculum/latest"))],
+    )
+    async def download():
+        async def chunks():
+            yield b"a,"
+            yield b"b\n"
+
+        return StreamingResponse(
+            chunks(), media_type="text/csv", headers={"ETag": '"sha"'}
+        )
+
+    @app.get("/stream", dependencies=[Depends(public_cache(POLICY))])
+    async def stream():
+        async def chunks():
+            yield b"a"
+            yield b"b"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/empty", dependencies=[Depends(public_cache(POLICY))])
+    async def empty():
+        return Response(status_code=304)
+
+    return TestClient(app)
+
+
+def test_cache_control(monkeypatch) -> None:
+    assert POLICY.cache_control() == (
+        "public, max-age=60, stale-while-revalidate=600"
+    )
+    assert CachePolicy(max_age=5).cache_control() == "public, max-age=5"
+
+    monkeypatch.setattr(settings, "HTTP_CACHE_EDGE_MODE", True)
+    monkeypatch.setattr(settings, "HTTP_CACHE_EDGE_MAX_AGE", 3600)
+    assert CachePolicy(max_age=5).cache_control() == (
+        "public, max-age=5, s-maxage=3600"
+    )
+
+
+def test_etag_matches_weakly() -> None:
+    assert etag_matches('W/"a"', 'W/"a"')
+    assert etag_matches('"b", "a"', 'W/"a"')
+    assert etag_matches("*", 'W/"a"')
+    assert not etag_matches('W/"b"', 'W/"a"')
+
+
+def test_public_route_gets_headers_and_weak_etag() -> None:
+    response = _client().get("/posts/7")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == POLICY.cache_control()
+    assert response.headers["surrogate-key"] == "blog blog/7"
+    assert response.headers["etag"].startswith('W/"')
+    assert response.json() == {"id": 7}
+
+
+def test_if_none_match_returns_304_without_body() -> None:
+    client = _client()
+    etag = client.get("/posts/7").headers["etag"]
+
+    response = client.get("/posts/7", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == POLICY.cache_control()
+    assert "content-type" not in response.headers
+
+    other = client.get("/posts/8", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+
+def test_unmarked_and_error_responses_are_untouched() -> None:
+    client = _client()
+
+    for path in ("/private", "/posts/404"):
+        response = client.get(path)
+        assert "cache-control" not in response.headers
+        assert "etag" not in response.headers
+
+
+def test_existing_etag_and_streams_pass_through() -> None:
+    client = _client()
+
+    download = client.get("/download")
+    assert download.headers["etag"] == '"sha"'
+    assert download.headers["surrogate-key"] == "curriculum/latest"
+    assert download.content == b"a,b\n"
+
+    stream = client.get("/stream")
+    assert "etag" not in stream.headers
+    assert stream.headers["cache-control"] == POLICY.cache_control()
+    assert stream.content == b"ab"
+
+    assert client.get("/empty").headers["cache-control"] == POLICY.cache_control()
+
+
+def test_profiled_public_route_is_not_cacheable(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "HTTP_CACHE_EDGE_MODE", True)
+    token = create_access_token(
+        subject=profile_subject(1), expires_delta=timedelta(minutes=1)
+    )
+
+    response = _client().get("/posts/7", headers={PROFILE_HEADER: token})
+
+    assert response.headers["x-profiled-status"] == "200"
+    assert response.headers["cache-control"] == "no-store, private"
+    assert "surrogate-key" not in response.headers
+    assert "etag" not in response.headers
+
+
+def test_disabled(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "HTTP_CACHE_ENABLED", False)
+
+    response = _client().get("/posts/7")
+
+    assert "cache-control" not in response.headers
+    assert "etag" not in response.headers
+
+
+def test_purge_is_a_noop_without_url() -> None:
+    async def main() -> None:
+        purge("blog/list")
+        assert not http_cache._pending_purges
+
+    anyio.run(main)
+
+
+def test_purge_posts_surrogate_keys(monkeypatch) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        http_cache.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=transport, **kwargs),
+    )
+    monkeypatch.setattr(settings, "HTTP_CACHE_PURGE_URL", "https://cdn.test/purge")
+    monkeypatch.setattr(settings, "HTTP_CACHE_PURGE_TOKEN", "secret")
+
+    async def main() -> None:
+        purge("blog/list", "blog/3", "blog/list")
+        await anyio.wait_all_tasks_blocked()
+        while http_cache._pending_purges:
+            await anyio.sleep(0)
+
+    anyio.run(main)
+
+    assert len(requests) == 1
+    assert requests[0].headers["surrogate-key"] == "blog/list blog/3"
+    assert requests[0].headers["authorization"] == "Bearer secret"
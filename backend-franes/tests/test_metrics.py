@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src import metrics  # noqa: E402
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        metrics.PrometheusMiddleware, pool_gauges=lambda: {"checked_out": 3}
+    )
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        with metrics.db_timer("fetch_one"):
+            pass
+        return {"id": item_id}
+
+    @app.get(metrics.METRICS_PATH)
+    async def read_metrics():
+        return metrics.render()
+
+    return app
+
+
+def test_metrics_are_labelled_by_route_template(monkeypatch) -> None:
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    client = TestClient(_app())
+
+    client.get("/items/1")
+    client.get("/items/2")
+    body = client.get(metrics.METRICS_PATH).text
+
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/items/{item_id}",status="200"}'
+    ) in body
+    assert "/items/1" not in body
+    assert 'db_query_duration_seconds_count{helper="fetch_one"}' in body
+    assert 'db_pool_connections{state="checked_out"} 3.0' in body
+    assert 'http_requests_in_progress{method="GET"} 0.0' in body
@@ -0,0 +1,85 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.pool import QueuePool  # noqa: E402
+
+from src import metrics  # noqa: E402
+from src.pool_metrics import PoolMetrics  # noqa: E402
+
+
+def test_histogram_snapshot_is_cumulative() -> None:
+    pytest.importorskip("prometheus_client")
+    from prometheus_client import CollectorRegistry, Histogram
+
+    histogram = Histogram(
+        "test_seconds", "Teste.", buckets=(0.1, 1), registry=CollectorRegistry()
+    )
+    for value in (0.05, 0.5, 0.7, 3):
+        histogram.observe(value)
+
+    snapshot = metrics.histogram_snapshot(histogram)
+
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(4.25)
+
+
+def _lifetime_count(pool_metrics: PoolMetrics) -> int:
+    return pool_metrics.snapshot().get("lifetime_seconds", {}).get("count", 0)
+
+
+def _event_counts() -> dict[str, float]:
+    if not metrics.enabled():
+        return {}
+    from prometheus_client import REGISTRY
+
+    return {
+        event: REGISTRY.get_sample_value(
+            "db_pool_connection_events_total", {"event": event}
+        )
+        or 0
+        for event in ("opened", "closed", "invalidated")
+    }
+
+
+def test_checkout_latency_is_exported_to_prometheus() -> None:
+    pytest.importorskip("prometheus_client")
+    from prometheus_client import generate_latest
+
+    PoolMetrics(recycle_seconds=0).observe_checkout(0.003)
+
+    assert b"db_pool_checkout_duration_seconds_bucket" in generate_latest()
+
+
+def test_pool_metrics_track_connections_and_gauges() -> None:
+    engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=1
+    )
+    pool_metrics = PoolMetrics(recycle_seconds=0)
+    pool_metrics.install(engine.pool)
+    lifetimes = _lifetime_count(pool_metrics)
+    events = _event_counts()
+
+    first = engine.connect()
+    second = engine.connect()
+    first.execute(text("SELECT 1"))
+    busy = pool_metrics.gauges()
+    first.invalidate()
+    first.close()
+    second.close()
+    engine.dispose()
+
+    assert busy == {"size": 1, "checked_out": 2, "idle": 0, "overflow": 1}
+    assert pool_metrics.opened == 2
+    assert pool_metrics.invalidated == 1
+    assert pool_metrics.closed == 2
+    if metrics.enabled():
+        assert _lifetime_count(pool_metrics) == lifetimes + 2
+        after = _event_counts()
+        assert {event: after[event] - events[event] for event in after} == {
+            "opened": 2,
+            "closed": 2,
+            "invalidated": 1,
+        }
@@ -0,0 +1,91 @@
+import logging
+from types import SimpleNamespace
+
+import anyio
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from src.config import settings  # noqa: E402
+from src.query_log import QueryLog, current_route, fingerprint, redact  # noqa: E402
+
+SELECT = "SELECT blog_posts.id FROM blog_posts\n WHERE blog_posts.id = $1::INTEGER"
+
+
+def _result(statement: str, parameters: tuple, rowcount: int = 1) -> SimpleNamespace:
+    context = SimpleNamespace(statement=statement, parameters=[parameters])
+    return SimpleNamespace(context=context, rowcount=rowcount)
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.explained: list[tuple[str, tuple]] = []
+
+    def begin_nested(self) -> "FakeConnection":
+        return self
+
+    async def __aenter__(self) -> "FakeConnection":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def exec_driver_sql(self, statement: str, parameters: tuple) -> list:
+        self.explained.append((statement, parameters))
+        return [("Index Scan using blog_posts_pkey",)]
+
+
+def test_fingerprint_ignores_whitespace() -> None:
+    assert fingerprint(SELECT) == fingerprint(" ".join(SELECT.split()))
+    assert fingerprint(SELECT) != fingerprint("SELECT 1")
+
+
+def test_redact_never_includes_values() -> None:
+    assert redact(("secret", 42)) == "str, int"
+    assert redact({"password": "secret"}) == "password=str"
+
+
+def test_record_aggregates_by_fingerprint(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "DATABASE_SLOW_QUERY_MS", 10_000)
+    log = QueryLog()
+    token = current_route.set("/blog/{post_id}")
+    try:
+        anyio.run(log.record, _result(SELECT, (1,)), 0.002, FakeConnection())
+        anyio.run(log.record, _result(SELECT, (2,), 0), 0.004, FakeConnection())
+    finally:
+        current_route.reset(token)
+
+    [stats] = log.snapshot()
+    assert stats["fingerprint"] == fingerprint(SELECT)
+    assert stats["count"] == 2
+    assert stats["rows"] == 1
+    assert stats["max_ms"] == pytest.approx(4)
+    assert stats["slow"] == 0
+    assert stats["last_route"] == "/blog/{post_id}"
+
+
+def test_slow_query_is_logged_without_values(monkeypatch, caplog) -> None:
+    monkeypatch.setattr(settings, "DATABASE_SLOW_QUERY_MS", 1)
+    monkeypatch.setattr(settings, "DATABASE_EXPLAIN_SLOW_QUERIES", False)
+    log = QueryLog()
+
+    with caplog.at_level(logging.WARNING, logger="src.query_log"):
+        anyio.run(log.record, _result(SELECT, ("hunter2",)), 0.5, FakeConnection())
+
+    assert "slow query" in caplog.text
+    assert "params=[str]" in caplog.text
+    assert "hunter2" not in caplog.text
+    assert log.snapshot()[0]["slow"] == 1
+
+
+def test_explain_runs_once_per_fingerprint_for_selects(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "DATABASE_SLOW_QUERY_MS", 1)
+    monkeypatch.setattr(settings, "DATABASE_EXPLAIN_SLOW_QUERIES", True)
+    log = QueryLog()
+    connection = FakeConnection()
+
+    update = _result("UPDATE blog_posts SET title=$1", ("x",))
+    for result in (_result(SELECT, (1,)), _result(SELECT, (1,)), update):
+        anyio.run(log.record, result, 0.5, connection)
+
+    assert connection.explained == [(f"EXPLAIN (ANALYZE, BUFFERS) {SELECT}", (1,))]
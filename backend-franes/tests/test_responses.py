@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import orjson
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import Response  # noqa: E402
+
+from src.blog.schemas import BlogPostSummary  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.responses import trusted_rows  # noqa: E402
+
+ROW = {
+    "id": 1,
+    "title": "Primeiro post",
+    "reading_time": 3,
+    "content": "não deve sair no resumo",
+    "created_at": datetime(2025, 10, 16, 12, 30, 5),
+}
+
+
+def test_trusted_rows_projects_model_fields() -> None:
+    response = trusted_rows(BlogPostSummary, [ROW])
+
+    assert orjson.loads(response.body) == [
+        {
+            "id": 1,
+            "title": "Primeiro post",
+            "reading_time": 3,
+            "created_at": "2025-10-16T12:30:05",
+        }
+    ]
+
+
+def test_trusted_rows_keeps_headers_from_the_injected_response() -> None:
+    sub_response = Response()
+    sub_response.headers["X-Next-Cursor"] = "abc"
+
+    response = trusted_rows(BlogPostSummary, ROW, sub_response)
+
+    assert response.headers["x-next-cursor"] == "abc"
+    assert orjson.loads(response.body)["id"] == 1
+
+
+def test_trusted_rows_can_fall_back_to_validation(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "RESPONSE_TRUSTED_ROWS", False)
+
+    assert trusted_rows(BlogPostSummary, [ROW]) == [ROW]
@@ -0,0 +1,92 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.blog.models import COLUMNS  # noqa: E402
+from src.search import router as search_router  # noqa: E402
+from src.search.router import (  # noqa: E402
+    decode_search_cursor,
+    encode_search_cursor,
+    highlight,
+    search_query,
+)
+from src.search.schemas import SearchKind  # noqa: E402
+
+
+def test_search_cursor_round_trip() -> None:
+    cursor = encode_search_cursor(0.0607927, "blog", 42)
+
+    assert decode_search_cursor(cursor) == (0.0607927, "blog", 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["nope", encode_search_cursor(0.1, "unknown", 1), "WzAuMSwiYmxvZyIsdHJ1ZV0"],
+)
+def test_invalid_search_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_search_cursor(cursor)
+
+
+def test_highlight_escapes_content_but_keeps_marks() -> None:
+    snippet = "<script>x</script> um \x02gato\x03 & outro"
+
+    assert highlight(snippet) == (
+        "&lt;script&gt;x&lt;/script&gt; um <mark>gato</mark> &amp; outro"
+    )
+
+
+def test_search_query_filters_by_index_and_headlines_only_the_page(compile_sql) -> None:
+    sql = compile_sql(search_query("gato", list(SearchKind), limit=10))
+
+    assert sql.count("search_vector @@ websearch_to_tsquery") == 2
+    assert "UNION ALL" in sql
+    # ts_headline fica fora da subconsulta com LIMIT
+    assert sql.index("ts_headline") < sql.index("LIMIT")
+    assert sql.count("ts_headline(") == 1
+
+
+def test_search_query_single_kind_and_keyset(compile_sql) -> None:
+    after = encode_search_cursor(0.5, "story_script", 7)
+    sql = compile_sql(search_query("gato", [SearchKind.STORY_SCRIPT], 10, after))
+
+    assert "UNION" not in sql
+    assert "blog_posts" not in sql
+    assert "(matches.rank, matches.kind, matches.id) <" in sql
+
+
+def test_public_columns_skip_search_vector() -> None:
+    assert "search_vector" not in {column.name for column in COLUMNS}
+
+
+def test_search_endpoint_pages_and_highlights(monkeypatch) -> None:
+    from src.main import app
+
+    rows = [
+        {
+            "kind": "blog",
+            "id": row_id,
+            "title": f"Post {row_id}",
+            "created_at": datetime(2025, 10, 16),
+            "rank": rank,
+            "snippet": "o \x02gato\x03 <b>",
+        }
+        for row_id, rank in ((3, 0.9), (2, 0.5), (1, 0.1))
+    ]
+
+    async def fake_fetch_all(query, connection=None):
+        return [dict(row) for row in rows]
+
+    monkeypatch.setattr(search_router, "fetch_all", fake_fetch_all)
+    response = TestClient(app).get("/search/", params={"q": "gato", "limit": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body] == [3, 2]
+    assert body[0]["snippet"] == "o <mark>gato</mark> &lt;b&gt;"
+    cursor = response.headers["x-next-cursor"]
+    assert decode_search_cursor(cursor) == (0.5, "blog", 2)
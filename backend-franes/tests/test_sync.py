@@ -0,0 +1,211 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.blog.models import blog_posts  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.sync import router as sync_router  # noqa: E402
+from src.sync.router import (  # noqa: E402
+    SOURCES,
+    changes_query,
+    decode_sync_cursor,
+    deletions_query,
+    encode_sync_cursor,
+)
+
+BLOG = next(source for source in SOURCES if source.table is blog_posts)
+NOW = datetime(2026, 10, 17)
+
+
+@pytest.fixture
+def literal_sql(compile_sql):
+    return lambda query: compile_sql(query, literal_binds=True)
+
+
+def test_sync_cursor_round_trip() -> None:
+    versions = {"blog_posts": 4, "art": 0, "story_script": (3, 12)}
+
+    assert decode_sync_cursor(encode_sync_cursor(versions)) == versions
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        encode_sync_cursor({"users": 1}),
+        encode_sync_cursor({"blog_posts": "1"}),
+        encode_sync_cursor({"blog_posts": True}),
+        encode_sync_cursor({"blog_posts": [1]}),
+    ],
+)
+def test_invalid_sync_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_sync_cursor(cursor)
+
+
+def test_changes_query_bounds_by_version(literal_sql) -> None:
+    sql = literal_sql(changes_query(BLOG, 3, 7))
+
+    assert "blog_posts.version <= 7 AND blog_posts.version > 3" in sql
+    assert sql.endswith("ORDER BY blog_posts.version, blog_posts.id")
+    assert "search_vector" not in sql
+    assert "blog_posts.version >" not in literal_sql(changes_query(BLOG, None, 7))
+
+
+def test_changes_query_pages_on_version_and_id(literal_sql) -> None:
+    sql = literal_sql(changes_query(BLOG, (3, 12), 7, limit=50))
+
+    assert "(blog_posts.version, blog_posts.id) > (3, 12)" in sql
+    assert sql.endswith("ORDER BY blog_posts.version, blog_posts.id LIMIT 51")
+
+
+def test_deletions_query_reads_one_table(literal_sql) -> None:
+    sql = literal_sql(deletions_query(blog_posts, 3, 7))
+
+    assert "content_deletions.table_name = 'blog_posts'" in sql
+    assert "content_deletions.version > 3" in sql
+    assert "content_deletions.version <= 7" in sql
+
+
+def _fake_fetch_all(queries: list[str], literal_sql):
+    async def fake_fetch_all(query, connection=None):
+        sql = literal_sql(query)
+        queries.append(sql)
+        if "FROM content_versions" in sql:
+            return [{"table_name": "blog_posts", "version": 7}]
+        if "FROM content_deletions" in sql:
+            return [{"row_id": 2}]
+        if "FROM blog_posts" in sql:
+            return [
+                {
+                    "id": 5,
+                    "title": "Novo",
+                    "reading_time": 3,
+                    "content": "texto",
+                    "created_at": NOW,
+                    "updated_at": NOW,
+                    "version": 7,
+                }
+            ]
+        return []
+
+    return fake_fetch_all
+
+
+def test_sync_returns_only_tables_with_new_writes(monkeypatch, literal_sql) -> None:
+    from src.main import app
+
+    queries: list[str] = []
+    monkeypatch.setattr(sync_router, "fetch_all", _fake_fetch_all(queries, literal_sql))
+    since = encode_sync_cursor(
+        {"art": 0, "blog_posts": 3, "curriculum_files": 0, "story_script": 0}
+    )
+
+    response = TestClient(app).get("/sync/", params={"since": since})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["has_more"] is False
+    assert body["versions"]["blog_posts"] == 7
+    assert decode_sync_cursor(body["cursor"]) == body["versions"]
+    assert [row["id"] for row in body["changed"]["blog_posts"]] == [5]
+    assert "version" not in body["changed"]["blog_posts"][0]
+    assert body["deleted"] == {
+        "art": [],
+        "blog_posts": [2],
+        "curriculum_files": [],
+        "story_script": [],
+    }
+    # content_versions, as linhas novas do blog e os tombstones do blog
+    assert len(queries) == 3
+
+
+def test_sync_without_cursor_returns_everything(monkeypatch, literal_sql) -> None:
+    from src.main import app
+
+    queries: list[str] = []
+    monkeypatch.setattr(sync_router, "fetch_all", _fake_fetch_all(queries, literal_sql))
+
+    body = TestClient(app).get("/sync/").json()
+
+    assert [row["id"] for row in body["changed"]["blog_posts"]] == [5]
+    assert body["deleted"]["blog_posts"] == []
+    assert not any("content_deletions" in sql for sql in queries)
+
+
+def test_sync_rejects_cursor_ahead_of_the_database(monkeypatch, literal_sql) -> None:
+    from src.main import app
+
+    monkeypatch.setattr(sync_router, "fetch_all", _fake_fetch_all([], literal_sql))
+    since = encode_sync_cursor({"blog_posts": 8})
+
+    response = TestClient(app).get("/sync/", params={"since": since})
+
+    assert response.status_code == 400
+
+
+def test_sync_stops_at_the_limit_and_resumes_from_the_cursor(
+    monkeypatch, literal_sql
+) -> None:
+    from src.main import app
+
+    queries: list[str] = []
+
+    async def fake_fetch_all(query, connection=None):
+        sql = literal_sql(query)
+        queries.append(sql)
+        if "FROM content_versions" in sql:
+            return [{"table_name": "blog_posts", "version": 7}]
+        if "FROM blog_posts" not in sql:
+            return []
+        rows = [
+            {
+                "id": row_id,
+                "title": "t",
+                "reading_time": 1,
+                "content": "c",
+                "created_at": NOW,
+                "updated_at": NOW,
+                "version": version,
+            }
+            for version, row_id in ((5, 3), (5, 4), (7, 1))
+        ]
+        if "(blog_posts.version, blog_posts.id) > (5, 4)" in sql:
+            rows = rows[2:]
+        return rows[: int(sql.rsplit("LIMIT ", 1)[1])]
+
+    monkeypatch.setattr(sync_router, "fetch_all", fake_fetch_all)
+    since = encode_sync_cursor(
+        {"art": 0, "blog_posts": 3, "curriculum_files": 0, "story_script": 0}
+    )
+    client = TestClient(app)
+
+    first = client.get("/sync/", params={"since": since, "limit": 2}).json()
+
+    assert first["has_more"] is True
+    assert [row["id"] for row in first["changed"]["blog_posts"]] == [3, 4]
+    assert decode_sync_cursor(first["cursor"])["blog_posts"] == (5, 4)
+    # Tombstones só até a versão entregue
+    assert any("content_deletions.version <= 5" in sql for sql in queries)
+
+    second = client.get("/sync/", params={"since": first["cursor"], "limit": 2}).json()
+
+    assert second["has_more"] is False
+    assert [row["id"] for row in second["changed"]["blog_posts"]] == [1]
+    assert decode_sync_cursor(second["cursor"]) == second["versions"]
+
+
+def test_sync_limit_is_capped(monkeypatch, literal_sql) -> None:
+    from src.main import app
+
+    monkeypatch.setattr(sync_router, "fetch_all", _fake_fetch_all([], literal_sql))
+
+    response = TestClient(app).get(
+        "/sync/", params={"limit": settings.SYNC_MAX_LIMIT + 1}
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,87 @@
+import marshal
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("jose")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from src.auth.dependencies import create_access_token  # noqa: E402
+from src.timing import (  # noqa: E402
+    PROFILE_HEADER,
+    ServerTimingMiddleware,
+    TimedRoute,
+    format_server_timing,
+    phase,
+    profile_subject,
+)
+
+
+class Item(BaseModel):
+    id: int
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+    app.router.route_class = TimedRoute
+
+    @app.get("/items/{item_id}", response_model=Item)
+    async def read_item(item_id: int):
+        with phase("db"):
+            pass
+        return {"id": item_id}
+
+    return app
+
+
+def _timings(header: str) -> dict[str, float]:
+    entries = (entry.split(";dur=") for entry in header.split(", "))
+    return {name: float(duration) for name, duration in entries}
+
+
+def test_format_server_timing_keeps_fixed_phases() -> None:
+    header = format_server_timing({"total": 0.0123, "db": 0.004})
+
+    assert header == (
+        "db;dur=4.000, validate;dur=0.000, serialize;dur=0.000, total;dur=12.300"
+    )
+
+
+def test_phase_outside_a_request_is_a_no_op() -> None:
+    with phase("db"):
+        pass
+
+
+def test_every_response_carries_server_timing() -> None:
+    response = TestClient(_app()).get("/items/1")
+
+    timings = _timings(response.headers["server-timing"])
+    assert list(timings) == ["db", "validate", "serialize", "total"]
+    assert timings["validate"] > 0
+    assert timings["total"] >= timings["db"] + timings["validate"]
+
+
+def test_profile_token_returns_pstats_dump() -> None:
+    token = create_access_token(
+        subject=profile_subject(1), expires_delta=timedelta(minutes=1)
+    )
+
+    response = TestClient(_app()).get("/items/1", headers={PROFILE_HEADER: token})
+
+    assert response.headers["x-profiled-status"] == "200"
+    assert "attachment" in response.headers["content-disposition"]
+    assert response.headers["cache-control"] == "no-store, private"
+    stats = marshal.loads(response.content)
+    assert any(function == "read_item" for _, _, function in stats)
+
+
+def test_admin_token_is_not_a_profile_token() -> None:
+    token = create_access_token(subject="1")
+
+    response = TestClient(_app()).get("/items/1", headers={PROFILE_HEADER: token})
+
+    assert response.status_code == 403
@@ -0,0 +1,152 @@
+import os
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from src.blog import router as blog_router  # noqa: E402
+from src.blog.models import blog_posts  # noqa: E402
+from src.database import metadata  # noqa: E402
+from src.versions import router as versions_router  # noqa: E402
+from src.versions.router import bump_version_statement  # noqa: E402
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+def test_bump_statement_upserts_and_returns_the_version(compile_sql) -> None:
+    sql = compile_sql(bump_version_statement(blog_posts))
+
+    assert sql.startswith("INSERT INTO content_versions (table_name, version)")
+    assert "ON CONFLICT (table_name) DO UPDATE SET" in sql
+    assert "version = (content_versions.version + %(version_1)s" in sql
+    assert sql.endswith("RETURNING content_versions.version")
+
+
+def test_versions_endpoint_defaults_unwritten_tables_to_zero(monkeypatch) -> None:
+    from src.main import app
+
+    async def fake_fetch_all(query, connection=None):
+        return [{"table_name": "blog_posts", "version": 7}]
+
+    monkeypatch.setattr(versions_router, "fetch_all", fake_fetch_all)
+    response = TestClient(app).get("/versions/")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "art": 0,
+        "blog_posts": 7,
+        "curriculum_files": 0,
+        "story_script": 0,
+    }
+
+
+def test_blog_writes_bump_the_version_first(monkeypatch, admin_client) -> None:
+    statements = []
+
+    async def fake_fetch_one(query, connection=None, commit_after=False):
+        statements.append((query.table.name, commit_after))
+        if query.table.name == "content_versions":
+            return {"version": 3}
+        assert query.compile().params["version"] == 3
+        return {
+            "id": 1,
+            "title": "t",
+            "reading_time": 1,
+            "content": "c",
+            "created_at": datetime(2026, 10, 17),
+            "updated_at": datetime(2026, 10, 17),
+        }
+
+    monkeypatch.setattr(versions_router, "fetch_one", fake_fetch_one)
+    monkeypatch.setattr(blog_router, "fetch_one", fake_fetch_one)
+    response = admin_client.post(
+        "/blog/", json={"title": "t", "reading_time": 1, "content": "c"}
+    )
+
+    assert response.status_code == 201
+    assert statements == [("content_versions", False), ("blog_posts", True)]
+
+
+def _fake_blog_deletes(monkeypatch, existing: set[int]) -> list:
+    """Apaga ids de ``existing`` uma vez só, como o banco faria."""
+    statements = []
+
+    async def fake_fetch_one(query, connection=None, commit_after=False):
+        statements.append((query.table.name, commit_after))
+        if query.table.name == "content_versions":
+            return {"version": 4}
+        row_id = query.compile().params["id_1"]
+        if row_id not in existing:
+            return None
+        existing.discard(row_id)
+        return {"id": row_id}
+
+    async def fake_execute(query, connection=None, commit_after=False):
+        statements.append((query.table.name, commit_after))
+        assert query.compile().params == {
+            "table_name": "blog_posts",
+            "row_id": 9,
+            "version": 4,
+        }
+
+    monkeypatch.setattr(versions_router, "fetch_one", fake_fetch_one)
+    monkeypatch.setattr(versions_router, "execute", fake_execute)
+    monkeypatch.setattr(blog_router, "fetch_one", fake_fetch_one)
+    return statements
+
+
+def test_blog_delete_records_a_tombstone(monkeypatch, admin_client) -> None:
+    statements = _fake_blog_deletes(monkeypatch, {9})
+
+    response = admin_client.delete("/blog/9")
+
+    assert response.status_code == 204
+    # O DELETE vem primeiro; versão e tombstone só depois de achar a linha
+    assert statements == [
+        ("blog_posts", False),
+        ("content_versions", False),
+        ("content_deletions", True),
+    ]
+
+
+def test_blog_delete_of_a_missing_id_writes_nothing(monkeypatch, admin_client) -> None:
+    statements = _fake_blog_deletes(monkeypatch, set())
+
+    response = admin_client.delete("/blog/9")
+
+    assert response.status_code == 404
+    assert statements == [("blog_posts", False)]
+
+
+def test_blog_delete_twice_is_a_404(monkeypatch, admin_client) -> None:
+    statements = _fake_blog_deletes(monkeypatch, {9})
+
+    first = admin_client.delete("/blog/9")
+    second = admin_client.delete("/blog/9")
+
+    assert (first.status_code, second.status_code) == (204, 404)
+    # Um só tombstone: a segunda chamada não tenta gravar outro
+    assert statements.count(("content_deletions", True)) == 1
+
+
+@pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (Postgres) não definido"
+)
+def test_bump_increments_per_table() -> None:
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        connection.execute(text("CREATE SCHEMA version_checks"))
+        connection.execute(text("SET LOCAL search_path TO version_checks"))
+        metadata.create_all(connection)
+        try:
+            bump = bump_version_statement(blog_posts)
+            assert connection.execute(bump).scalar() == 1
+            assert connection.execute(bump).scalar() == 2
+        finally:
+            transaction.rollback()
+    engine.dispose()
@@ -69,10 +69,10 @@ export class ApiError extends Error {
   }
 }
 
-async function apiRequest<T>(
+async function sendRequest(
   path: string,
   { method = "GET", token, headers, body }: RequestOptions = {},
-): Promise<T> {
+): Promise<Response> {
   const requestHeaders: HeadersInit = {
     Accept: "application/json",
     ...(headers ?? {}),
@@ -114,6 +114,15 @@ async function apiRequest<T>(
     throw new ApiError(response.status, message)
   }
 
+  return response
+}
+
+async function apiRequest<T>(
+  path: string,
+  options: RequestOptions = {},
+): Promise<T> {
+  const response = await sendRequest(path, options)
+
   if (response.status === 204) {
     return null as T
   }
@@ -121,6 +130,28 @@ async function apiRequest<T>(
   return (await response.json()) as T
 }
 
+// As listagens da API são paginadas: cada página traz no header
+// X-Next-Cursor o cursor da seguinte, até a última.
+const NEXT_CURSOR_HEADER = "X-Next-Cursor"
+const LIST_PAGE_LIMIT = 100
+
+async function apiRequestAllPages<T>(path: string): Promise<T[]> {
+  const items: T[] = []
+  let after: string | null = null
+
+  do {
+    const params = new URLSearchParams({ limit: String(LIST_PAGE_LIMIT) })
+    if (after) {
+      params.set("after", after)
+    }
+    const response = await sendRequest(`${path}?${params}`)
+    items.push(...((await response.json()) as T[]))
+    after = response.headers.get(NEXT_CURSOR_HEADER)
+  } while (after)
+
+  return items
+}
+
 export type BlogPost = {
   id: number
   title: string
@@ -223,15 +254,15 @@ export async function loginAdmin(
 }
 
 export async function fetchBlogPosts(): Promise<BlogPost[]> {
-  return apiRequest<BlogPost[]>("/blog/")
+  return apiRequestAllPages<BlogPost>("/blog/")
 }
 
 export async function fetchArtworks(): Promise<ArtRecord[]> {
-  return apiRequest<ArtRecord[]>("/art/")
+  return apiRequestAllPages<ArtRecord>("/art/")
 }
 
 export async function fetchStoryScripts(): Promise<StoryScriptRecord[]> {
-  return apiRequest<StoryScriptRecord[]>("/story-script/")
+  return apiRequestAllPages<StoryScriptRecord>("/story-script/")
 }
 
 export async function fetchLatestCurriculum(): Promise<CurriculumRecord> {
@@ -239,7 +270,7 @@ export async function fetchLatestCurriculum(): Promise<CurriculumRecord> {
 }
 
 export async function fetchCurriculumEntries(): Promise<CurriculumRecord[]> {
-  return apiRequest<CurriculumRecord[]>("/curriculum/")
+  return apiRequestAllPages<CurriculumRecord>("/curriculum/")
 }
 
 export async function createBlogPost(